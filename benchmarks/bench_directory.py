@@ -0,0 +1,69 @@
+"""Measure directory lookups per rerun: direct vs pooled and cached client.
+
+Each simulated rerun looks up the signed-in user and their groups, as demo
+authentication does. The directory answers after a fixed latency.
+
+Usage:
+    python benchmarks/bench_directory.py [latency_ms] [users] [reruns]
+"""
+
+import sys
+import time
+
+import common  # noqa: F401  (puts src on the import path)
+
+from services.directory import CachedDirectory, DirectoryConnectionPool
+from services.mock_ldap import MockLDAPService
+
+EMAILS = (
+    "alice@company.com",
+    "bob@company.com",
+    "charlie@company.com",
+    "nobody@company.com",
+)
+
+
+def run(client: MockLDAPService | CachedDirectory, users: int, reruns: int) -> float:
+    """Run reruns for users sessions and return the seconds per rerun."""
+    start = time.perf_counter()
+    for rerun in range(reruns):
+        email = EMAILS[rerun % min(users, len(EMAILS))]
+        client.lookup_user(email)
+        client.get_user_groups(email)
+    return (time.perf_counter() - start) / reruns
+
+
+def measure(latency_ms: float, users: int, reruns: int) -> None:
+    """Compare both clients at a directory latency."""
+    latency = latency_ms / 1000
+    direct = MockLDAPService(latency=latency)
+    direct_s = run(direct, users, reruns)
+
+    connections: list[MockLDAPService] = []
+
+    def connect() -> MockLDAPService:
+        connections.append(MockLDAPService(latency=latency))
+        return connections[-1]
+
+    cached = CachedDirectory(DirectoryConnectionPool(connect))
+    cached_s = run(cached, users, reruns)
+    cached_calls = sum(connection.calls for connection in connections)
+
+    print(
+        f"{latency_ms:>5.0f} ms latency, {reruns} reruns: "
+        f"direct {direct_s * 1e3:7.2f} ms/rerun ({direct.calls} calls)  "
+        f"cached {cached_s * 1e3:7.3f} ms/rerun ({cached_calls} calls, "
+        f"{len(connections)} opened)"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    latency_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+    users = int(sys.argv[2]) if len(sys.argv) > 2 else len(EMAILS)
+    reruns = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    measure(latency_ms, users, reruns)
+
+
+if __name__ == "__main__":
+    main()
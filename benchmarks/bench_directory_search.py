@@ -0,0 +1,71 @@
+"""Measure directory search for the user picker: linear scan vs prefix index.
+
+Usage:
+    python benchmarks/bench_directory_search.py [people ...]
+"""
+
+import sys
+import time
+import timeit
+
+import common  # noqa: F401  (puts src on the import path)
+
+from services.directory_search import DirectorySearchIndex
+from services.mock_ldap import LDAPUser, generate_directory
+
+# Queries as typed into the picker, from one letter to a full name
+QUERIES = ("a", "ch", "chen", "maya pat", "grace.kim1", "zz")
+
+# Results shown by the picker
+LIMIT = 10
+
+
+def scan_search(users: list[LDAPUser], query: str) -> list[LDAPUser]:
+    """The search before the index: lower-case and test every user."""
+    query_lower = query.lower()
+    return [
+        user
+        for user in users
+        if query_lower in user.email.lower() or query_lower in user.display_name.lower()
+    ]
+
+
+def measure(count: int) -> None:
+    """Compare both searches over a directory of count people."""
+    users = generate_directory(count)
+    start = time.perf_counter()
+    index = DirectorySearchIndex((user.email, user.display_name) for user in users)
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    start = time.perf_counter()
+    for user in users[:100]:
+        index.add(user.email, user.display_name + " Jr")
+    update_us = (time.perf_counter() - start) / 100 * 1e6
+
+    print(f"{count:>7} people: build {build_ms:7.1f} ms  update {update_us:6.1f} us")
+    for query in QUERIES:
+        number = 10 if count > 10_000 else 100
+        scan = min(
+            timeit.repeat(
+                lambda q=query: scan_search(users, q), number=number, repeat=3
+            )
+        )
+        indexed = min(
+            timeit.repeat(lambda q=query: index.search(q, LIMIT), number=1000, repeat=3)
+        )
+        print(
+            f"    {query!r:14} scan {scan / number * 1e3:8.2f} ms  "
+            f"indexed {indexed / 1000 * 1e3:6.3f} ms  "
+            f"({len(index.search(query))} matches)"
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 100_000]
+    for count in sizes:
+        measure(count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Measure job list codec throughput against pickle.
+
+Usage:
+    python benchmarks/bench_job_codec.py [jobs]
+"""
+
+import pickle
+import sys
+import timeit
+from collections.abc import Callable
+
+from common import build_jobs
+
+from services.dashboard import calculate_statistics
+from services.job_codec import EncodedJobList, decode_jobs, encode_jobs
+
+
+def bench(label: str, func: Callable[[], object], count: int, repeat: int = 5) -> None:
+    """Print best-of-N time and throughput of a callable."""
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    print(f"{label:<32} {best * 1000:8.2f} ms  {count / best:12,.0f} jobs/s")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    jobs = build_jobs(count)
+    pickled = pickle.dumps(jobs)
+    encoded = encode_jobs(jobs)
+    print(f"{count} jobs: pickle {len(pickled):,} bytes, codec {len(encoded):,} bytes")
+
+    bench("pickle.dumps", lambda: pickle.dumps(jobs), count)
+    bench("encode_jobs", lambda: encode_jobs(jobs), count)
+    bench("pickle.loads", lambda: pickle.loads(pickled), count)
+    bench("decode_jobs", lambda: decode_jobs(encoded), count)
+    bench(
+        "statistics via pickle.loads",
+        lambda: calculate_statistics(pickle.loads(pickled)),
+        count,
+    )
+    bench(
+        "statistics via lazy decode",
+        lambda: calculate_statistics(EncodedJobList(encoded)),
+        count,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Measure grouping a job list and splitting orderings into groups.
+
+Usage:
+    python benchmarks/bench_job_groups.py [jobs] [folders]
+"""
+
+import sys
+import timeit
+
+from common import build_jobs
+
+from services.job_groups import group_jobs
+from services.job_query import build_job_columns
+from services.job_view import build_sort_keys, order_jobs
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    folders = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    jobs = build_jobs(count, folders)
+    columns = build_job_columns(jobs)
+    order = order_jobs(build_sort_keys(jobs), "Status")
+
+    for group_by in ("Folder", "Prefix"):
+        best = min(
+            timeit.repeat(lambda g=group_by: group_jobs(columns, g), number=1, repeat=5)
+        )
+        print(f"{count} jobs by {group_by}: grouped in {best * 1000:.1f} ms")
+
+    grouping = group_jobs(columns, "Folder")
+    split = min(
+        timeit.repeat(
+            lambda: group_jobs(columns, "Folder").partition(order), number=1, repeat=5
+        )
+    )
+    cached = min(
+        timeit.repeat(lambda: grouping.partition(order), number=1000, repeat=5)
+    )
+    print(f"{len(grouping)} groups: grouped and split in {split * 1000:.1f} ms")
+    print(f"cached split: {cached / 1000 * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
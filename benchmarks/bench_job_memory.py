@@ -0,0 +1,77 @@
+"""Measure JenkinsJob memory at 10k and 100k jobs.
+
+Compares a replica of the previous plain dataclass (instance __dict__, one
+datetime per job, no interning) with the slotted, interned JenkinsJob, which
+stores each job URL as a folder prefix shared by the folder's jobs. Two
+consecutive snapshots are built from freshly created strings, as happens when
+parsing Jenkins API responses on every poll.
+
+Usage:
+    python benchmarks/bench_job_memory.py
+"""
+
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+
+import common  # noqa: F401  (puts src on the import path)
+
+from models.job import JenkinsJob, JobStatus
+
+
+@dataclass
+class LegacyJenkinsJob:
+    """Replica of the previous JenkinsJob layout."""
+
+    name: str
+    url: str
+    status: JobStatus
+    last_build_number: int | None
+    last_build_result: str | None
+    last_build_timestamp: datetime | None
+    last_build_duration_ms: int | None
+    is_building: bool
+
+
+def build_snapshot(cls: type, count: int) -> list:
+    """Build one snapshot of jobs with freshly allocated strings."""
+    base_ms = 1767866400000
+    return [
+        cls(
+            name=f"team-{i % 50}/service-{i}",
+            url=f"https://jenkins.company.com/job/team-{i % 50}/job/service-{i}/",
+            status=JobStatus.SUCCESS,
+            last_build_number=i,
+            last_build_result="".join(["SUCC", "ESS"]),
+            last_build_timestamp=datetime.fromtimestamp((base_ms + i) / 1000),
+            last_build_duration_ms=45000 + i,
+            is_building=False,
+        )
+        for i in range(count)
+    ]
+
+
+def measure(cls: type, count: int) -> int:
+    """Return bytes held by two consecutive snapshots."""
+    tracemalloc.start()
+    snapshots = [build_snapshot(cls, count) for _ in range(2)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del snapshots
+    return current
+
+
+def main() -> None:
+    """Run the benchmark."""
+    for count in (10_000, 100_000):
+        legacy = measure(LegacyJenkinsJob, count)
+        compact = measure(JenkinsJob, count)
+        print(
+            f"{count:>7} jobs x2 snapshots: legacy {legacy / 2**20:7.1f} MiB  "
+            f"compact {compact / 2**20:7.1f} MiB  "
+            f"({compact / legacy:.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
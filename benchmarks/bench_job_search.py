@@ -0,0 +1,40 @@
+"""Measure job name search index build and query times.
+
+Usage:
+    python benchmarks/bench_job_search.py [jobs]
+"""
+
+import sys
+import timeit
+
+from common import build_jobs
+
+from services.job_search import JobSearchIndex
+
+QUERIES = (
+    "service-4242",
+    "team-7/",
+    "vice-12",
+    "team-3 service-99",
+    "servce-4242",
+    "service",
+)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    names = [job.name for job in build_jobs(count)]
+
+    build = min(timeit.repeat(lambda: JobSearchIndex(names), number=1, repeat=3))
+    print(f"{count} jobs: index built in {build * 1000:.0f} ms")
+
+    index = JobSearchIndex(names)
+    for query in QUERIES:
+        best = min(timeit.repeat(lambda q=query: index.search(q), number=1, repeat=5))
+        matches = len(index.search(query))
+        print(f"{query!r:<22} {best * 1000:8.2f} ms  {matches:8,} matches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Measure display formatting cost per rerun across many sessions.
+
+Compares formatting every job on every rerun against reading strings from a
+render model shared by all sessions.
+
+Usage:
+    python benchmarks/bench_render_model.py [jobs] [sessions]
+"""
+
+import sys
+import time
+
+from common import build_jobs
+
+from components.job_card import build_job_display
+from components.render_model import RenderModelCache
+from services.job_view import JobViewCache
+from services.snapshot import make_snapshot
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    snapshot = make_snapshot(build_jobs(count))
+    now_ms = int(snapshot.created_at.timestamp() * 1000)
+    order = JobViewCache().order(snapshot.version, snapshot.jobs, "Name", ())
+
+    start = time.perf_counter()
+    for _ in range(sessions):
+        for i in order:
+            build_job_display(snapshot.jobs[i], now_ms)
+    per_session = time.perf_counter() - start
+
+    models = RenderModelCache()
+    start = time.perf_counter()
+    for _ in range(sessions):
+        models.get(snapshot).columns(order)
+    shared = time.perf_counter() - start
+
+    print(f"{count} jobs, {sessions} session reruns")
+    print(f"format per rerun     {per_session * 1000:8.1f} ms total")
+    print(f"shared render model  {shared * 1000:8.1f} ms total")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Measure job-list memory held per session.
+
+Compares the previous behaviour (each session keeps its own unpickled copy of
+the job list, as returned by st.cache_data) with sessions that only hold a
+snapshot version in the shared SnapshotStore.
+
+Usage:
+    python benchmarks/bench_session_memory.py [jobs] [sessions]
+"""
+
+import pickle
+import sys
+import tracemalloc
+
+from common import build_jobs
+
+from services.snapshot import SnapshotStore
+
+
+def report(label: str, sessions: int) -> None:
+    """Print memory currently traced, in total and per session."""
+    current, _ = tracemalloc.get_traced_memory()
+    print(
+        f"{label:<20} {current / 1024:>10.1f} KiB total "
+        f"{current / sessions / 1024:>10.1f} KiB/session"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    job_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    payload = pickle.dumps(build_jobs(job_count))
+    print(f"{job_count} jobs, {sessions} sessions")
+
+    # Before: every session unpickles and keeps its own copy
+    tracemalloc.start()
+    copies = [pickle.loads(payload) for _ in range(sessions)]
+    report("per-session copies", sessions)
+    del copies
+    tracemalloc.stop()
+
+    # After: one shared snapshot, sessions hold only a version reference
+    tracemalloc.start()
+    store = SnapshotStore()
+    snapshot = store.publish(pickle.loads(payload))
+    session_states = [{"snapshot_version": snapshot.version} for _ in range(sessions)]
+    for i in range(sessions):
+        store.acquire(f"session-{i}", snapshot.version)
+    report("shared snapshot", sessions)
+    del store, session_states
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Measure snapshot timeline storage and reconstruction time.
+
+Records a week of 30 second polls (20,160 polls) where a small fraction of
+jobs change on each poll, then reconstructs the board at random moments.
+
+Usage:
+    python benchmarks/bench_timeline.py [jobs] [changes_per_poll]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from common import build_jobs
+
+from models.job import JenkinsJob, JobStatus
+from services.job_codec import encode_jobs
+from services.timeline import SnapshotTimeline
+
+POLL_INTERVAL = 30
+POLLS_PER_WEEK = 7 * 86400 // POLL_INTERVAL
+
+
+def rebuild(job: JenkinsJob, number: int) -> JenkinsJob:
+    """Return the job after a new build."""
+    return JenkinsJob(
+        name=job.name,
+        url=job.url,
+        status=random.choice([JobStatus.SUCCESS, JobStatus.FAILURE]),
+        last_build_number=number,
+        last_build_result="SUCCESS",
+        last_build_duration_ms=job.last_build_duration_ms,
+        is_building=False,
+        last_build_timestamp_ms=(job.last_build_timestamp_ms or 0) + 30_000,
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    job_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    changes = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    random.seed(42)
+    jobs = build_jobs(job_count)
+    start_ts = int(time.time()) - POLLS_PER_WEEK * POLL_INTERVAL
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "timeline.db"
+        timeline = SnapshotTimeline(path)
+
+        began = time.perf_counter()
+        for poll in range(POLLS_PER_WEEK):
+            for index in random.sample(range(job_count), changes):
+                jobs[index] = rebuild(jobs[index], poll)
+            timeline.record(jobs, start_ts + poll * POLL_INTERVAL)
+        record_s = time.perf_counter() - began
+
+        full_copies = POLLS_PER_WEEK * len(encode_jobs(jobs))
+        print(
+            f"{job_count} jobs, {changes} changes/poll, {POLLS_PER_WEEK} polls "
+            f"recorded in {record_s:.1f}s ({record_s / POLLS_PER_WEEK * 1000:.2f} ms/poll)"
+        )
+        print(
+            f"storage: {path.stat().st_size / 2**20:.1f} MiB "
+            f"(full snapshot per poll: {full_copies / 2**20:.1f} MiB)"
+        )
+
+        worst = 0.0
+        total = 0.0
+        samples = 50
+        for _ in range(samples):
+            moment = start_ts + random.randrange(POLLS_PER_WEEK) * POLL_INTERVAL
+            began = time.perf_counter()
+            snapshot = timeline.snapshot_at(datetime.fromtimestamp(moment))
+            elapsed = time.perf_counter() - began
+            assert snapshot is not None and len(snapshot.jobs) == job_count
+            worst = max(worst, elapsed)
+            total += elapsed
+        print(
+            f"reconstruct: mean {total / samples * 1000:.1f} ms, "
+            f"worst {worst * 1000:.1f} ms over {samples} random moments"
+        )
+        timeline.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Measure whitelist authorization checks: linear scan vs email index.
+
+Usage:
+    python benchmarks/bench_whitelist.py [entries ...]
+"""
+
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+import common  # noqa: F401  (puts src on the import path)
+
+from models.whitelist import Whitelist, WhitelistEntry
+from services.whitelist import WhitelistService
+
+
+def build_whitelist(count: int) -> Whitelist:
+    """Build a whitelist with count users and a few admins."""
+    now = datetime(2026, 1, 8, 10, 0, 0)
+
+    def entry(email: str) -> WhitelistEntry:
+        return WhitelistEntry(email=email, name=email, added_at=now, added_by="bench")
+
+    return Whitelist(
+        version="1.0",
+        last_updated=now,
+        updated_by="bench",
+        users=[entry(f"User.{i}@Company.com") for i in range(count)],
+        admins=[entry(f"admin.{i}@company.com") for i in range(5)],
+    )
+
+
+def scan_is_user_allowed(whitelist: Whitelist, email: str) -> bool:
+    """The lookup before the email index: copy both lists and scan them."""
+    all_entries = whitelist.users + whitelist.admins
+    return any(
+        entry.email.lower() == email.lower() and entry.active for entry in all_entries
+    )
+
+
+def measure(count: int, path: Path) -> None:
+    """Compare lookups in a whitelist of count users stored at path."""
+    service = WhitelistService(path)
+    whitelist = build_whitelist(count)
+    service._save(whitelist)
+    # Worst case for the scan: a user near the end, and an unknown user
+    emails = (f"user.{count - 1}@company.com", "nobody@company.com")
+
+    number = max(1, 200_000 // count)
+    scan = min(
+        timeit.repeat(
+            lambda: [scan_is_user_allowed(whitelist, e) for e in emails],
+            number=number,
+            repeat=3,
+        )
+    )
+    indexed = min(
+        timeit.repeat(
+            lambda: [service.is_user_allowed(e) for e in emails],
+            number=10_000,
+            repeat=3,
+        )
+    )
+    scan_us = scan / number / len(emails) * 1e6
+    indexed_us = indexed / 10_000 / len(emails) * 1e6
+    print(
+        f"{count:>7} entries: scan {scan_us:10.1f} us  "
+        f"indexed {indexed_us:6.2f} us  ({scan_us / indexed_us:,.0f}x)"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 10_000, 100_000]
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in sizes:
+            measure(count, Path(tmp) / f"whitelist-{count}.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Shared helpers for the benchmark scripts.
+
+Importing this module puts ``src`` on the import path, the same way
+``tests/conftest.py`` does for the test suite.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models.job import JenkinsJob, JobStatus  # noqa: E402
+
+
+def build_jobs(count: int, folders: int = 50) -> list[JenkinsJob]:
+    """Build a synthetic job list.
+
+    Args:
+        count: Number of jobs
+        folders: Number of distinct folders the jobs are spread over
+
+    Returns:
+        List of JenkinsJob objects
+    """
+    statuses = list(JobStatus)
+    base_ms = int(datetime(2026, 1, 8, 10, 30, 0).timestamp() * 1000)
+    return [
+        JenkinsJob(
+            name=f"team-{i % folders}/service-{i}",
+            url=f"https://jenkins.company.com/job/team-{i % folders}/job/service-{i}/",
+            status=statuses[i % len(statuses)],
+            last_build_number=i + 1,
+            last_build_result="SUCCESS",
+            last_build_duration_ms=45000 + i,
+            is_building=False,
+            last_build_timestamp_ms=base_ms - i * 60_000,
+        )
+        for i in range(count)
+    ]
@@ -2,17 +2,38 @@
 
 import os
 import time
+import uuid
 from datetime import datetime
 
 import streamlit as st
 from dotenv import load_dotenv
 
 from components.job_table import render_job_table
+from components.render_model import RenderModelCache
 from components.status_bar import render_connection_status, render_status_bar
+from components.timeline import render_timeline_controls
 from models.exceptions import JenkinsConnectionError
 from models.user import User
 from services.audit import AuditService
-from services.dashboard import DashboardService
+from services.auth_session import authorize_session
+from services.dashboard import DashboardService, calculate_statistics
+from services.history import StatsHistory
+from services.job_details import (
+    PREFETCH_CHANGE_WINDOW,
+    JobDetailsCache,
+    select_prefetch,
+)
+from services.job_view import JobViewCache
+from services.snapshot import JobSnapshot, SnapshotStore
+from services.snapshot_server import (
+    DEFAULT_HOST,
+    SNAPSHOT_API_HOST_ENV,
+    SNAPSHOT_API_PORT_ENV,
+    SNAPSHOT_API_SECRET_ENV,
+    SnapshotServer,
+)
+from services.timeline import SnapshotTimeline
+from services.whitelist import create_whitelist_service
 
 # Load environment variables
 load_dotenv()
@@ -24,10 +45,12 @@ if DEMO_MODE:
     from services.mock_auth import (
         check_authorization,
         get_client_ip,
+        get_user_identity,
         mock_authenticate_user as authenticate_user,
         mock_logout_user as logout_user,
         render_access_denied_page,
         render_demo_login_page as render_login_page,
+        whitelist_service,
     )
     from services.mock_jenkins import MockJenkinsService
 else:
@@ -35,9 +58,11 @@ else:
         authenticate_user,
         check_authorization,
         get_client_ip,
+        get_user_identity,
         logout_user,
         render_access_denied_page,
         render_login_page,
+        whitelist_service,
     )
     from services.jenkins import JenkinsService
 
@@ -60,20 +85,94 @@ def init_session_state() -> None:
     """Initialize Streamlit session state variables."""
     if "last_refresh" not in st.session_state:
         st.session_state.last_refresh = datetime.now()
-    if "cached_jobs" not in st.session_state:
-        st.session_state.cached_jobs = []
+    if "session_key" not in st.session_state:
+        st.session_state.session_key = uuid.uuid4().hex
+    if "snapshot_version" not in st.session_state:
+        st.session_state.snapshot_version = None
     if "auto_refresh" not in st.session_state:
         st.session_state.auto_refresh = True
     if "login_logged" not in st.session_state:
         st.session_state.login_logged = False
 
 
-@st.cache_data(ttl=REFRESH_INTERVAL)
-def fetch_jobs() -> tuple[list, bool, str | None]:
-    """Fetch all Jenkins jobs with caching.
+@st.cache_resource
+def get_snapshot_store() -> SnapshotStore:
+    """Get the process-wide snapshot store shared by all sessions."""
+    return SnapshotStore()
+
+
+@st.cache_resource
+def get_stats_history() -> StatsHistory:
+    """Get the process-wide statistics history store."""
+    return StatsHistory()
+
+
+@st.cache_resource
+def get_timeline() -> SnapshotTimeline:
+    """Get the process-wide snapshot timeline."""
+    return SnapshotTimeline()
+
+
+@st.cache_resource
+def get_view_cache() -> JobViewCache:
+    """Get the process-wide cache of sorted and filtered job views."""
+    return JobViewCache()
+
+
+@st.cache_resource
+def get_render_models() -> RenderModelCache:
+    """Get the process-wide cache of per-snapshot render models."""
+    return RenderModelCache()
+
+
+@st.cache_resource
+def get_details_cache() -> JobDetailsCache:
+    """Get the process-wide cache of on-demand job details."""
+    service = MockJenkinsService() if DEMO_MODE else JenkinsService()
+    return JobDetailsCache(service.get_job_details_with_builds)
+
+
+@st.cache_resource
+def get_snapshot_server() -> SnapshotServer | None:
+    """Start the process-wide read-only snapshot endpoint, if configured.
 
     Returns:
-        Tuple of (jobs list, is_available, error_message)
+        The running SnapshotServer, or None if no port or secret is set
+    """
+    port = os.environ.get(SNAPSHOT_API_PORT_ENV)
+    secret = os.environ.get(SNAPSHOT_API_SECRET_ENV)
+    if not port or not secret:
+        return None
+
+    store = get_snapshot_store()
+    render_models = get_render_models()
+    server = SnapshotServer(
+        fetch=lambda: fetch_jobs()[0] or store.current(),
+        is_allowed=create_whitelist_service().is_user_allowed,
+        secret=secret.encode(),
+        render_wallboard=lambda snapshot, now_ms: render_models.get(
+            snapshot, now_ms
+        ).wallboard(),
+        refresh_seconds=REFRESH_INTERVAL,
+        last_poll=store.last_poll,
+    )
+    server.serve(os.environ.get(SNAPSHOT_API_HOST_ENV, DEFAULT_HOST), int(port))
+    return server
+
+
+# No spinner, so the snapshot server's thread can share the cached fetch
+@st.cache_resource(ttl=REFRESH_INTERVAL, show_spinner=False)
+def fetch_jobs() -> tuple[JobSnapshot | None, bool, str | None]:
+    """Fetch all Jenkins jobs and publish them as a shared snapshot.
+
+    Uses cache_resource so every session receives the same snapshot object
+    instead of its own unpickled copy of the job list. Every poll is recorded
+    in the statistics history, so its rollups average over time. A poll that
+    publishes a new snapshot version is also added to the snapshot timeline,
+    and details of the jobs most likely to be opened are prefetched.
+
+    Returns:
+        Tuple of (snapshot, is_available, error_message)
     """
     try:
         if DEMO_MODE:
@@ -81,9 +180,26 @@ def fetch_jobs() -> tuple[list, bool, str | None]:
         else:
             service = JenkinsService()
         jobs = service.get_all_jobs()
-        return jobs, True, None
+        store = get_snapshot_store()
+        previous = store.current()
+        snapshot = store.publish(jobs)
+        get_stats_history().record(calculate_statistics(snapshot.jobs), snapshot.jobs)
+        if snapshot is previous:
+            # Unchanged job list: nothing new for the timeline or the prefetch
+            return snapshot, True, None
+
+        get_timeline().record(snapshot.jobs)
+
+        # Warm details of the jobs people are most likely to open
+        changes = get_stats_history().job_changes(
+            int(time.time()) - PREFETCH_CHANGE_WINDOW
+        )
+        get_details_cache().prefetch(
+            select_prefetch(snapshot.jobs, [name for _, name, _ in reversed(changes)])
+        )
+        return snapshot, True, None
     except JenkinsConnectionError as e:
-        return [], False, str(e)
+        return None, False, str(e)
 
 
 def refresh_jobs() -> None:
@@ -156,14 +272,25 @@ def render_dashboard(user: User) -> None:
     render_header(user)
 
     # Fetch jobs
-    jobs, is_available, error_message = fetch_jobs()
-
-    # Update cached jobs if available
-    if is_available and jobs:
-        st.session_state.cached_jobs = jobs
+    snapshot, is_available, error_message = fetch_jobs()
+
+    # Point this session at the latest snapshot, or keep the one it last
+    # displayed if Jenkins is unavailable
+    store = get_snapshot_store()
+    version = snapshot.version if snapshot else st.session_state.snapshot_version
+    held = (
+        store.acquire(st.session_state.session_key, version)
+        if version is not None
+        else None
+    )
+    st.session_state.snapshot_version = held.version if held else None
+    displayed = held
 
-    # Use cached jobs if Jenkins is unavailable
-    display_jobs = jobs if is_available else st.session_state.cached_jobs
+    # Optionally replay a past state of the board instead of live data
+    past = render_timeline_controls(get_timeline())
+    if past is not None:
+        displayed = past
+    display_jobs = displayed.jobs if displayed else ()
 
     # Create dashboard service with current state
     dashboard_service = DashboardService(
@@ -174,10 +301,11 @@ def render_dashboard(user: User) -> None:
     state = dashboard_service.get_dashboard_state()
 
     # Render connection status
-    render_connection_status(state)
+    if past is None:
+        render_connection_status(state)
 
-    # Render status bar
-    render_status_bar(state)
+    # Render status bar, with trends from the statistics history for live data
+    render_status_bar(state, get_stats_history() if past is None else None)
 
     st.markdown("---")
 
@@ -187,13 +315,20 @@ def render_dashboard(user: User) -> None:
     st.markdown("---")
 
     # Render job table
-    render_job_table(display_jobs)
+    render_job_table(
+        display_jobs,
+        version=displayed.version if displayed else None,
+        view_cache=get_view_cache(),
+        render_model=get_render_models().get(displayed) if displayed else None,
+        details_cache=get_details_cache(),
+    )
 
-    # Auto-refresh logic
-    if st.session_state.auto_refresh:
+    # Auto-refresh logic (paused while time travelling)
+    if st.session_state.auto_refresh and past is None:
         time_since_refresh = (datetime.now() - st.session_state.last_refresh).seconds
         if time_since_refresh >= REFRESH_INTERVAL:
-            refresh_jobs()
+            # Re-read the shared fetch; its TTL decides when Jenkins is polled
+            st.session_state.last_refresh = datetime.now()
             st.rerun()
         else:
             # Show countdown
@@ -208,9 +343,17 @@ def render_dashboard(user: User) -> None:
 def main() -> None:
     """Main application entry point."""
     init_session_state()
-
-    # Check authentication
-    user = authenticate_user()
+    get_snapshot_server()
+
+    # Check authentication and authorization, reusing this session's result
+    # until the whitelist changes
+    user, authorized = authorize_session(
+        st.session_state,
+        get_user_identity(),
+        whitelist_service.version(),
+        authenticate_user,
+        check_authorization,
+    )
 
     if user is None:
         # User is not logged in
@@ -222,8 +365,7 @@ def main() -> None:
         audit_service.log_login_success(user, get_client_ip())
         st.session_state.login_logged = True
 
-    # Check authorization
-    if not check_authorization(user):
+    if not authorized:
         # User is logged in but not authorized
         audit_service.log_access_denied(user, get_client_ip())
         render_access_denied_page(user)
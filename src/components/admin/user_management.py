@@ -2,15 +2,40 @@
 
 import streamlit as st
 
+from components.job_table import render_pagination
 from models.user import User
+from models.whitelist import BulkImportReport
 from services.audit import AuditService
-from services.whitelist import WhitelistService
+from services.directory import DirectoryClient
+from services.whitelist import WHITELIST_ARCHIVE_RETENTION_DAYS, WhitelistBackend
+from services.whitelist_transfer import (
+    IMPORT_FORMATS,
+    ParsedImport,
+    export_csv,
+    export_json,
+    ldap_group_entries,
+    parse_upload,
+)
+from services.whitelist_view import RELEVANCE, SORT_OPTIONS, WhitelistViewCache
+
+# Default number of users per page of the user list
+USERS_PAGE_SIZE = 50
+
+# Directory matches offered by the Add User picker
+DIRECTORY_PICKER_LIMIT = 10
+
+
+@st.cache_resource
+def _get_user_views() -> WhitelistViewCache:
+    """Get the process-wide cache of searchable user lists."""
+    return WhitelistViewCache()
 
 
 def render_user_management(
     admin_user: User,
-    whitelist_service: WhitelistService,
+    whitelist_service: WhitelistBackend,
     audit_service: AuditService,
+    ldap_service: DirectoryClient | None = None,
 ) -> None:
     """Render user management interface.
 
@@ -18,19 +43,28 @@ def render_user_management(
         admin_user: The current admin user.
         whitelist_service: Whitelist service instance.
         audit_service: Audit service instance.
+        ldap_service: Directory to pick new users from and import groups
+            from; both are hidden if not provided.
     """
     st.header("User Management")
 
     # Add new user section
     st.subheader("Add New User")
 
+    if ldap_service is not None:
+        _render_directory_picker(ldap_service)
+
     with st.form("add_user_form", clear_on_submit=True):
         col1, col2 = st.columns(2)
 
         with col1:
-            new_email = st.text_input("Email", placeholder="user@company.com")
+            new_email = st.text_input(
+                "Email", placeholder="user@company.com", key="add_user_email"
+            )
         with col2:
-            new_name = st.text_input("Name", placeholder="User Name")
+            new_name = st.text_input(
+                "Name", placeholder="User Name", key="add_user_name"
+            )
 
         submitted = st.form_submit_button("Add User", type="primary")
 
@@ -54,32 +88,18 @@ def render_user_management(
             else:
                 st.warning("Please fill in both email and name")
 
+    _render_bulk_import(admin_user, whitelist_service, audit_service, ldap_service)
+
     st.markdown("---")
 
     # Current users list
     st.subheader("Whitelisted Users")
-    users = whitelist_service.list_users()
+    _render_user_list(admin_user, whitelist_service, audit_service)
+    _render_compaction(admin_user, whitelist_service, audit_service)
 
-    if not users:
-        st.info("No users in whitelist yet")
-    else:
-        for user in users:
-            col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
-            with col1:
-                st.write(f"**{user.email}**")
-            with col2:
-                st.write(user.name)
-            with col3:
-                st.caption(f"Added: {user.added_at.strftime('%Y-%m-%d')}")
-            with col4:
-                if st.button("Remove", key=f"remove_{user.email}"):
-                    whitelist_service.remove_user(user.email, admin_user.email)
-                    audit_service.log_admin_action(
-                        admin=admin_user,
-                        action="remove_user",
-                        details={"email": user.email},
-                    )
-                    st.rerun()
+    st.markdown("---")
+
+    _render_groups(admin_user, whitelist_service, audit_service)
 
     st.markdown("---")
 
@@ -94,3 +114,272 @@ def render_user_management(
             st.write(f"- **{admin.name}** ({admin.email})")
 
     st.caption("Admin users are managed via configuration file")
+
+
+def _render_directory_picker(ldap_service: DirectoryClient) -> None:
+    """Render a directory search that fills in the Add User form.
+
+    Args:
+        ldap_service: Directory to search.
+    """
+    query = st.text_input(
+        "Find in directory", placeholder="Start typing a name or email"
+    )
+    if not query.strip():
+        return
+
+    matches = {
+        user.email: user
+        for user in ldap_service.search_users(query, limit=DIRECTORY_PICKER_LIMIT)
+    }
+    if not matches:
+        st.caption("No directory matches")
+        return
+
+    def fill_form() -> None:
+        user = matches.get(st.session_state.directory_pick)
+        if user is not None:
+            st.session_state.add_user_email = user.email
+            st.session_state.add_user_name = user.display_name
+
+    st.selectbox(
+        "Directory matches",
+        list(matches),
+        index=None,
+        format_func=lambda email: f"{matches[email].display_name} ({email})",
+        placeholder=f"{len(matches)} matches; pick one to fill in the form",
+        key="directory_pick",
+        on_change=fill_form,
+    )
+
+
+def _render_user_list(
+    admin_user: User,
+    whitelist_service: WhitelistBackend,
+    audit_service: AuditService,
+) -> None:
+    """Render one page of the searchable user list with bulk deactivation.
+
+    Args:
+        admin_user: The current admin user.
+        whitelist_service: Whitelist service instance.
+        audit_service: Audit service instance.
+    """
+    version = whitelist_service.version()
+    view = _get_user_views().get(version, whitelist_service.list_users)
+    if not len(view):
+        st.info("No users in whitelist yet")
+        return
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        search = st.text_input("Search users", placeholder="Email or name")
+    # Offering Relevance only while searching also resets the sort to it
+    options = [RELEVANCE, *SORT_OPTIONS] if search.strip() else list(SORT_OPTIONS)
+    with col2:
+        sort_by = st.selectbox("Sort by", options)
+
+    order = view.order(search, sort_by)
+    page = render_pagination(order, len(view), USERS_PAGE_SIZE, noun="users")
+    entries = [view.entries[index] for index in page]
+
+    # The whole page is one table; keying it by its contents clears the
+    # selection whenever the rows shown change
+    event = st.dataframe(
+        {
+            "Email": [entry.email for entry in entries],
+            "Name": [entry.name for entry in entries],
+            "Added": [entry.added_at.strftime("%Y-%m-%d") for entry in entries],
+            "Added by": [entry.added_by for entry in entries],
+        },
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="multi-row",
+        key=f"users-{version}-{sort_by}-{search}-{page[:1]}-{len(page)}",
+    )
+    selected = [
+        entries[row].email for row in event.selection.rows if row < len(entries)
+    ]
+
+    if st.button(f"Deactivate Selected ({len(selected)})", disabled=not selected):
+        removed = whitelist_service.remove_users(selected, admin_user.email)
+        audit_service.log_admin_action(
+            admin=admin_user,
+            action="remove_users",
+            details={"count": str(len(removed)), "emails": ",".join(removed)},
+        )
+        st.rerun()
+
+
+def _render_groups(
+    admin_user: User,
+    whitelist_service: WhitelistBackend,
+    audit_service: AuditService,
+) -> None:
+    """Render the directory groups whose members are allowed.
+
+    Args:
+        admin_user: The current admin user.
+        whitelist_service: Whitelist service instance.
+        audit_service: Audit service instance.
+    """
+    st.subheader("Allowed Groups")
+    st.caption("Members of these directory (SSO) groups can access the dashboard")
+
+    with st.form("add_group_form", clear_on_submit=True):
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            group = st.text_input("Group", placeholder="engineering")
+        with col2:
+            submitted = st.form_submit_button("Add Group")
+        if submitted and group.strip():
+            if whitelist_service.add_group(group, admin_user.email):
+                audit_service.log_admin_action(
+                    admin=admin_user,
+                    action="add_group",
+                    details={"group": group.strip()},
+                )
+                st.rerun()
+            else:
+                st.error(f"Group {group.strip()} is already allowed")
+
+    groups = whitelist_service.list_groups()
+    if not groups:
+        st.info("No groups allowed; access is granted per user only")
+    for entry in groups:
+        col1, col2, col3 = st.columns([3, 2, 1])
+        with col1:
+            st.write(f"**{entry.name}**")
+        with col2:
+            st.caption(f"Added: {entry.added_at.strftime('%Y-%m-%d')}")
+        with col3:
+            if st.button("Remove", key=f"remove_group_{entry.name}"):
+                whitelist_service.remove_group(entry.name, admin_user.email)
+                audit_service.log_admin_action(
+                    admin=admin_user,
+                    action="remove_group",
+                    details={"group": entry.name},
+                )
+                st.rerun()
+
+
+def _render_compaction(
+    admin_user: User,
+    whitelist_service: WhitelistBackend,
+    audit_service: AuditService,
+) -> None:
+    """Render the control archiving long-deactivated users.
+
+    Args:
+        admin_user: The current admin user.
+        whitelist_service: Whitelist service instance.
+        audit_service: Audit service instance.
+    """
+    with st.expander("Archive Inactive Users"):
+        st.caption(
+            "Moves users deactivated longer ago than the retention window to "
+            "the archive file. Adding an archived user again restores them."
+        )
+        days = st.number_input(
+            "Retention (days)",
+            min_value=0,
+            value=WHITELIST_ARCHIVE_RETENTION_DAYS,
+            step=1,
+        )
+        if st.button("Archive Now"):
+            archived = whitelist_service.compact(days, admin_user.email)
+            audit_service.log_admin_action(
+                admin=admin_user,
+                action="archive_users",
+                details={"retention_days": str(days), "archived": str(archived)},
+            )
+            st.success(f"Archived {archived} inactive entries")
+
+
+def _render_bulk_import(
+    admin_user: User,
+    whitelist_service: WhitelistBackend,
+    audit_service: AuditService,
+    ldap_service: DirectoryClient | None,
+) -> None:
+    """Render bulk import from a file or directory group, and export.
+
+    Args:
+        admin_user: The current admin user.
+        whitelist_service: Whitelist service instance.
+        audit_service: Audit service instance.
+        ldap_service: Directory to import groups from, if any.
+    """
+    with st.expander("Bulk Import / Export"):
+        sources = ["File"] + (["LDAP group"] if ldap_service is not None else [])
+        source = st.radio("Import from", sources, horizontal=True)
+
+        parsed: ParsedImport | None = None
+        if source == "File":
+            upload = st.file_uploader(
+                "CSV (email,name) or JSON list of users", type=list(IMPORT_FORMATS)
+            )
+            if upload is not None and st.button("Import Users", type="primary"):
+                parsed = parse_upload(upload.name, upload.getvalue())
+        elif ldap_service is not None:
+            group = st.text_input("Group", placeholder="engineering")
+            if group and st.button("Import Group", type="primary"):
+                parsed = ldap_group_entries(ldap_service, group)
+
+        if parsed is not None:
+            report = whitelist_service.add_users(parsed.entries, admin_user.email)
+            report.invalid.extend(parsed.invalid)
+            audit_service.log_admin_action(
+                admin=admin_user,
+                action="bulk_add_users",
+                details={"source": source.lower(), **report.summary()},
+            )
+            _render_import_report(report)
+
+        st.caption("Export all users, including deactivated ones")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                "Export CSV",
+                data=lambda: export_csv(
+                    whitelist_service.list_users(include_inactive=True)
+                ),
+                file_name="whitelist_users.csv",
+                mime="text/csv",
+                on_click="ignore",
+            )
+        with col2:
+            st.download_button(
+                "Export JSON",
+                data=lambda: export_json(
+                    whitelist_service.list_users(include_inactive=True)
+                ),
+                file_name="whitelist_users.json",
+                mime="application/json",
+                on_click="ignore",
+            )
+
+
+def _render_import_report(report: BulkImportReport) -> None:
+    """Render what a bulk import added, reactivated, skipped and rejected.
+
+    Args:
+        report: Report returned by the whitelist service.
+    """
+    summary = report.summary()
+    if report.changed:
+        st.success(
+            f"Added {summary['added']}, reactivated {summary['reactivated']} users"
+        )
+    else:
+        st.info("No users were added")
+
+    for label, emails in (
+        ("Added", report.added),
+        ("Reactivated", report.reactivated),
+        ("Skipped (already active or repeated)", report.skipped),
+        ("Invalid", report.invalid),
+    ):
+        if emails:
+            st.markdown(f"**{label}** ({len(emails)})")
+            st.code("\n".join(emails), language=None)
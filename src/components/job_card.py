@@ -1,8 +1,11 @@
 """Job card component for the Jenkins Dashboard."""
 
+import time
+from dataclasses import dataclass
+
 import streamlit as st
 
-from models.job import JenkinsJob, JobStatus
+from models.job import JenkinsJob, JobDetails, JobStatus
 
 
 def get_status_color(status: JobStatus) -> str:
@@ -49,6 +52,127 @@ def get_status_emoji(status: JobStatus) -> str:
     return emoji_map.get(status, ":question:")
 
 
+def get_status_icon(status: JobStatus) -> str:
+    """Get a plain unicode icon for a job status.
+
+    Used where emoji shortcodes are not rendered, such as dataframes.
+
+    Args:
+        status: JobStatus enum value
+
+    Returns:
+        Unicode icon string
+    """
+    icon_map = {
+        JobStatus.SUCCESS: "\u2705",
+        JobStatus.FAILURE: "\u274c",
+        JobStatus.UNSTABLE: "\u26a0\ufe0f",
+        JobStatus.BUILDING: "\u23f3",
+        JobStatus.DISABLED: "\u26d4",
+        JobStatus.NOT_BUILT: "\u2754",
+        JobStatus.ABORTED: "\U0001f6d1",
+        JobStatus.UNKNOWN: "\u2753",
+    }
+    return icon_map.get(status, "\u2753")
+
+
+def format_duration(duration_ms: int) -> str:
+    """Format a build duration for display.
+
+    Args:
+        duration_ms: Duration in milliseconds
+
+    Returns:
+        Duration in seconds below one minute, otherwise in minutes
+    """
+    duration_s = duration_ms / 1000
+    if duration_s < 60:
+        return f"{duration_s:.1f}s"
+    return f"{duration_s / 60:.1f}m"
+
+
+def format_relative_time(timestamp_ms: int, now_ms: int) -> str:
+    """Format how long ago a timestamp was.
+
+    Args:
+        timestamp_ms: Past time in epoch milliseconds
+        now_ms: Current time in epoch milliseconds
+
+    Returns:
+        Relative time such as "5m ago"
+    """
+    seconds = max(0, (now_ms - timestamp_ms) // 1000)
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{seconds // 60}m ago"
+    if seconds < 86400:
+        return f"{seconds // 3600}h ago"
+    return f"{seconds // 86400}d ago"
+
+
+@dataclass(frozen=True, slots=True)
+class JobDisplay:
+    """Pre-formatted display strings for one job.
+
+    Empty strings stand for values the job does not have.
+    """
+
+    name: str
+    url: str
+    emoji: str
+    icon: str
+    status_text: str
+    title: str  # emoji and name, used as a label for the job
+    build_label: str  # "#<number>" or "No builds"
+    result: str
+    time: str  # full build start time
+    short_time: str  # build start time without year and seconds
+    duration: str
+    relative_time: str  # build start relative to the reference time
+
+
+def build_job_display(job: JenkinsJob, now_ms: int | None = None) -> JobDisplay:
+    """Format every display string of a job.
+
+    Args:
+        job: Job to format
+        now_ms: Reference time for the relative build time in epoch
+            milliseconds (default: now)
+
+    Returns:
+        JobDisplay for the job
+    """
+    if now_ms is None:
+        now_ms = int(time.time() * 1000)
+    emoji = get_status_emoji(job.status)
+    timestamp = job.last_build_timestamp
+    return JobDisplay(
+        name=job.name,
+        url=job.url or "",
+        emoji=emoji,
+        icon=get_status_icon(job.status),
+        status_text=job.status.value.upper(),
+        title=f"{emoji} {job.name}",
+        build_label=(
+            f"#{job.last_build_number}" if job.last_build_number else "No builds"
+        ),
+        result=job.last_build_result or "",
+        time=timestamp.strftime("%Y-%m-%d %H:%M:%S") if timestamp else "",
+        short_time=timestamp.strftime("%m/%d %H:%M") if timestamp else "",
+        duration=(
+            format_duration(job.last_build_duration_ms)
+            if job.last_build_duration_ms
+            else ""
+        ),
+        relative_time=(
+            format_relative_time(job.last_build_timestamp_ms, now_ms)
+            if job.last_build_timestamp_ms
+            else ""
+        ),
+    )
+
+
 def render_job_card(job: JenkinsJob, show_details: bool = False) -> None:
     """Render a job card with status information.
 
@@ -79,38 +203,73 @@ def render_job_card(job: JenkinsJob, show_details: bool = False) -> None:
             render_job_details(job)
 
 
-def render_job_details(job: JenkinsJob) -> None:
+def render_job_details(
+    job: JenkinsJob,
+    display: JobDisplay | None = None,
+    details: JobDetails | None = None,
+) -> None:
     """Render detailed job information.
 
     Args:
         job: JenkinsJob object to display details for
+        display: Pre-formatted strings for the job; formatted on the fly if
+            not provided
+        details: Fetched full details; when given, its job replaces the
+            listing job and its recent builds are listed
     """
     st.markdown("---")
 
+    if details is not None:
+        job = details.job
+        display = None
+
     if job.last_build_number is None:
         st.info("This job has never been built.")
         return
 
+    if display is None:
+        display = build_job_display(job)
+
     col1, col2 = st.columns(2)
 
     with col1:
-        st.markdown(f"**Last Build:** #{job.last_build_number}")
-        if job.last_build_result:
-            st.markdown(f"**Result:** {job.last_build_result}")
+        st.markdown(f"**Last Build:** {display.build_label}")
+        if display.result:
+            st.markdown(f"**Result:** {display.result}")
 
     with col2:
-        if job.last_build_timestamp:
-            st.markdown(
-                f"**Time:** {job.last_build_timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
-            )
-        if job.last_build_duration_ms:
-            duration_s = job.last_build_duration_ms / 1000
-            if duration_s < 60:
-                duration_str = f"{duration_s:.1f}s"
-            else:
-                duration_str = f"{duration_s / 60:.1f}m"
-            st.markdown(f"**Duration:** {duration_str}")
+        if display.time:
+            st.markdown(f"**Time:** {display.time}")
+        if display.duration:
+            st.markdown(f"**Duration:** {display.duration}")
+
+    if details is not None and details.recent_builds:
+        st.markdown(_recent_builds_markdown(details))
 
     # Link to Jenkins
-    if job.url:
-        st.markdown(f"[View in Jenkins]({job.url})")
+    if display.url:
+        st.markdown(f"[View in Jenkins]({display.url})")
+
+
+def _recent_builds_markdown(details: JobDetails) -> str:
+    """Build a markdown table of a job's recent builds.
+
+    Args:
+        details: Fetched job details
+
+    Returns:
+        Markdown table source
+    """
+    lines = [
+        "| Build | Result | Time | Duration |",
+        "|---|---|---|---|",
+    ]
+    for build in details.recent_builds:
+        result = "BUILDING" if build.is_building else build.result or ""
+        timestamp = build.timestamp
+        lines.append(
+            f"| #{build.number} | {result} | "
+            f"{timestamp.strftime('%Y-%m-%d %H:%M') if timestamp else ''} | "
+            f"{format_duration(build.duration_ms) if build.duration_ms else ''} |"
+        )
+    return "\n".join(lines)
@@ -1,31 +1,107 @@
 """Job table component for the Jenkins Dashboard."""
 
+import re
+import time
+from collections.abc import Sequence
+from urllib.parse import quote
+
 import streamlit as st
 
-from components.job_card import get_status_emoji, render_job_details
-from models.job import JenkinsJob, JobStatus
+from components.job_card import JobDisplay, render_job_details
+from components.render_model import JobRenderModel
+from models.exceptions import (
+    JenkinsConnectionError,
+    JenkinsJobNotFoundError,
+    JobQueryError,
+)
+from models.job import JenkinsJob, JobDetails, JobStatus
+from services.job_details import JobDetailsCache
+from services.job_groups import (
+    GROUP_BY_OPTIONS,
+    JobGroup,
+    JobGrouping,
+    group_jobs,
+)
+from services.job_query import build_job_columns, compile_query, status_query
+from services.job_search import JobSearchIndex
+from services.job_view import RELEVANCE, JobViewCache, build_sort_keys, order_jobs
+
+# Page sizes offered by the job table
+PAGE_SIZE_OPTIONS = (25, 50, 100, 200)
+DEFAULT_PAGE_SIZE = 50
+
+SORT_OPTIONS = ("Name", "Status", "Last Build")
+VIEW_OPTIONS = ("Pages", "Table", "Groups", "Wallboard")
+
+# Rows shown inside one expanded group
+GROUP_ROWS_LIMIT = 200
+
+# Characters with a meaning in markdown tables, links and emphasis
+_MARKDOWN_SPECIAL = re.compile(r"([\\`*_\[\]()|<>#~$])")
+
+# URL characters left as they are in markdown link targets; everything else,
+# including spaces and parentheses, is percent-encoded
+_URL_SAFE = ":/?#&=%@+,;!'"
 
+QUERY_HELP = (
+    "Space-separated terms that must all match, e.g. "
+    "`status:failure,unstable folder:payments/* age>2h duration>10m "
+    "building:false`. Fields: status, result, folder, name, building, age, "
+    "duration, build. Prefix a term with `-` to negate it."
+)
 
-def render_job_table(jobs: list[JenkinsJob]) -> None:
+
+def render_job_table(
+    jobs: Sequence[JenkinsJob],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    *,
+    version: int | None = None,
+    view_cache: JobViewCache | None = None,
+    render_model: JobRenderModel | None = None,
+    details_cache: JobDetailsCache | None = None,
+) -> None:
     """Render a table of all Jenkins jobs.
 
+    Offers four views. "Pages" renders only the rows of the current page as
+    a single table, with details for one selected job at a time. "Table"
+    renders the whole list as one dataframe. "Groups" renders a page of
+    collapsible folder or prefix groups, filling in only the expanded ones.
+    "Wallboard" renders every job as a status tile in one HTML block. In
+    each view, the number of elements sent per rerun does not grow with the
+    number of jobs.
+
     Args:
         jobs: List of JenkinsJob objects to display
+        page_size: Default number of jobs per page
+        version: Version of the snapshot the jobs belong to
+        view_cache: Shared cache of orderings; used together with version so
+            sessions showing the same snapshot and controls share one sort
+        render_model: Shared display strings for the jobs; formatted on
+            demand for this rerun if not provided
+        details_cache: Shared cache the full details of a selected job are
+            fetched through; only listing fields are shown if not provided
     """
     if not jobs:
         st.info("No jobs found.")
         return
 
-    # Sort options
+    if render_model is None:
+        render_model = JobRenderModel(jobs, int(time.time() * 1000))
+
+    layout = st.radio("View", options=VIEW_OPTIONS, horizontal=True)
+
+    search = st.text_input(
+        "Search jobs",
+        placeholder="Job name, part of a name, or several words",
+    ).strip()
+
+    # Sort options; search results default to best match first
     sort_option = st.selectbox(
         "Sort by",
-        options=["Name", "Status", "Last Build"],
+        options=(RELEVANCE, *SORT_OPTIONS) if search else SORT_OPTIONS,
         index=0,
     )
 
-    # Sort jobs
-    sorted_jobs = _sort_jobs(jobs, sort_option)
-
     # Filter options
     filter_status = st.multiselect(
         "Filter by status",
@@ -33,99 +109,307 @@ def render_job_table(jobs: list[JenkinsJob]) -> None:
         default=[],
     )
 
-    # Apply filter
-    if filter_status:
-        filtered_jobs = [j for j in sorted_jobs if j.status.value in filter_status]
-    else:
-        filtered_jobs = sorted_jobs
+    query = st.text_input(
+        "Filter query",
+        placeholder="status:failure folder:payments/* age>2h",
+        help=QUERY_HELP,
+    ).strip()
 
-    st.markdown(f"Showing {len(filtered_jobs)} of {len(jobs)} jobs")
-    st.markdown("---")
+    # Search, sort and filter on precomputed keys
+    view = (jobs, version, view_cache, sort_option, filter_status, search)
+    try:
+        order = _order_view(*view, query)
+    except JobQueryError as e:
+        st.error(f"Invalid filter query: {e}")
+        order = _order_view(*view, "")
 
-    # Render each job as an expandable item
-    for job in filtered_jobs:
-        status_emoji = get_status_emoji(job.status)
-        build_info = f"#{job.last_build_number}" if job.last_build_number else "No builds"
+    if layout == "Table":
+        st.markdown(f"Showing {len(order)} of {len(jobs)} jobs")
+        _render_job_dataframe(render_model.columns(order))
+        return
 
-        with st.expander(f"{status_emoji} {job.name} - {job.status.value.upper()} ({build_info})"):
-            render_job_details(job)
+    if layout == "Wallboard":
+        st.markdown(f"Showing {len(order)} of {len(jobs)} jobs")
+        st.html(render_model.wallboard(order))
+        return
 
+    if layout == "Groups":
+        group_by = st.radio("Group by", options=GROUP_BY_OPTIONS, horizontal=True)
+        if view_cache is not None and version is not None:
+            grouping = view_cache.groups(version, jobs, group_by)
+        else:
+            grouping = group_jobs(build_job_columns(jobs), group_by)
+        _render_groups(grouping, order, group_by, render_model, page_size)
+        return
 
-def _sort_jobs(jobs: list[JenkinsJob], sort_by: str) -> list[JenkinsJob]:
-    """Sort jobs by the specified criteria.
+    page = render_pagination(order, len(jobs), page_size)
+    if not page:
+        return
+
+    st.markdown(_page_table_markdown([render_model.display(i) for i in page]))
+
+    # Render details for the selected job only
+    selected = st.selectbox(
+        "Job details",
+        options=page,
+        index=None,
+        format_func=lambda i: render_model.display(i).name,
+        placeholder="Select a job to show its details",
+    )
+    if selected is not None:
+        details = (
+            _fetch_details(details_cache, jobs[selected].name)
+            if details_cache is not None
+            else None
+        )
+        render_job_details(jobs[selected], render_model.display(selected), details)
+
+
+def _fetch_details(details_cache: JobDetailsCache, job_name: str) -> JobDetails | None:
+    """Fetch a job's full details, reporting failures in the page.
 
     Args:
-        jobs: List of jobs to sort
-        sort_by: Sort criteria ('Name', 'Status', 'Last Build')
+        details_cache: Shared job details cache
+        job_name: Name of the job
 
     Returns:
-        Sorted list of jobs
+        JobDetails, or None if they could not be fetched
+    """
+    details = details_cache.peek(job_name)
+    if details is not None:
+        return details
+    try:
+        with st.spinner("Loading job details..."):
+            return details_cache.get(job_name)
+    except (JenkinsConnectionError, JenkinsJobNotFoundError) as e:
+        st.warning(f"Could not load job details: {e}")
+        return None
+
+
+def _order_view(
+    jobs: Sequence[JenkinsJob],
+    version: int | None,
+    view_cache: JobViewCache | None,
+    sort_by: str,
+    filter_status: list[str],
+    search: str,
+    query: str,
+) -> Sequence[int]:
+    """Order jobs for the table controls, through the shared cache if given.
+
+    Returns:
+        Indices of the jobs to show, in display order
+
+    Raises:
+        JobQueryError: If the query cannot be parsed
+    """
+    if view_cache is not None and version is not None:
+        return view_cache.order(version, jobs, sort_by, filter_status, search, query)
+
+    compiled = compile_query(f"{status_query(filter_status)} {query}")
+    keys = build_sort_keys(jobs)
+    mask = compiled.mask(build_job_columns(jobs)) if compiled.predicates else None
+    matches = JobSearchIndex(keys.name).search(search) if search else None
+    return order_jobs(keys, sort_by, mask, matches)
+
+
+def render_pagination(
+    order: Sequence, total: int, page_size: int, noun: str = "jobs"
+) -> Sequence:
+    """Render page controls and return the items of the current page.
+
+    Args:
+        order: Sorted and filtered items, usually job indices
+        total: Number of items before filtering
+        page_size: Default number of items per page
+        noun: Plural name of the items, used in labels
+
+    Returns:
+        Items on the selected page
     """
-    if sort_by == "Name":
-        return sorted(jobs, key=lambda j: j.name.lower())
-    elif sort_by == "Status":
-        # Sort by status priority: FAILURE first, then BUILDING, then others
-        status_priority = {
-            JobStatus.FAILURE: 0,
-            JobStatus.BUILDING: 1,
-            JobStatus.UNSTABLE: 2,
-            JobStatus.SUCCESS: 3,
-            JobStatus.ABORTED: 4,
-            JobStatus.NOT_BUILT: 5,
-            JobStatus.DISABLED: 6,
-            JobStatus.UNKNOWN: 7,
-        }
-        return sorted(jobs, key=lambda j: status_priority.get(j.status, 99))
-    elif sort_by == "Last Build":
-        # Sort by last build number, newest first
-        return sorted(
-            jobs,
-            key=lambda j: j.last_build_number if j.last_build_number else 0,
-            reverse=True,
+    options = sorted({*PAGE_SIZE_OPTIONS, page_size})
+    col1, col2, col3 = st.columns([1, 1, 2])
+
+    with col1:
+        page_size = st.selectbox(
+            f"{noun.capitalize()} per page",
+            options=options,
+            index=options.index(page_size),
         )
-    return jobs
+
+    page_count = max(1, -(-len(order) // page_size))
+    with col2:
+        # max_value is part of the widget identity, so a shorter result
+        # list resets the page instead of pointing past its end
+        page = int(
+            st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+        )
+
+    start = (page - 1) * page_size
+    page_indices = order[start : start + page_size]
+
+    with col3:
+        if page_indices:
+            st.markdown(
+                f"Showing {start + 1}-{start + len(page_indices)} of "
+                f"{len(order)} {noun} ({total} total)"
+            )
+        else:
+            st.markdown(f"Showing 0 of {total} {noun}")
+
+    return page_indices
 
 
-def render_job_grid(jobs: list[JenkinsJob], columns: int = 3) -> None:
-    """Render jobs in a grid layout.
+def _render_groups(
+    grouping: JobGrouping,
+    order: Sequence[int],
+    group_by: str,
+    render_model: JobRenderModel,
+    page_size: int,
+) -> None:
+    """Render a page of collapsible job groups.
+
+    Group headers come from the precomputed grouping. Expanders track their
+    state, so only the rows of expanded groups are built and sent.
 
     Args:
-        jobs: List of JenkinsJob objects to display
-        columns: Number of columns in the grid
+        grouping: Groups of the snapshot's jobs
+        order: Indices of the sorted and filtered jobs
+        group_by: How the jobs are grouped, part of each expander's key
+        render_model: Display strings for the jobs
+        page_size: Default number of groups per page
     """
-    if not jobs:
-        st.info("No jobs found.")
-        return
+    parts = grouping.partition(order)
+    page = render_pagination(parts, len(grouping), page_size, noun="groups")
+
+    for group, indices in page:
+        expander = st.expander(
+            _group_label(group, len(indices)),
+            key=f"job-group-{group_by}-{group.key}",
+            on_change="rerun",
+        )
+        if not expander.open:
+            continue
+        rows = indices[:GROUP_ROWS_LIMIT]
+        with expander:
+            st.markdown(_page_table_markdown([render_model.display(i) for i in rows]))
+            if len(rows) < len(indices):
+                st.caption(
+                    f"Showing the first {len(rows)} of {len(indices)} jobs; "
+                    "narrow the group with a filter query or use the Table view."
+                )
+
+
+def _group_label(group: JobGroup, shown: int) -> str:
+    """Build the header of a job group.
+
+    Args:
+        group: Group with its counts
+        shown: Number of the group's jobs passing the current filters
+
+    Returns:
+        Expander label
+    """
+    jobs = f"{group.total} job" if group.total == 1 else f"{group.total} jobs"
+    if shown < group.total:
+        jobs = f"{shown} of {jobs}"
+    parts = [f"**{_markdown_text(group.key)}**", jobs]
+    if group.failure:
+        parts.append(f":x: {group.failure} failing")
+    if group.building:
+        parts.append(f":hourglass_flowing_sand: {group.building} building")
+    parts.append(f"{group.success_rate}% success")
+    return " · ".join(parts)
+
 
-    # Create grid
-    cols = st.columns(columns)
+def _page_table_markdown(displays: list[JobDisplay]) -> str:
+    """Build one markdown table for a page of jobs.
 
-    for idx, job in enumerate(jobs):
-        col_idx = idx % columns
-        with cols[col_idx]:
-            _render_grid_card(job)
+    Args:
+        displays: Display strings of the jobs on the current page
+
+    Returns:
+        Markdown table source
+    """
+    lines = [
+        "| | Job | Status | Last Build |",
+        "|---|---|---|---|",
+    ]
+    for display in displays:
+        name = _markdown_text(display.name)
+        if display.url:
+            name = f"[{name}]({quote(display.url, safe=_URL_SAFE)})"
+        lines.append(
+            f"| {display.emoji} | {name} | "
+            f"{display.status_text} | {display.build_label} |"
+        )
+    return "\n".join(lines)
 
 
-def _render_grid_card(job: JenkinsJob) -> None:
-    """Render a compact job card for grid display.
+def _markdown_text(text: str) -> str:
+    """Escape text so markdown shows it literally on one line.
 
     Args:
-        job: JenkinsJob object to display
+        text: Text from Jenkins, such as a job or folder name
+
+    Returns:
+        Text with markdown characters backslash-escaped and line breaks
+        replaced by spaces
     """
-    status_emoji = get_status_emoji(job.status)
+    return " ".join(_MARKDOWN_SPECIAL.sub(r"\\\1", text).splitlines())
 
-    with st.container():
-        st.markdown(f"### {status_emoji} {job.name}")
-        st.markdown(f"**Status:** {job.status.value.upper()}")
 
-        if job.last_build_number:
-            st.markdown(f"**Build:** #{job.last_build_number}")
-            if job.last_build_timestamp:
-                st.caption(job.last_build_timestamp.strftime("%m/%d %H:%M"))
-        else:
-            st.markdown("*No builds yet*")
+def _sort_jobs(jobs: Sequence[JenkinsJob], sort_by: str) -> list[JenkinsJob]:
+    """Sort jobs by the specified criteria.
 
-        if job.url:
-            st.markdown(f"[View]({job.url})")
+    Args:
+        jobs: List of jobs to sort
+        sort_by: Sort criteria ('Name', 'Status', 'Last Build')
+
+    Returns:
+        Sorted list of jobs
+    """
+    return [jobs[i] for i in order_jobs(build_sort_keys(jobs), sort_by)]
+
+
+def _render_job_dataframe(columns: dict[str, list]) -> None:
+    """Render jobs as a single dataframe.
+
+    Args:
+        columns: Column values from the render model
+    """
+    st.dataframe(
+        columns,
+        hide_index=True,
+        column_config={
+            "Build": st.column_config.NumberColumn("Build", format="#%d"),
+            "Link": st.column_config.LinkColumn("Link", display_text="Open"),
+        },
+    )
+
+
+def render_job_grid(
+    jobs: Sequence[JenkinsJob],
+    columns: int | None = None,
+    render_model: JobRenderModel | None = None,
+) -> None:
+    """Render jobs as a wallboard of status tiles.
+
+    The whole grid is a single HTML element. With a shared render model it is
+    built once per snapshot, so the auto-refresh loop's reruns resend the same
+    content until the job data changes.
+
+    Args:
+        jobs: List of JenkinsJob objects to display
+        columns: Number of tile columns; tiles are sized to fit the screen if
+            None
+        render_model: Shared display strings for the jobs; formatted for this
+            call if not provided
+    """
+    if not jobs:
+        st.info("No jobs found.")
+        return
 
-        st.markdown("---")
+    if render_model is None:
+        render_model = JobRenderModel(jobs, int(time.time() * 1000))
+    st.html(render_model.wallboard(columns=columns))
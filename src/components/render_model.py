@@ -0,0 +1,234 @@
+"""Per-snapshot render model shared by all sessions.
+
+Display strings (emoji, status labels, build labels, formatted times and
+durations) depend only on the snapshot, so they are formatted once per
+snapshot version instead of once per job, per session, per rerun.
+
+Relative build times ("5m ago") also depend on the clock. A snapshot stays
+current for as long as Jenkins reports no change, so render models are kept
+per snapshot version and minute: the model of a new minute reuses the other
+strings of the snapshot's previous model and only redoes the relative times.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import replace
+
+from components.job_card import JobDisplay, build_job_display, format_relative_time
+from components.wallboard import build_wallboard_html
+from models.job import JenkinsJob
+from services.snapshot import JobSnapshot
+
+# Render models kept (the live snapshot's plus a few past ones)
+RENDER_MODEL_CACHE_SIZE = 4
+
+# Milliseconds a render model's relative build times are reused
+RELATIVE_TIME_RESOLUTION_MS = 60_000
+
+# Dataframe column sets kept per render model, one per distinct ordering
+COLUMN_CACHE_SIZE = 8
+
+# Wallboards kept per render model, one per distinct ordering and layout
+WALLBOARD_CACHE_SIZE = 4
+
+
+class JobRenderModel:
+    """Lazily formatted display strings for a job list.
+
+    Each job is formatted at most once, on first access. Relative build times
+    are computed against the reference time given at construction, so they
+    stay consistent for everyone viewing the model.
+    """
+
+    def __init__(
+        self,
+        jobs: Sequence[JenkinsJob],
+        now_ms: int,
+        base: "JobRenderModel | None" = None,
+    ) -> None:
+        """Initialize an empty model.
+
+        Args:
+            jobs: Jobs to format
+            now_ms: Reference time for relative build times in epoch
+                milliseconds
+            base: Model of the same jobs at an earlier reference time, whose
+                formatted jobs are reused with new relative times
+        """
+        self._jobs = jobs
+        self._now_ms = now_ms
+        self._displays: list[JobDisplay | None] = [None] * len(jobs)
+        self._base = base._displays if base is not None else None
+        self._columns: OrderedDict[int, tuple[Sequence[int], dict[str, list]]] = (
+            OrderedDict()
+        )
+        self._wallboards: OrderedDict[
+            tuple[int | None, int | None], tuple[Sequence[int] | None, str]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of jobs."""
+        return len(self._displays)
+
+    def display(self, index: int) -> JobDisplay:
+        """Get the display strings of the job at an index.
+
+        Args:
+            index: Index into the job list
+
+        Returns:
+            JobDisplay for the job
+        """
+        display = self._displays[index]
+        if display is not None:
+            return display
+
+        job = self._jobs[index]
+        base = self._base[index] if self._base is not None else None
+        if base is None:
+            display = build_job_display(job, self._now_ms)
+        elif job.last_build_timestamp_ms:
+            display = replace(
+                base,
+                relative_time=format_relative_time(
+                    job.last_build_timestamp_ms, self._now_ms
+                ),
+            )
+        else:
+            display = base
+        self._displays[index] = display
+        return display
+
+    def columns(self, order: Sequence[int]) -> dict[str, list]:
+        """Get dataframe columns for jobs in a display order.
+
+        Columns are cached per ordering object, so orderings shared through
+        the view cache also share their columns.
+
+        Args:
+            order: Indices of the jobs to include, in display order
+
+        Returns:
+            Mapping of column name to values; callers must not modify it
+        """
+        with self._lock:
+            entry = self._columns.get(id(order))
+            if entry is not None and entry[0] is order:
+                self._columns.move_to_end(id(order))
+                return entry[1]
+
+        columns: dict[str, list] = {
+            "Status": [],
+            "Job": [],
+            "Build": [],
+            "Result": [],
+            "Duration": [],
+            "Last Run": [],
+            "Link": [],
+        }
+        for i in order:
+            display = self.display(i)
+            columns["Status"].append(f"{display.icon} {display.status_text}")
+            columns["Job"].append(display.name)
+            columns["Build"].append(self._jobs[i].last_build_number)
+            columns["Result"].append(display.result)
+            columns["Duration"].append(display.duration)
+            columns["Last Run"].append(display.relative_time)
+            columns["Link"].append(display.url or None)
+
+        with self._lock:
+            # Keeping the ordering referenced keeps its id from being reused
+            self._columns[id(order)] = (order, columns)
+            if len(self._columns) > COLUMN_CACHE_SIZE:
+                self._columns.popitem(last=False)
+        return columns
+
+    def wallboard(
+        self, order: Sequence[int] | None = None, columns: int | None = None
+    ) -> str:
+        """Get the wallboard HTML for jobs in a display order.
+
+        Wallboards are cached per ordering object and column count, so
+        reruns showing an unchanged snapshot send identical HTML.
+
+        Args:
+            order: Indices of the jobs to include, in display order; all jobs
+                in list order if None
+            columns: Fixed number of tile columns; as many as fit if None
+
+        Returns:
+            HTML of the wallboard
+        """
+        key = (None if order is None else id(order), columns)
+        with self._lock:
+            entry = self._wallboards.get(key)
+            if entry is not None and entry[0] is order:
+                self._wallboards.move_to_end(key)
+                return entry[1]
+
+        indices = range(len(self)) if order is None else order
+        board = build_wallboard_html(
+            (self.display(i) for i in indices), len(indices), columns
+        )
+
+        with self._lock:
+            self._wallboards[key] = (order, board)
+            if len(self._wallboards) > WALLBOARD_CACHE_SIZE:
+                self._wallboards.popitem(last=False)
+        return board
+
+
+class RenderModelCache:
+    """Process-wide cache of render models keyed by snapshot version and minute."""
+
+    def __init__(self, max_entries: int = RENDER_MODEL_CACHE_SIZE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Number of render models kept before the least
+                recently used one is evicted
+        """
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._models: OrderedDict[tuple[int, int], JobRenderModel] = OrderedDict()
+
+    def get(self, snapshot: JobSnapshot, now_ms: int | None = None) -> JobRenderModel:
+        """Get the render model of a snapshot, creating it on first use.
+
+        Args:
+            snapshot: Snapshot to render
+            now_ms: Current time in epoch milliseconds (default: now); relative
+                build times are computed against the start of its minute
+
+        Returns:
+            JobRenderModel shared by every caller asking for this snapshot
+            within the same minute
+        """
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        bucket = now_ms // RELATIVE_TIME_RESOLUTION_MS
+        key = (snapshot.version, bucket)
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                return model
+
+            # The snapshot's most recent model of an earlier minute, if any
+            base = next(
+                (
+                    m
+                    for (version, _), m in reversed(self._models.items())
+                    if version == snapshot.version
+                ),
+                None,
+            )
+            model = self._models[key] = JobRenderModel(
+                snapshot.jobs, bucket * RELATIVE_TIME_RESOLUTION_MS, base
+            )
+            if len(self._models) > self._max_entries:
+                self._models.popitem(last=False)
+            return model
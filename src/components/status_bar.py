@@ -1,19 +1,35 @@
 """Status bar component for the Jenkins Dashboard."""
 
+import time
+
 import streamlit as st
 
+from models.history import Resolution
 from models.state import DashboardState
 from services.dashboard import calculate_statistics
+from services.history import StatsHistory
+
+# Window used for metric deltas
+TREND_WINDOW = 3600  # seconds
+
+# Time span shown in the success rate sparkline
+SPARKLINE_WINDOW = 24 * 3600  # seconds
 
 
-def render_status_bar(state: DashboardState) -> None:
+def render_status_bar(
+    state: DashboardState, history: StatsHistory | None = None
+) -> None:
     """Render the status bar showing job statistics.
 
     Args:
         state: Current dashboard state
+        history: Statistics history used for trends and sparklines (optional)
     """
     stats = calculate_statistics(state.jobs)
 
+    def trend(field: str) -> float | None:
+        return history.delta(field, TREND_WINDOW) if history else None
+
     # Create columns for metrics
     col1, col2, col3, col4, col5 = st.columns(5)
 
@@ -21,27 +37,30 @@ def render_status_bar(state: DashboardState) -> None:
         st.metric(
             label="Total Jobs",
             value=stats["total"],
+            delta=trend("total"),
         )
 
     with col2:
         st.metric(
             label="Success",
             value=stats["success"],
-            delta=None,
+            delta=trend("success"),
         )
 
     with col3:
         st.metric(
             label="Failed",
             value=stats["failure"],
-            delta=None,
+            delta=trend("failure"),
+            delta_color="inverse",
         )
 
     with col4:
         st.metric(
             label="Building",
             value=stats["building"],
-            delta=None,
+            delta=trend("building"),
+            delta_color="off",
         )
 
     with col5:
@@ -64,6 +83,24 @@ def render_status_bar(state: DashboardState) -> None:
         text=f"Success Rate: {success_rate}%",
     )
 
+    if history is not None:
+        _render_success_rate_sparkline(history)
+
+
+def _render_success_rate_sparkline(history: StatsHistory) -> None:
+    """Render the success rate trend from 1-minute rollups.
+
+    Args:
+        history: Statistics history to read from
+    """
+    since = int(time.time()) - SPARKLINE_WINDOW
+    rates = history.series("success_rate", Resolution.MINUTE, since=since)
+    if len(rates) < 2:
+        return
+
+    st.caption("Success rate, last 24 hours")
+    st.line_chart(rates, height=100)
+
 
 def render_connection_status(state: DashboardState) -> None:
     """Render connection status warning if Jenkins is unavailable.
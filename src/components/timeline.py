@@ -0,0 +1,51 @@
+"""Timeline playback component for the Jenkins Dashboard."""
+
+from datetime import timedelta
+
+import streamlit as st
+
+from services.snapshot import JobSnapshot
+from services.timeline import SnapshotTimeline
+
+# Slider granularity, matching the polling interval
+TIMELINE_STEP = timedelta(seconds=30)
+
+
+def render_timeline_controls(timeline: SnapshotTimeline) -> JobSnapshot | None:
+    """Render the time travel toggle and slider.
+
+    Args:
+        timeline: Snapshot timeline to replay from
+
+    Returns:
+        Reconstructed snapshot for the selected moment, or None when showing
+        live data
+    """
+    bounds = timeline.bounds()
+    if bounds is None or bounds[0] == bounds[1]:
+        return None
+
+    if not st.toggle("Time travel", key="time_travel"):
+        return None
+
+    first, last = bounds
+    moment = st.slider(
+        "Show the board as of",
+        min_value=first,
+        max_value=last,
+        value=last,
+        step=TIMELINE_STEP,
+        format="YYYY-MM-DD HH:mm:ss",
+        key="time_travel_moment",
+    )
+    snapshot = timeline.snapshot_at(moment)
+    if snapshot is None:
+        st.warning("No recorded data for that time.")
+        return None
+
+    st.info(
+        f"Viewing the board as of "
+        f"{snapshot.created_at.strftime('%Y-%m-%d %H:%M:%S')}. "
+        f"Auto-refresh is paused."
+    )
+    return snapshot
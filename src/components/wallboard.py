@@ -0,0 +1,104 @@
+"""Wallboard rendering for the Jenkins Dashboard.
+
+The wallboard shows every job as a colored status tile. The whole grid is
+built as a single HTML block, so a board of hundreds of jobs is one element
+instead of several per job. Tiles are sized from the number of jobs so the
+board fits the screen.
+"""
+
+import html
+import math
+from collections.abc import Iterable
+
+from components.job_card import JobDisplay
+
+# Screen area the tiles are sized to fill, in CSS pixels
+WALLBOARD_AREA = (1800, 900)
+
+# Smallest and largest tile width, in CSS pixels
+MIN_TILE_WIDTH = 72
+MAX_TILE_WIDTH = 260
+
+# Tile background per status, keyed by JobDisplay.status_text
+TILE_COLORS = {
+    "SUCCESS": "#2e7d32",
+    "FAILURE": "#c62828",
+    "UNSTABLE": "#ef6c00",
+    "BUILDING": "#1565c0",
+    "DISABLED": "#616161",
+    "NOT_BUILT": "#757575",
+    "ABORTED": "#5d4037",
+    "UNKNOWN": "#757575",
+}
+
+_STYLE = (
+    "<style>"
+    ".wallboard{{display:grid;gap:4px;grid-template-columns:{columns}}}"
+    ".wallboard .tile{{border-radius:4px;color:#fff;padding:4px 6px;"
+    "min-height:{height}px;overflow:hidden;font-size:{font}px;line-height:1.25}}"
+    ".wallboard .tile a{{color:inherit;text-decoration:none;font-weight:600;"
+    "display:block;white-space:nowrap;overflow:hidden;text-overflow:ellipsis}}"
+    ".wallboard .tile span{{display:block;opacity:.85;white-space:nowrap;"
+    "overflow:hidden;text-overflow:ellipsis}}"
+    "</style>"
+)
+
+
+def tile_width(count: int) -> int:
+    """Get the tile width that lets a number of tiles fill the wallboard area.
+
+    Args:
+        count: Number of tiles
+
+    Returns:
+        Tile width in CSS pixels
+    """
+    width, height = WALLBOARD_AREA
+    # Tiles are twice as wide as they are high
+    side = math.sqrt(width * height * 2 / max(count, 1))
+    return max(MIN_TILE_WIDTH, min(MAX_TILE_WIDTH, int(side)))
+
+
+def build_wallboard_html(
+    displays: Iterable[JobDisplay], count: int, columns: int | None = None
+) -> str:
+    """Build the HTML of a wallboard.
+
+    Args:
+        displays: Display strings of the jobs, in tile order
+        count: Number of jobs, used to size the tiles
+        columns: Fixed number of tile columns; as many as fit if None
+
+    Returns:
+        HTML with its own stylesheet, on a single line so it is not parsed
+        as markdown
+    """
+    width = tile_width(count)
+    if columns is None:
+        template = f"repeat(auto-fill,minmax({width}px,1fr))"
+    else:
+        template = f"repeat({columns},minmax(0,1fr))"
+    parts = [
+        _STYLE.format(
+            columns=template, height=width // 2, font=max(10, min(14, width // 12))
+        ),
+        '<div class="wallboard">',
+    ]
+    for display in displays:
+        name = html.escape(display.name)
+        color = TILE_COLORS.get(display.status_text, TILE_COLORS["UNKNOWN"])
+        label = (
+            f'<a href="{html.escape(display.url)}" target="_blank">{name}</a>'
+            if display.url
+            else f"<a>{name}</a>"
+        )
+        details = " · ".join(
+            part for part in (display.build_label, display.relative_time) if part
+        )
+        parts.append(
+            f'<div class="tile" style="background:{color}" '
+            f'title="{name} ({display.status_text})">'
+            f"{label}<span>{html.escape(details)}</span></div>"
+        )
+    parts.append("</div>")
+    return "".join(parts)
@@ -3,11 +3,14 @@
 from models.audit import AuditAction, AuditLogEntry, AuditResult
 from models.exceptions import (
     AuthorizationError,
+    DirectoryUnavailableError,
     JenkinsAuthError,
     JenkinsConnectionError,
     JenkinsJobNotFoundError,
+    JobCodecError,
+    JobQueryError,
 )
-from models.job import JenkinsJob, JobStatus
+from models.job import BuildSummary, JenkinsJob, JobDetails, JobStatus
 from models.state import DashboardState
 from models.user import User
 
@@ -16,11 +19,16 @@ __all__ = [
     "AuditLogEntry",
     "AuditResult",
     "AuthorizationError",
+    "BuildSummary",
     "DashboardState",
+    "DirectoryUnavailableError",
     "JenkinsAuthError",
     "JenkinsConnectionError",
     "JenkinsJob",
     "JenkinsJobNotFoundError",
+    "JobDetails",
+    "JobQueryError",
+    "JobCodecError",
     "JobStatus",
     "User",
 ]
@@ -23,3 +23,21 @@ class AuthorizationError(Exception):
     """Raised when a user does not have permission to access a resource."""
 
     pass
+
+
+class JobCodecError(Exception):
+    """Raised when an encoded job list cannot be decoded."""
+
+    pass
+
+
+class JobQueryError(Exception):
+    """Raised when a job filter query cannot be parsed."""
+
+    pass
+
+
+class DirectoryUnavailableError(Exception):
+    """Raised when no directory connection becomes available in time."""
+
+    pass
@@ -0,0 +1,31 @@
+"""History-related models for dashboard statistics."""
+
+from dataclasses import dataclass
+from enum import Enum
+
+
+class Resolution(Enum):
+    """Time resolutions kept by the statistics history.
+
+    The value is the bucket size in seconds; raw samples use 0.
+    """
+
+    RAW = 0
+    MINUTE = 60
+    HOUR = 3600
+    DAY = 86400
+
+
+@dataclass(frozen=True, slots=True)
+class StatsPoint:
+    """Dashboard statistics for one poll or one rollup bucket.
+
+    For rollups, counts and success rate are averages over the bucket and
+    health is the worst health seen in it.
+    """
+
+    timestamp: int  # epoch seconds; bucket start for rollups
+    samples: int
+    counts: dict[str, float]
+    success_rate: float
+    health: str
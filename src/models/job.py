@@ -1,6 +1,7 @@
 """Job-related models for the Jenkins Dashboard."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
@@ -18,15 +19,176 @@ class JobStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Path segment Jenkins puts before each job or folder name in a URL
+_JOB_SEGMENT = "/job/"
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern a string so equal values across snapshots share one object."""
+    return sys.intern(value) if value is not None else None
+
+
+def _split_url(name: str, url: str) -> tuple[str, str | None]:
+    """Split a job URL into its folder prefix and the job's own segment.
+
+    The prefix (everything up to the last "/job/") is the same for every job
+    of a folder and is interned, so it is stored once. The segment is None
+    when it is the last part of the job name followed by "/", as Jenkins
+    builds it, so nothing of the URL is stored per job; any other URL keeps
+    its segment.
+
+    Returns:
+        Interned prefix, and the segment or None
+    """
+    cut = url.rfind(_JOB_SEGMENT)
+    if cut < 0:
+        return sys.intern(url), ""
+    cut += len(_JOB_SEGMENT)
+    leaf = name.rfind("/") + 1
+    if (
+        len(url) - cut == len(name) - leaf + 1
+        and url.startswith(name[leaf:], cut)
+        and url.endswith("/")
+    ):
+        return sys.intern(url[:cut]), None
+    return sys.intern(url[:cut]), sys.intern(url[cut:])
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class JenkinsJob:
-    """Represents a Jenkins build job with its current status."""
+    """Represents a Jenkins build job with its current status.
+
+    Instances are slotted and immutable. The build timestamp is stored as
+    epoch milliseconds and converted to a datetime only when read. The name
+    and result strings are interned so jobs repeated across snapshots share
+    them. The URL is stored as its interned folder prefix, shared by every
+    job of the folder, and rebuilt from the prefix and the name when read.
+    """
 
     name: str
-    url: str
+    _url_prefix: str = field(repr=False)
+    _url_leaf: str | None = field(repr=False)
     status: JobStatus
     last_build_number: int | None
     last_build_result: str | None
-    last_build_timestamp: datetime | None
+    last_build_timestamp_ms: int | None
     last_build_duration_ms: int | None
     is_building: bool
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        status: JobStatus,
+        last_build_number: int | None,
+        last_build_result: str | None,
+        last_build_timestamp: datetime | None = None,
+        last_build_duration_ms: int | None = None,
+        is_building: bool = False,
+        *,
+        last_build_timestamp_ms: int | None = None,
+    ) -> None:
+        """Initialize a job.
+
+        Args:
+            name: Full job name, including folders (e.g. "payments/api")
+            url: Job URL in Jenkins
+            status: Current job status
+            last_build_number: Number of the last build, if any
+            last_build_result: Result string of the last build, if any
+            last_build_timestamp: Start time of the last build (local time)
+            last_build_duration_ms: Duration of the last build in milliseconds
+            is_building: Whether a build is currently running
+            last_build_timestamp_ms: Start time as epoch milliseconds; used
+                instead of last_build_timestamp when given
+        """
+        if last_build_timestamp_ms is None and last_build_timestamp is not None:
+            last_build_timestamp_ms = round(last_build_timestamp.timestamp() * 1000)
+
+        url_prefix, url_leaf = _split_url(name, url)
+        setattr_ = object.__setattr__
+        setattr_(self, "name", sys.intern(name))
+        setattr_(self, "_url_prefix", url_prefix)
+        setattr_(self, "_url_leaf", url_leaf)
+        setattr_(self, "status", status)
+        setattr_(self, "last_build_number", last_build_number)
+        setattr_(self, "last_build_result", _intern(last_build_result))
+        setattr_(self, "last_build_timestamp_ms", last_build_timestamp_ms)
+        setattr_(self, "last_build_duration_ms", last_build_duration_ms)
+        setattr_(self, "is_building", is_building)
+
+    @property
+    def url(self) -> str:
+        """Job URL in Jenkins."""
+        leaf = self._url_leaf
+        if leaf is None:
+            leaf = self.name[self.name.rfind("/") + 1 :] + "/"
+        return self._url_prefix + leaf
+
+    @property
+    def last_build_timestamp(self) -> datetime | None:
+        """Start time of the last build as a local datetime."""
+        if self.last_build_timestamp_ms is None:
+            return None
+        return datetime.fromtimestamp(self.last_build_timestamp_ms / 1000)
+
+    @classmethod
+    def from_fields(
+        cls,
+        name: str,
+        url: str,
+        status: JobStatus,
+        last_build_number: int | None,
+        last_build_result: str | None,
+        last_build_timestamp_ms: int | None,
+        last_build_duration_ms: int | None,
+        is_building: bool,
+    ) -> "JenkinsJob":
+        """Create a job from stored field values without conversion.
+
+        Used when restoring jobs from an encoded snapshot, whose strings are
+        already interned and whose timestamp is already in epoch milliseconds;
+        only the URL is split into its folder prefix.
+
+        Returns:
+            New JenkinsJob instance
+        """
+        url_prefix, url_leaf = _split_url(name, url)
+        job = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(job, "name", name)
+        setattr_(job, "_url_prefix", url_prefix)
+        setattr_(job, "_url_leaf", url_leaf)
+        setattr_(job, "status", status)
+        setattr_(job, "last_build_number", last_build_number)
+        setattr_(job, "last_build_result", last_build_result)
+        setattr_(job, "last_build_timestamp_ms", last_build_timestamp_ms)
+        setattr_(job, "last_build_duration_ms", last_build_duration_ms)
+        setattr_(job, "is_building", is_building)
+        return job
+
+
+@dataclass(frozen=True, slots=True)
+class BuildSummary:
+    """Summary of one build of a job."""
+
+    number: int
+    result: str | None
+    timestamp_ms: int | None
+    duration_ms: int | None
+    is_building: bool = False
+
+    @property
+    def timestamp(self) -> datetime | None:
+        """Start time of the build as a local datetime."""
+        if self.timestamp_ms is None:
+            return None
+        return datetime.fromtimestamp(self.timestamp_ms / 1000)
+
+
+@dataclass(frozen=True, slots=True)
+class JobDetails:
+    """Full details of a job, fetched on demand rather than with the listing."""
+
+    job: JenkinsJob
+    recent_builds: tuple[BuildSummary, ...]  # newest first
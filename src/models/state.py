@@ -1,16 +1,17 @@
 """Dashboard state model for the Jenkins Dashboard."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 
 from models.job import JenkinsJob
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DashboardState:
     """Represents the current state of the dashboard."""
 
-    jobs: list[JenkinsJob]
+    jobs: Sequence[JenkinsJob]
     last_refresh: datetime
     is_jenkins_available: bool
     error_message: str | None
@@ -13,6 +13,17 @@ class WhitelistEntry:
     added_at: datetime
     added_by: str
     active: bool = True
+    deactivated_at: datetime | None = None
+
+
+@dataclass
+class WhitelistGroup:
+    """Represents a directory group whose members may access the dashboard."""
+
+    name: str
+    added_at: datetime
+    added_by: str
+    active: bool = True
 
 
 @dataclass
@@ -24,3 +35,32 @@ class Whitelist:
     updated_by: str
     users: list[WhitelistEntry] = field(default_factory=list)
     admins: list[WhitelistEntry] = field(default_factory=list)
+    groups: list[WhitelistGroup] = field(default_factory=list)
+
+
+@dataclass
+class BulkImportReport:
+    """Outcome of a bulk whitelist import, as lists of emails per result."""
+
+    added: list[str] = field(default_factory=list)
+    reactivated: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)  # already active or repeated
+    invalid: list[str] = field(default_factory=list)  # rejected rows with reason
+
+    @property
+    def changed(self) -> bool:
+        """Whether the import changed the whitelist."""
+        return bool(self.added or self.reactivated)
+
+    def summary(self) -> dict[str, str]:
+        """Count the entries per result, for the audit log.
+
+        Returns:
+            Dictionary of result name to count.
+        """
+        return {
+            "added": str(len(self.added)),
+            "reactivated": str(len(self.reactivated)),
+            "skipped": str(len(self.skipped)),
+            "invalid": str(len(self.invalid)),
+        }
@@ -12,7 +12,8 @@ from dotenv import load_dotenv
 from components.admin.audit_viewer import render_audit_viewer
 from components.admin.user_management import render_user_management
 from services.audit import AuditService
-from services.whitelist import WhitelistService
+from services.directory import DirectoryClient
+from services.whitelist import create_whitelist_service
 
 # Load environment variables
 load_dotenv()
@@ -20,9 +21,13 @@ load_dotenv()
 # Check demo mode
 DEMO_MODE = os.environ.get("DEMO_MODE", "false").lower() == "true"
 
+# Directory for the user picker and group imports; only demo mode has one
+ldap_service: DirectoryClient | None = None
+
 if DEMO_MODE:
     from services.mock_auth import (
         get_client_ip,
+        ldap_service,
         mock_authenticate_user as authenticate_user,
         mock_logout_user as logout_user,
         render_demo_login_page as render_login_page,
@@ -43,7 +48,7 @@ st.set_page_config(
 )
 
 # Services
-whitelist_service = WhitelistService()
+whitelist_service = create_whitelist_service()
 audit_service = AuditService()
 
 
@@ -87,7 +92,7 @@ def render_admin_dashboard(user) -> None:
     tab1, tab2 = st.tabs(["User Management", "Audit Logs"])
 
     with tab1:
-        render_user_management(user, whitelist_service, audit_service)
+        render_user_management(user, whitelist_service, audit_service, ldap_service)
 
     with tab2:
         render_audit_viewer()
@@ -7,9 +7,24 @@ import streamlit as st
 from models.audit import AuditAction, AuditResult
 from models.user import User
 from services.audit import log_event
-from services.whitelist import WhitelistService
+from services.group_access import GroupAccess
+from services.whitelist import create_whitelist_service
 
-whitelist_service = WhitelistService()
+whitelist_service = create_whitelist_service()
+# SSO group claims are in User.roles; there is no directory to expand groups
+group_access = GroupAccess(whitelist_service)
+
+
+def get_user_identity() -> str | None:
+    """Get the email the current session is logged in as, without a lookup.
+
+    Returns:
+        Email if logged in via SSO, None otherwise.
+    """
+    if not hasattr(st, "user") or not st.user.is_logged_in:
+        return None
+    email = st.user.get("email", "")
+    return email if isinstance(email, str) else ""
 
 
 def authenticate_user() -> User | None:
@@ -21,7 +36,7 @@ def authenticate_user() -> User | None:
     if not hasattr(st, "user") or not st.user.is_logged_in:
         return None
 
-    email = st.user.get("email", "")
+    email = get_user_identity() or ""
     is_admin = whitelist_service.is_admin(email)
 
     return User(
@@ -35,15 +50,18 @@ def authenticate_user() -> User | None:
 
 
 def check_authorization(user: User) -> bool:
-    """Check if user email is in the whitelist.
+    """Check if user email is in the whitelist or in an allowed group.
 
     Args:
         user: The user to check.
 
     Returns:
-        True if user is whitelisted, False otherwise.
+        True if user is whitelisted directly or through a group, False
+        otherwise.
     """
-    return whitelist_service.is_user_allowed(user.email)
+    if whitelist_service.is_user_allowed(user.email):
+        return True
+    return group_access.is_allowed(user)
 
 
 def logout_user(user: User, ip_address: str = "") -> None:
@@ -0,0 +1,85 @@
+"""Per-session caching of authentication and authorization.
+
+The dashboard checks who the user is and whether they are whitelisted on
+every rerun. The result is kept in session state, tagged with the identity
+it was computed for and the whitelist version it was checked against, and
+reused until either changes or AUTH_CACHE_TTL passes. A rerun then costs a
+version comparison, while a whitelist edit (such as a revocation) is picked
+up on the next rerun after the whitelist service notices it.
+"""
+
+import time
+from collections.abc import Callable, MutableMapping
+from dataclasses import dataclass
+from typing import Any
+
+from models.user import User
+
+# Session state key of the cached result
+SESSION_AUTH_KEY = "session_auth"
+
+# Seconds a result is reused even if the whitelist version does not change
+AUTH_CACHE_TTL = 300
+
+
+@dataclass(frozen=True)
+class SessionAuth:
+    """Authentication and authorization result of a session."""
+
+    identity: str
+    user: User
+    authorized: bool
+    whitelist_version: int
+    expires_at: float  # monotonic time
+
+
+def authorize_session(
+    state: MutableMapping[Any, Any],
+    identity: str | None,
+    whitelist_version: int,
+    authenticate: Callable[[], User | None],
+    authorize: Callable[[User], bool],
+    ttl: float = AUTH_CACHE_TTL,
+) -> tuple[User | None, bool]:
+    """Authenticate and authorize the session, reusing a still valid result.
+
+    Args:
+        state: Session state to keep the result in (st.session_state, whose
+            keys may also be ints, or a plain dict)
+        identity: Email the session is logged in as, or None if logged out
+        whitelist_version: Current whitelist version
+        authenticate: Builds the User of the session
+        authorize: Checks whether a User may use the dashboard
+        ttl: Seconds a result is reused at most
+
+    Returns:
+        Tuple of (User, or None if not logged in; whether it is authorized)
+    """
+    if identity is None:
+        state.pop(SESSION_AUTH_KEY, None)
+        return None, False
+
+    now = time.monotonic()
+    cached = state.get(SESSION_AUTH_KEY)
+    if (
+        cached is not None
+        and cached.identity == identity
+        and cached.whitelist_version == whitelist_version
+        and now < cached.expires_at
+    ):
+        return cached.user, cached.authorized
+
+    user = authenticate()
+    if user is None:
+        state.pop(SESSION_AUTH_KEY, None)
+        return None, False
+
+    authorized = authorize(user)
+    state[SESSION_AUTH_KEY] = SessionAuth(
+        identity=identity,
+        user=user,
+        authorized=authorized,
+        whitelist_version=whitelist_version,
+        expires_at=now + ttl,
+    )
+    return user, authorized
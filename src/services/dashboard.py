@@ -1,12 +1,14 @@
 """Dashboard state service for the Jenkins Dashboard."""
 
+from collections.abc import Sequence
 from datetime import datetime
 
 from models.job import JenkinsJob, JobStatus
 from models.state import DashboardState
+from services.job_codec import EncodedJobList
 
 
-def calculate_statistics(jobs: list[JenkinsJob]) -> dict:
+def calculate_statistics(jobs: Sequence[JenkinsJob]) -> dict:
     """Calculate statistics from a list of Jenkins jobs.
 
     Args:
@@ -49,10 +51,15 @@ def calculate_statistics(jobs: list[JenkinsJob]) -> dict:
         "unknown": 0,
     }
 
-    for job in jobs:
-        status_key = job.status.value
-        if status_key in status_counts:
-            status_counts[status_key] += 1
+    if isinstance(jobs, EncodedJobList):
+        # Counts are stored in the payload header; no job needs decoding
+        for status, count in jobs.status_counts().items():
+            status_counts[status.value] = count
+    else:
+        for job in jobs:
+            status_key = job.status.value
+            if status_key in status_counts:
+                status_counts[status_key] += 1
 
     total = len(jobs)
     success = status_counts["success"]
@@ -90,7 +97,7 @@ class DashboardService:
 
     def __init__(
         self,
-        jobs: list[JenkinsJob] | None = None,
+        jobs: Sequence[JenkinsJob] | None = None,
         is_available: bool = True,
         error_message: str | None = None,
     ) -> None:
@@ -101,7 +108,7 @@ class DashboardService:
             is_available: Whether Jenkins is available (default: True)
             error_message: Error message if Jenkins is unavailable
         """
-        self._jobs = jobs if jobs is not None else []
+        self._jobs: Sequence[JenkinsJob] = jobs if jobs is not None else []
         self._is_available = is_available
         self._error_message = error_message
         self._last_refresh = datetime.now()
@@ -125,7 +132,7 @@ class DashboardService:
             building_count=stats["building"],
         )
 
-    def update_jobs(self, jobs: list[JenkinsJob]) -> None:
+    def update_jobs(self, jobs: Sequence[JenkinsJob]) -> None:
         """Update the job list and refresh timestamp.
 
         Args:
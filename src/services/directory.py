@@ -0,0 +1,268 @@
+"""Directory (LDAP) client with connection pooling and lookup caching.
+
+Demo authentication looks the user up in the directory on every rerun. On a
+real LDAP server each lookup is a bind and a search, so CachedDirectory puts
+two things in front of the directory connections:
+
+- a bounded pool, so concurrent sessions share a few bound connections
+  instead of opening one per request, and
+- an LRU cache with a TTL for user lookups, including negative results for
+  unknown emails, so reruns within the TTL make no directory calls.
+
+Authentication and searches always go to the directory. Group member lists
+are cached by services.group_access.
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from models.exceptions import DirectoryUnavailableError
+from services.mock_ldap import (
+    MOCK_LDAP_USERS,
+    LDAPUser,
+    MockDirectory,
+    MockLDAPService,
+    generate_directory,
+)
+
+# Environment variable setting the simulated directory latency in
+# milliseconds (demo mode)
+MOCK_LDAP_LATENCY_ENV = "MOCK_LDAP_LATENCY_MS"
+
+# Environment variable adding this many generated people to the demo
+# directory (demo mode)
+MOCK_LDAP_DIRECTORY_SIZE_ENV = "MOCK_LDAP_DIRECTORY_SIZE"
+
+# Directory connections kept open
+DIRECTORY_POOL_SIZE = 4
+
+# Seconds to wait for a free connection before giving up
+DIRECTORY_POOL_TIMEOUT = 10
+
+# User lookups kept, and seconds a found or missing user is reused
+USER_CACHE_SIZE = 1024
+USER_CACHE_TTL = 300
+NEGATIVE_CACHE_TTL = 60
+
+
+class DirectoryConnectionPool:
+    """Bounded pool of directory connections, opened on demand."""
+
+    def __init__(
+        self,
+        connect: Callable[[], MockLDAPService],
+        size: int = DIRECTORY_POOL_SIZE,
+        timeout: float = DIRECTORY_POOL_TIMEOUT,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            connect: Opens (binds) a new directory connection
+            size: Most connections open at once
+            timeout: Seconds to wait for a connection when all are in use
+        """
+        self._connect = connect
+        self._size = size
+        self._timeout = timeout
+        self._idle: queue.LifoQueue[MockLDAPService] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    @contextmanager
+    def connection(self) -> Iterator[MockLDAPService]:
+        """Borrow a connection for the duration of a with block.
+
+        Yields:
+            A connection no other caller is using
+
+        Raises:
+            DirectoryUnavailableError: If no connection frees up in time
+        """
+        connection = self._acquire()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def _acquire(self) -> MockLDAPService:
+        """Take an idle connection, open a new one, or wait for one."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_open = self.opened < self._size
+            if can_open:
+                self.opened += 1
+        if can_open:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self.opened -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self._timeout)
+        except queue.Empty:
+            raise DirectoryUnavailableError(
+                f"No directory connection free after {self._timeout}s"
+            ) from None
+
+
+class CachedDirectory:
+    """Directory client with the MockLDAPService interface, pooled and cached."""
+
+    def __init__(
+        self,
+        pool: DirectoryConnectionPool,
+        cache_size: int = USER_CACHE_SIZE,
+        ttl: float = USER_CACHE_TTL,
+        negative_ttl: float = NEGATIVE_CACHE_TTL,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            pool: Connections to the directory
+            cache_size: User lookups kept before the least recently used one
+                is evicted
+            ttl: Seconds a found user is reused
+            negative_ttl: Seconds an unknown email is remembered as unknown
+        """
+        self._pool = pool
+        self._cache_size = cache_size
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._users: OrderedDict[str, tuple[float, LDAPUser | None]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def authenticate(self, email: str, password: str) -> LDAPUser | None:
+        """Authenticate against the directory; never cached.
+
+        Args:
+            email: User email address.
+            password: User password.
+
+        Returns:
+            LDAPUser if authenticated, None otherwise.
+        """
+        with self._pool.connection() as connection:
+            user = connection.authenticate(email, password)
+        if user is not None:
+            self._store(email.lower(), user, time.monotonic())
+        return user
+
+    def lookup_user(self, email: str) -> LDAPUser | None:
+        """Look up user by email, from the cache if fresh.
+
+        Args:
+            email: User email address.
+
+        Returns:
+            LDAPUser if found, None otherwise.
+        """
+        key = email.lower()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._users.get(key)
+            if entry is not None and entry[0] > now:
+                self._users.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        with self._pool.connection() as connection:
+            user = connection.lookup_user(email)
+        self._store(key, user, now)
+        return user
+
+    def get_user_groups(self, email: str) -> list[str]:
+        """Get groups for a user, from the cached lookup.
+
+        Args:
+            email: User email address.
+
+        Returns:
+            List of group names, empty list if user not found.
+        """
+        user = self.lookup_user(email)
+        return list(user.groups) if user else []
+
+    def search_users(self, query: str, limit: int | None = None) -> list[LDAPUser]:
+        """Search for users matching query; never cached.
+
+        Args:
+            query: Search string to match against email or name.
+            limit: Most users returned; all matches if None.
+
+        Returns:
+            List of matching LDAPUser objects, best match first.
+        """
+        with self._pool.connection() as connection:
+            return connection.search_users(query, limit)
+
+    def get_group_members(self, group: str) -> list[LDAPUser]:
+        """Get the members of a group; never cached here.
+
+        Args:
+            group: Group name.
+
+        Returns:
+            List of LDAPUser objects in the group, empty list if none.
+        """
+        with self._pool.connection() as connection:
+            return connection.get_group_members(group)
+
+    def invalidate(self, email: str | None = None) -> None:
+        """Forget cached lookups.
+
+        Args:
+            email: Email to forget; every lookup if None.
+        """
+        with self._lock:
+            if email is None:
+                self._users.clear()
+            else:
+                self._users.pop(email.lower(), None)
+
+    def _store(self, key: str, user: LDAPUser | None, now: float) -> None:
+        """Cache a lookup result, evicting the least recently used one."""
+        expires_at = now + (self._ttl if user is not None else self._negative_ttl)
+        with self._lock:
+            self._users[key] = (expires_at, user)
+            self._users.move_to_end(key)
+            if len(self._users) > self._cache_size:
+                self._users.popitem(last=False)
+
+
+# Either directory client; both have the MockLDAPService interface
+DirectoryClient = MockLDAPService | CachedDirectory
+
+
+def create_mock_directory() -> CachedDirectory:
+    """Create the demo directory client.
+
+    The simulated latency per directory call is read from
+    MOCK_LDAP_LATENCY_MS (default 0), and MOCK_LDAP_DIRECTORY_SIZE generated
+    people are added to the demo users (default 0).
+
+    Returns:
+        CachedDirectory over pooled MockLDAPService connections sharing one
+        directory.
+    """
+    latency = float(os.environ.get(MOCK_LDAP_LATENCY_ENV, "0")) / 1000
+    size = int(os.environ.get(MOCK_LDAP_DIRECTORY_SIZE_ENV, "0"))
+    directory = MockDirectory([*MOCK_LDAP_USERS.values(), *generate_directory(size)])
+    return CachedDirectory(
+        DirectoryConnectionPool(
+            lambda: MockLDAPService(latency=latency, directory=directory)
+        )
+    )
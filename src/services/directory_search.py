@@ -0,0 +1,139 @@
+"""Directory search index for the admin user picker.
+
+Each person is indexed under their full email and under the tokens of the
+email's local part and display name (the parts between separators such as
+"." and spaces), all kept in one sorted list of (key, email) pairs. A query
+term matches keys it is a prefix of, found by binary search, so typing
+"ali", "chen" or "alice.c" narrows the picker without scanning the
+directory.
+
+Keys and queries are case-folded and stripped of accents, so "jose" finds
+"José" and "zoe" finds "Zoë"; tokens are runs of letters and digits in any
+script.
+
+Every whitespace-separated term of a query must match. The term with the
+fewest matching keys drives the search and the others are checked against
+each candidate's own keys; candidates come out in key order, so exact token
+matches rank first, and the search stops once it has enough results.
+
+People are added, updated and removed one at a time, so a directory change
+only moves the affected keys.
+"""
+
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+
+_TOKEN_SPLIT = re.compile(r"[\W_]+")
+
+
+def _fold(text: str) -> str:
+    """Case-fold text and strip its accents for matching."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _keys(email: str, name: str) -> tuple[str, ...]:
+    """Get the search keys of a person."""
+    email = _fold(email)
+    local_part = email.partition("@")[0]
+    tokens = _TOKEN_SPLIT.split(f"{local_part} {_fold(name)}")
+    return tuple(sorted({email, *(token for token in tokens if token)}))
+
+
+class DirectorySearchIndex:
+    """Incrementally maintained prefix index over emails and names."""
+
+    def __init__(self, people: Iterable[tuple[str, str]] = ()) -> None:
+        """Build the index.
+
+        Args:
+            people: (email, display name) pairs
+        """
+        self._lock = threading.Lock()
+        self._people: dict[str, tuple[str, ...]] = {}
+        for email, name in people:
+            self._people[email.lower()] = _keys(email.lower(), name)
+        self._entries = sorted(
+            (key, email) for email, keys in self._people.items() for key in keys
+        )
+
+    def __len__(self) -> int:
+        """Return the number of indexed people."""
+        return len(self._people)
+
+    def add(self, email: str, name: str) -> None:
+        """Index a person, replacing their entry if already indexed.
+
+        Args:
+            email: Email address
+            name: Display name
+        """
+        email = email.lower()
+        keys = _keys(email, name)
+        with self._lock:
+            if self._people.get(email) == keys:
+                return
+            self._remove_locked(email)
+            self._people[email] = keys
+            for key in keys:
+                insort(self._entries, (key, email))
+
+    def remove(self, email: str) -> None:
+        """Drop a person from the index.
+
+        Args:
+            email: Email address; ignored if not indexed
+        """
+        with self._lock:
+            self._remove_locked(email.lower())
+
+    def search(self, query: str, limit: int | None = None) -> list[str]:
+        """Find people matching a query.
+
+        Args:
+            query: Search text; every whitespace-separated term must be a
+                prefix of the email or of an email or name token
+            limit: Most results returned; all matches if None
+
+        Returns:
+            Lower-cased emails of the matches, best match first; empty for a
+            blank query
+        """
+        terms = _fold(query).split()
+        if not terms:
+            return []
+
+        with self._lock:
+            entries = self._entries
+            ranges = {term: self._range(term) for term in terms}
+            driver = min(ranges, key=lambda term: ranges[term][1] - ranges[term][0])
+            start, end = ranges.pop(driver)
+            others = list(ranges)
+
+            results: dict[str, None] = {}
+            for position in range(start, end):
+                email = entries[position][1]
+                if email in results:
+                    continue
+                keys = self._people[email]
+                if all(any(key.startswith(term) for key in keys) for term in others):
+                    results[email] = None
+                    if limit is not None and len(results) >= limit:
+                        break
+        return list(results)
+
+    def _range(self, term: str) -> tuple[int, int]:
+        """Get the positions of the entries whose key starts with a term."""
+        start = bisect_left(self._entries, (term,))
+        # Every key starting with term sorts below term + the highest char
+        end = bisect_left(self._entries, (term + "\U0010ffff",), lo=start)
+        return start, end
+
+    def _remove_locked(self, email: str) -> None:
+        """Remove a person's entries. Caller must hold the lock."""
+        for key in self._people.pop(email, ()):
+            position = bisect_left(self._entries, (key, email))
+            del self._entries[position]
@@ -0,0 +1,204 @@
+"""Group-based access rules.
+
+Besides individual emails, the whitelist holds directory groups whose
+members may use the dashboard. A user is allowed through a group if the
+group is among their roles (SSO ``groups`` claim, directory groups in demo
+mode) or, where a directory is available, if the directory lists them as a
+member.
+
+Directory group expansions are cached for GROUP_CACHE_TTL seconds together
+with a reverse member -> groups index, so checking a user does no directory
+calls while the expansions are fresh. When the group rules change, only the
+expansions of the groups that were added or removed are dropped.
+
+If the directory cannot be reached, a group's last expansion keeps being
+used and is retried after GROUP_RETRY_DELAY seconds; a group that was never
+fetched is cached as empty for that delay, so it grants no access and checks
+do not call the directory again until the retry. Each group's outage is
+logged once, when it starts, and again when the directory answers.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from models.user import User
+from services.whitelist import WhitelistBackend
+
+# Seconds a directory group expansion is reused
+GROUP_CACHE_TTL = 300
+
+# Seconds a stale or empty expansion is reused after a failed directory lookup
+GROUP_RETRY_DELAY = 30
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Expansion:
+    """Members of a group and when they were fetched."""
+
+    members: frozenset[str]
+    expires_at: float  # monotonic time
+
+
+class GroupMembershipCache:
+    """TTL cache of directory group members with a reverse index."""
+
+    def __init__(
+        self,
+        fetch_members: Callable[[str], Iterable[str]],
+        ttl: float = GROUP_CACHE_TTL,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            fetch_members: Looks up the member emails of a group in the
+                directory
+            ttl: Seconds an expansion is reused
+        """
+        self._fetch_members = fetch_members
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._expansions: dict[str, _Expansion] = {}
+        self._member_groups: dict[str, set[str]] = {}
+        self._failing: set[str] = set()
+        self.fetches = 0
+
+    def groups_of(self, email: str, groups: Iterable[str]) -> set[str]:
+        """Get which of some groups list an email as a member.
+
+        Args:
+            email: Member email
+            groups: Normalized names of the groups to consider
+
+        Returns:
+            The groups among those given that contain the email
+        """
+        groups = set(groups)
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                group
+                for group in groups
+                if (expansion := self._expansions.get(group)) is None
+                or expansion.expires_at <= now
+            ]
+        for group in stale:
+            self._refresh(group, now)
+
+        with self._lock:
+            return self._member_groups.get(email.lower(), set()) & groups
+
+    def invalidate(self, groups: Iterable[str]) -> None:
+        """Drop the expansions of some groups.
+
+        Args:
+            groups: Normalized group names
+        """
+        with self._lock:
+            for group in groups:
+                self._drop_locked(group)
+                self._failing.discard(group)
+
+    def _refresh(self, group: str, now: float) -> None:
+        """Fetch a group's members and update the reverse index.
+
+        A failed lookup keeps the group's previous expansion, or an empty one
+        if it was never fetched, until the retry delay has passed.
+        """
+        try:
+            members = frozenset(email.lower() for email in self._fetch_members(group))
+        except Exception:
+            with self._lock:
+                first_failure = group not in self._failing
+                self._failing.add(group)
+                expansion = self._expansions.get(group)
+                self._expansions[group] = _Expansion(
+                    expansion.members if expansion is not None else frozenset(),
+                    now + GROUP_RETRY_DELAY,
+                )
+            if first_failure:
+                logger.exception(
+                    "Could not fetch members of group %s, retrying every %ss",
+                    group,
+                    GROUP_RETRY_DELAY,
+                )
+            else:
+                logger.debug("Members of group %s are still unavailable", group)
+            return
+
+        with self._lock:
+            self.fetches += 1
+            recovered = group in self._failing
+            self._failing.discard(group)
+            self._drop_locked(group)
+            self._expansions[group] = _Expansion(members, now + self._ttl)
+            for member in members:
+                self._member_groups.setdefault(member, set()).add(group)
+        if recovered:
+            logger.info("Fetched members of group %s again", group)
+
+    def _drop_locked(self, group: str) -> None:
+        """Remove a group's expansion. Caller must hold the lock."""
+        expansion = self._expansions.pop(group, None)
+        if expansion is None:
+            return
+        for member in expansion.members:
+            groups = self._member_groups.get(member)
+            if groups is not None:
+                groups.discard(group)
+                if not groups:
+                    del self._member_groups[member]
+
+
+class GroupAccess:
+    """Checks users against the whitelist's group rules."""
+
+    def __init__(
+        self,
+        whitelist_service: WhitelistBackend,
+        memberships: GroupMembershipCache | None = None,
+    ) -> None:
+        """Initialize the checker.
+
+        Args:
+            whitelist_service: Whitelist holding the group rules
+            memberships: Directory group expansions; only roles are checked
+                if None
+        """
+        self._whitelist = whitelist_service
+        self._memberships = memberships
+        self._rules: frozenset[str] = frozenset()
+        self._lock = threading.Lock()
+
+    def is_allowed(self, user: User) -> bool:
+        """Check whether a user belongs to an allowed group.
+
+        Args:
+            user: User to check
+
+        Returns:
+            True if one of the user's roles, or a directory group listing
+            the user, is an allowed group
+        """
+        rules = self._current_rules()
+        if not rules:
+            return False
+        if any(role.strip().lower() in rules for role in user.roles):
+            return True
+        if self._memberships is None:
+            return False
+        return bool(self._memberships.groups_of(user.email, rules))
+
+    def _current_rules(self) -> frozenset[str]:
+        """Get the allowed groups, invalidating expansions of changed rules."""
+        rules = self._whitelist.allowed_groups()
+        with self._lock:
+            changed = rules ^ self._rules
+            self._rules = rules
+        if changed and self._memberships is not None:
+            self._memberships.invalidate(changed)
+        return rules
@@ -0,0 +1,360 @@
+"""Time-series history of dashboard statistics.
+
+Every poll's aggregate statistics are kept in in-memory ring buffers backed by
+SQLite. Raw samples roll up automatically into 1-minute, 1-hour and 1-day
+buckets, each resolution with its own bounded retention, so trends can be
+read without rescanning raw history. Open buckets are written on every
+record and reopened on load, so a restart does not lose them. Per-job status
+is stored as a log of status changes rather than a full copy per poll.
+"""
+
+import sqlite3
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
+
+from models.history import Resolution, StatsPoint
+from models.job import JenkinsJob, JobStatus
+
+# Default history database path
+HISTORY_DB_PATH = Path("history/dashboard_history.db")
+
+# How long each resolution is kept
+RETENTION_SECONDS: dict[Resolution, int] = {
+    Resolution.RAW: 6 * 3600,
+    Resolution.MINUTE: 24 * 3600,
+    Resolution.HOUR: 30 * 86400,
+    Resolution.DAY: 365 * 86400,
+}
+
+# Raw samples kept in memory (6 hours of 30 second polls)
+RAW_BUFFER_SIZE = 720
+
+JOB_STATUS_RETENTION_SECONDS = 30 * 86400
+
+COUNT_KEYS = ("total", *(status.value for status in JobStatus))
+
+_HEALTH_RANK = {"healthy": 0, "warning": 1, "critical": 2}
+
+_ROLLUPS = (Resolution.MINUTE, Resolution.HOUR, Resolution.DAY)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stats (
+    resolution INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    success_rate REAL NOT NULL,
+    health TEXT NOT NULL,
+    {count_columns},
+    PRIMARY KEY (resolution, ts)
+);
+CREATE TABLE IF NOT EXISTS job_status (
+    ts INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS job_status_ts ON job_status (ts);
+""".format(count_columns=",\n    ".join(f"{key} REAL NOT NULL" for key in COUNT_KEYS))
+
+
+class _Bucket:
+    """Accumulator for one open rollup bucket."""
+
+    def __init__(self, start: int) -> None:
+        self.start = start
+        self.samples = 0
+        self.sums = dict.fromkeys(COUNT_KEYS, 0.0)
+        self.rate_sum = 0.0
+        self.health = "healthy"
+
+    def add(self, point: StatsPoint) -> None:
+        self.samples += 1
+        for key in COUNT_KEYS:
+            self.sums[key] += point.counts[key]
+        self.rate_sum += point.success_rate
+        if _HEALTH_RANK[point.health] > _HEALTH_RANK[self.health]:
+            self.health = point.health
+
+    @classmethod
+    def from_point(cls, point: StatsPoint) -> "_Bucket":
+        bucket = cls(point.timestamp)
+        bucket.samples = point.samples
+        bucket.sums = {key: v * point.samples for key, v in point.counts.items()}
+        bucket.rate_sum = point.success_rate * point.samples
+        bucket.health = point.health
+        return bucket
+
+    def to_point(self) -> StatsPoint:
+        return StatsPoint(
+            timestamp=self.start,
+            samples=self.samples,
+            counts={key: round(v / self.samples, 2) for key, v in self.sums.items()},
+            success_rate=round(self.rate_sum / self.samples, 1),
+            health=self.health,
+        )
+
+
+class StatsHistory:
+    """Ring-buffered, SQLite-backed history of dashboard statistics."""
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        """Open (or create) the history store.
+
+        Args:
+            path: SQLite database path, or ":memory:". Uses default if not
+                provided.
+        """
+        path = path or HISTORY_DB_PATH
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+        self._rings: dict[Resolution, deque[StatsPoint]] = {
+            resolution: deque(maxlen=self._ring_size(resolution))
+            for resolution in Resolution
+        }
+        self._buckets: dict[Resolution, _Bucket | None] = dict.fromkeys(_ROLLUPS)
+        self._job_statuses: dict[str, str] = {}
+        self._load()
+
+    def record(
+        self,
+        stats: dict,
+        jobs: Iterable[JenkinsJob],
+        timestamp: int | None = None,
+    ) -> StatsPoint:
+        """Record one poll.
+
+        Args:
+            stats: Output of calculate_statistics for the poll
+            jobs: Jobs of the poll, used to log per-job status changes
+            timestamp: Poll time in epoch seconds (default: now)
+
+        Returns:
+            The raw StatsPoint that was recorded
+        """
+        ts = int(time.time()) if timestamp is None else timestamp
+        point = StatsPoint(
+            timestamp=ts,
+            samples=1,
+            counts={key: float(stats[key]) for key in COUNT_KEYS},
+            success_rate=float(stats["success_rate"]),
+            health=stats["health"],
+        )
+
+        with self._lock:
+            rows = [(Resolution.RAW, point)]
+            closed = {Resolution.RAW}
+            self._rings[Resolution.RAW].append(point)
+
+            for resolution in _ROLLUPS:
+                start = ts - ts % resolution.value
+                bucket = self._buckets[resolution]
+                if bucket is not None and bucket.start != start:
+                    closed_point = bucket.to_point()
+                    self._rings[resolution].append(closed_point)
+                    rows.append((resolution, closed_point))
+                    closed.add(resolution)
+                    bucket = None
+                if bucket is None:
+                    bucket = self._buckets[resolution] = _Bucket(start)
+                bucket.add(point)
+                rows.append((resolution, bucket.to_point()))
+
+            changes = []
+            for job in jobs:
+                status = job.status.value
+                if self._job_statuses.get(job.name) != status:
+                    self._job_statuses[job.name] = status
+                    changes.append((ts, job.name, status))
+
+            self._persist(rows, changes, ts, closed)
+
+        return point
+
+    def points(
+        self, resolution: Resolution, since: int | None = None
+    ) -> list[StatsPoint]:
+        """Get points at a resolution, oldest first.
+
+        Rollup resolutions include the still-open bucket as the last point.
+
+        Args:
+            resolution: Resolution to read
+            since: Only include points at or after this epoch second
+
+        Returns:
+            List of StatsPoint objects
+        """
+        with self._lock:
+            points = list(self._rings[resolution])
+            bucket = self._buckets.get(resolution)
+            if bucket is not None:
+                points.append(bucket.to_point())
+
+        if since is not None:
+            points = points[bisect_right([p.timestamp for p in points], since - 1) :]
+        return points
+
+    def series(
+        self, field: str, resolution: Resolution, since: int | None = None
+    ) -> list[float]:
+        """Get one field's values at a resolution, oldest first.
+
+        Args:
+            field: A count key (e.g. "failure", "total") or "success_rate"
+            resolution: Resolution to read
+            since: Only include points at or after this epoch second
+
+        Returns:
+            List of values
+        """
+        return [_field(p, field) for p in self.points(resolution, since)]
+
+    def delta(self, field: str, window: int, now: int | None = None) -> float | None:
+        """Get how much a field changed over a time window.
+
+        Uses the finest resolution that still covers the start of the window.
+
+        Args:
+            field: A count key or "success_rate"
+            window: Window length in seconds
+            now: Reference epoch second (default: now)
+
+        Returns:
+            Latest value minus the value at the window start, or None if the
+            history does not reach that far back
+        """
+        target = (int(time.time()) if now is None else now) - window
+        with self._lock:
+            if not self._rings[Resolution.RAW]:
+                return None
+            latest = self._rings[Resolution.RAW][-1]
+            for resolution in Resolution:
+                ring = self._rings[resolution]
+                if ring and ring[0].timestamp <= target:
+                    index = bisect_right([p.timestamp for p in ring], target) - 1
+                    return round(_field(latest, field) - _field(ring[index], field), 1)
+        return None
+
+    def job_changes(self, since: int) -> list[tuple[int, str, str]]:
+        """Get per-job status changes since a point in time.
+
+        Args:
+            since: Epoch second to start from
+
+        Returns:
+            List of (timestamp, job name, status value), oldest first
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT ts, name, status FROM job_status WHERE ts >= ? ORDER BY ts",
+                (since,),
+            )
+            return cursor.fetchall()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _ring_size(resolution: Resolution) -> int:
+        """Number of points kept in memory for a resolution."""
+        if resolution is Resolution.RAW:
+            return RAW_BUFFER_SIZE
+        return RETENTION_SECONDS[resolution] // int(resolution.value)
+
+    def _load(self) -> None:
+        """Fill ring buffers, open buckets and last job statuses from the database.
+
+        The latest point of each rollup resolution is reopened as its bucket;
+        if that bucket has already ended, the next record closes it again.
+        """
+        columns = ", ".join(COUNT_KEYS)
+        for resolution, ring in self._rings.items():
+            rows = self._conn.execute(
+                f"SELECT ts, samples, success_rate, health, {columns} FROM stats "
+                "WHERE resolution = ? ORDER BY ts DESC LIMIT ?",
+                (resolution.value, ring.maxlen),
+            ).fetchall()
+            for ts, samples, rate, health, *counts in reversed(rows):
+                ring.append(
+                    StatsPoint(
+                        timestamp=ts,
+                        samples=samples,
+                        counts=dict(zip(COUNT_KEYS, counts, strict=True)),
+                        success_rate=rate,
+                        health=health,
+                    )
+                )
+
+        for resolution in _ROLLUPS:
+            ring = self._rings[resolution]
+            if ring:
+                self._buckets[resolution] = _Bucket.from_point(ring.pop())
+
+        # SQLite returns the row holding MAX(ts) for the bare status column
+        for name, status, _ in self._conn.execute(
+            "SELECT name, status, MAX(ts) FROM job_status GROUP BY name"
+        ):
+            self._job_statuses[name] = status
+
+    def _persist(
+        self,
+        rows: list[tuple[Resolution, StatsPoint]],
+        changes: list[tuple[int, str, str]],
+        now: int,
+        closed: set[Resolution],
+    ) -> None:
+        """Write new and open points and status changes.
+
+        Expired rows are pruned for the resolutions that closed a point.
+        """
+        columns = ", ".join(COUNT_KEYS)
+        placeholders = ", ".join("?" * (len(COUNT_KEYS) + 5))
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO stats (resolution, ts, samples, "
+                f"success_rate, health, {columns}) VALUES ({placeholders})",
+                [
+                    (
+                        resolution.value,
+                        p.timestamp,
+                        p.samples,
+                        p.success_rate,
+                        p.health,
+                        *(p.counts[key] for key in COUNT_KEYS),
+                    )
+                    for resolution, p in rows
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO job_status (ts, name, status) VALUES (?, ?, ?)",
+                changes,
+            )
+            for resolution in closed:
+                self._conn.execute(
+                    "DELETE FROM stats WHERE resolution = ? AND ts < ?",
+                    (resolution.value, now - RETENTION_SECONDS[resolution]),
+                )
+            if Resolution.HOUR in closed:
+                # Keep each job's latest change so statuses survive restarts
+                self._conn.execute(
+                    "DELETE FROM job_status WHERE ts < ? AND rowid NOT IN "
+                    "(SELECT MAX(rowid) FROM job_status GROUP BY name)",
+                    (now - JOB_STATUS_RETENTION_SECONDS,),
+                )
+
+
+def _field(point: StatsPoint, field: str) -> float:
+    """Read a count or the success rate from a point."""
+    if field == "success_rate":
+        return point.success_rate
+    return point.counts[field]
@@ -1,7 +1,6 @@
 """Jenkins API service for the Dashboard."""
 
 import os
-from datetime import datetime
 
 import jenkins
 
@@ -9,7 +8,17 @@ from models.exceptions import (
     JenkinsConnectionError,
     JenkinsJobNotFoundError,
 )
-from models.job import JenkinsJob, JobStatus
+from models.job import BuildSummary, JenkinsJob, JobDetails, JobStatus
+
+# Number of builds included in job details
+RECENT_BUILDS_LIMIT = 10
+
+# Folder levels fetched per job listing request
+FOLDER_DEPTH_PER_REQUEST = 10
+
+# Fields requested per job in the listing; the last build's fields come with
+# it, so listing all jobs needs no request per job
+_LISTING_FIELDS = "url,color,name,lastBuild[number,result,timestamp,duration,building]"
 
 
 def color_to_status(color: str) -> JobStatus:
@@ -62,6 +71,11 @@ class JenkinsService:
     def get_all_jobs(self) -> list[JenkinsJob]:
         """Fetch all Jenkins jobs with their current status.
 
+        The listing asks Jenkins for each job's last build through the tree
+        parameter, so it costs one request per FOLDER_DEPTH_PER_REQUEST folder
+        levels regardless of the number of jobs. The recent builds of a job
+        are fetched on demand with get_job_details_with_builds.
+
         Returns:
             List of JenkinsJob objects
 
@@ -70,7 +84,7 @@ class JenkinsService:
         """
         try:
             server = self._get_server()
-            raw_jobs = server.get_all_jobs()
+            raw_jobs = self._list_raw_jobs(server)
 
             jobs: list[JenkinsJob] = []
             for raw_job in raw_jobs:
@@ -109,38 +123,113 @@ class JenkinsService:
                 raise JenkinsJobNotFoundError(f"Job '{job_name}' not found") from e
             raise JenkinsConnectionError(f"Failed to get job details: {e}") from e
 
+    def get_job_details_with_builds(
+        self, job_name: str, limit: int = RECENT_BUILDS_LIMIT
+    ) -> JobDetails:
+        """Fetch a job's details together with its recent builds.
+
+        Args:
+            job_name: Name of the Jenkins job
+            limit: Maximum number of recent builds to include
+
+        Returns:
+            JobDetails with builds newest first
+
+        Raises:
+            JenkinsJobNotFoundError: If the job does not exist
+            JenkinsConnectionError: If unable to connect to Jenkins
+        """
+        try:
+            server = self._get_server()
+            job_info = server.get_job_info(job_name)
+            job = self._parse_job_info(job_info)
+
+            builds: list[BuildSummary] = []
+            for build in (job_info.get("builds") or [])[:limit]:
+                try:
+                    build_info = server.get_build_info(job_name, build["number"])
+                except Exception:
+                    # Skip builds whose details cannot be fetched
+                    continue
+                builds.append(
+                    BuildSummary(
+                        number=build_info.get("number", build["number"]),
+                        result=build_info.get("result"),
+                        timestamp_ms=build_info.get("timestamp") or None,
+                        duration_ms=build_info.get("duration"),
+                        is_building=build_info.get("building", False),
+                    )
+                )
+            return JobDetails(job=job, recent_builds=tuple(builds))
+        except jenkins.NotFoundException as e:
+            raise JenkinsJobNotFoundError(f"Job '{job_name}' not found") from e
+        except Exception as e:
+            if "not found" in str(e).lower() or "404" in str(e):
+                raise JenkinsJobNotFoundError(f"Job '{job_name}' not found") from e
+            raise JenkinsConnectionError(f"Failed to get job details: {e}") from e
+
+    def _list_raw_jobs(self, server: jenkins.Jenkins) -> list[dict]:
+        """List all jobs in all folders with their last build.
+
+        Works like python-jenkins' get_all_jobs, with the last build added to
+        the requested fields. Folders are walked but not listed themselves.
+
+        Args:
+            server: Jenkins server connection
+
+        Returns:
+            Raw job dictionaries, each with a "fullname" folder path
+        """
+        tree = "jobs"
+        for _ in range(FOLDER_DEPTH_PER_REQUEST):
+            tree = f"jobs[{_LISTING_FIELDS},{tree}]"
+        query = f"?tree={tree}"
+
+        raw_jobs: list[dict] = []
+        pending: list[tuple[list[str], list[dict]]] = [
+            ([], server.get_info(query=query)["jobs"])
+        ]
+        # Folders found while walking are appended, so the walk is breadth-first
+        for path, items in pending:
+            for item in items:
+                item_path = [*path, item["name"]]
+                item.setdefault("fullname", "/".join(item_path))
+                children = item.get("jobs")
+                if not isinstance(children, list):
+                    raw_jobs.append(item)
+                    continue
+                # Below the fetched depth Jenkins returns empty objects
+                if any("url" not in child for child in children):
+                    folder_url = "".join(f"/job/{part}" for part in item_path)
+                    children = server.get_info(folder_url, query=query)["jobs"]
+                pending.append((item_path, children))
+        return raw_jobs
+
     def _parse_job(self, raw_job: dict) -> JenkinsJob:
-        """Parse raw job data from get_all_jobs into JenkinsJob.
+        """Parse a raw job from the job listing into a JenkinsJob.
 
         Args:
-            raw_job: Raw job dictionary from Jenkins API
+            raw_job: Raw job dictionary from the listing, with its last build
 
         Returns:
             Parsed JenkinsJob object
         """
-        name = raw_job.get("name", "")
+        # Full path, so jobs in folders keep their folder and stay unique
+        name = raw_job.get("fullname") or raw_job.get("name", "")
         url = raw_job.get("url", "")
         color = raw_job.get("color", "")
+        last_build = raw_job.get("lastBuild") or {}
 
-        status = color_to_status(color)
-        is_building = "_anime" in color
-
-        # Get full job info for build details
-        try:
-            job_info = self._get_server().get_job_info(name)
-            return self._parse_job_info(job_info)
-        except Exception:
-            # Return basic info if we can't get full details
-            return JenkinsJob(
-                name=name,
-                url=url,
-                status=status,
-                last_build_number=None,
-                last_build_result=None,
-                last_build_timestamp=None,
-                last_build_duration_ms=None,
-                is_building=is_building,
-            )
+        return JenkinsJob(
+            name=name,
+            url=url,
+            status=color_to_status(color),
+            last_build_number=last_build.get("number"),
+            last_build_result=last_build.get("result"),
+            last_build_duration_ms=last_build.get("duration"),
+            is_building="_anime" in color or bool(last_build.get("building")),
+            last_build_timestamp_ms=last_build.get("timestamp") or None,
+        )
 
     def _parse_job_info(self, job_info: dict) -> JenkinsJob:
         """Parse full job info into JenkinsJob.
@@ -151,7 +240,7 @@ class JenkinsService:
         Returns:
             Parsed JenkinsJob object
         """
-        name = job_info.get("name", "")
+        name = job_info.get("fullName") or job_info.get("name", "")
         url = job_info.get("url", "")
         color = job_info.get("color", "")
 
@@ -161,7 +250,7 @@ class JenkinsService:
         last_build = job_info.get("lastBuild")
         last_build_number: int | None = None
         last_build_result: str | None = None
-        last_build_timestamp: datetime | None = None
+        last_build_timestamp_ms: int | None = None
         last_build_duration_ms: int | None = None
 
         if last_build:
@@ -173,9 +262,7 @@ class JenkinsService:
                 last_build_result = build_info.get("result")
                 is_building = build_info.get("building", False)
 
-                timestamp_ms = build_info.get("timestamp")
-                if timestamp_ms:
-                    last_build_timestamp = datetime.fromtimestamp(timestamp_ms / 1000)
+                last_build_timestamp_ms = build_info.get("timestamp") or None
 
                 last_build_duration_ms = build_info.get("duration")
             except Exception:
@@ -188,7 +275,7 @@ class JenkinsService:
             status=status,
             last_build_number=last_build_number,
             last_build_result=last_build_result,
-            last_build_timestamp=last_build_timestamp,
             last_build_duration_ms=last_build_duration_ms,
             is_building=is_building,
+            last_build_timestamp_ms=last_build_timestamp_ms,
         )
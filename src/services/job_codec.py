@@ -0,0 +1,286 @@
+"""Binary codec for Jenkins job lists.
+
+Layout (little endian)::
+
+    header   magic "JJLC", schema version (u16), job count (u32),
+             string blob size (u32)
+    counts   one u32 per JobStatus, in enum order
+    records  one fixed-size record per job
+    strings  NUL-separated UTF-8 string table (names, URLs, results)
+
+A record's flags byte says whether the job is building and which of its
+optional numbers (build number, timestamp, duration) are present, so every
+int64 value, including -1, round-trips. Payloads of schema 1, which marked a
+missing number with -1, are still read.
+
+Fixed-size records allow any single job to be decoded without touching the
+others, and the status counts in the header answer statistics queries
+without decoding any job at all. Consumers that walk the whole list share
+one decoded tuple per payload.
+"""
+
+import struct
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from typing import overload
+
+from models.exceptions import JobCodecError
+from models.job import JenkinsJob, JobStatus
+
+MAGIC = b"JJLC"
+SCHEMA_VERSION = 2
+
+# Schema whose records mark missing numbers with -1 and have no flags
+_LEGACY_SCHEMA_VERSION = 1
+
+_STATUSES = list(JobStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+
+_HEADER = struct.Struct("<4sHII")
+_COUNTS = struct.Struct(f"<{len(_STATUSES)}I")
+# name idx, url idx, status, flags, result idx, number, timestamp, duration
+_RECORD = struct.Struct("<IIBBIqqq")
+
+_NO_STRING = 0xFFFFFFFF
+_LEGACY_NO_VALUE = -1
+
+# Bits of a record's flags byte
+_BUILDING = 1
+_HAS_NUMBER = 2
+_HAS_TIMESTAMP = 4
+_HAS_DURATION = 8
+# Range of the signed 64-bit record fields
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+def encode_jobs(jobs: Iterable[JenkinsJob]) -> bytes:
+    """Encode a job list into the binary snapshot format.
+
+    Args:
+        jobs: Jobs to encode
+
+    Returns:
+        Encoded payload
+    """
+    strings: dict[str, int] = {}
+    counts = [0] * len(_STATUSES)
+    records: list[bytes] = []
+    pack = _RECORD.pack
+
+    def string_index(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    for job in jobs:
+        status_code = _STATUS_CODES[job.status]
+        counts[status_code] += 1
+        number = _optional(job.last_build_number)
+        timestamp = _optional(job.last_build_timestamp_ms)
+        duration = _optional(job.last_build_duration_ms)
+        flags = (
+            (_BUILDING if job.is_building else 0)
+            | (0 if number is None else _HAS_NUMBER)
+            | (0 if timestamp is None else _HAS_TIMESTAMP)
+            | (0 if duration is None else _HAS_DURATION)
+        )
+        records.append(
+            pack(
+                string_index(job.name),
+                string_index(job.url),
+                status_code,
+                flags,
+                _NO_STRING
+                if job.last_build_result is None
+                else string_index(job.last_build_result),
+                number or 0,
+                timestamp or 0,
+                duration or 0,
+            )
+        )
+
+    blob = "\x00".join(strings).encode("utf-8")
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, SCHEMA_VERSION, len(records), len(blob)),
+            _COUNTS.pack(*counts),
+            *records,
+            blob,
+        ]
+    )
+
+
+def decode_jobs(payload: bytes) -> list[JenkinsJob]:
+    """Decode every job in a payload.
+
+    Args:
+        payload: Encoded payload
+
+    Returns:
+        List of decoded JenkinsJob objects
+
+    Raises:
+        JobCodecError: If the payload is malformed or uses another schema
+    """
+    return list(EncodedJobList(payload))
+
+
+def _optional(value: int | None) -> int | None:
+    """Map an optional integer to the value stored in a record.
+
+    Jenkins reports some numbers as floats and nothing bounds them, so the
+    value is truncated to an integer and clamped to the signed 64-bit range
+    of the record fields; a value that is not a finite number is dropped.
+    """
+    if value is None:
+        return None
+    try:
+        number = int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return min(max(number, _INT64_MIN), _INT64_MAX)
+
+
+class EncodedJobList(Sequence[JenkinsJob]):
+    """Read-only job sequence decoded lazily from an encoded payload.
+
+    Only the header is parsed up front. The string table is decoded on the
+    first job access. Indexing before the list has been walked decodes just
+    the requested record; the first iteration or slice decodes every job once
+    into a tuple that later accesses share, so the many consumers of a
+    snapshot (statistics, sorting, rendering, the snapshot endpoint) do not
+    each decode it again. A consumer that only needs the status counts never
+    materializes any job.
+    """
+
+    def __init__(self, payload: bytes) -> None:
+        """Parse the payload header.
+
+        Args:
+            payload: Encoded payload
+
+        Raises:
+            JobCodecError: If the payload is malformed or uses another schema
+        """
+        if len(payload) < _HEADER.size + _COUNTS.size:
+            raise JobCodecError("Job payload is truncated")
+
+        magic, schema, count, blob_size = _HEADER.unpack_from(payload)
+        if magic != MAGIC:
+            raise JobCodecError("Not a job list payload")
+        if schema not in (SCHEMA_VERSION, _LEGACY_SCHEMA_VERSION):
+            raise JobCodecError(f"Unsupported job payload schema {schema}")
+
+        self._records_offset = _HEADER.size + _COUNTS.size
+        self._strings_offset = self._records_offset + count * _RECORD.size
+        if self._strings_offset + blob_size != len(payload):
+            raise JobCodecError("Job payload size does not match its header")
+
+        self._payload = payload
+        self._legacy = schema == _LEGACY_SCHEMA_VERSION
+        self._count: int = count
+        self._counts = _COUNTS.unpack_from(payload, _HEADER.size)
+        self._strings: list[str] | None = None
+        self._jobs: tuple[JenkinsJob, ...] | None = None
+        self._lock = threading.Lock()
+        self._jobs_lock = threading.Lock()
+
+    @property
+    def payload(self) -> bytes:
+        """The encoded payload backing this list."""
+        return self._payload
+
+    def status_counts(self) -> dict[JobStatus, int]:
+        """Get the number of jobs per status without decoding any job.
+
+        Returns:
+            Mapping of every JobStatus to its job count
+        """
+        return dict(zip(_STATUSES, self._counts, strict=True))
+
+    def __len__(self) -> int:
+        """Return the number of jobs."""
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> JenkinsJob: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[JenkinsJob]: ...
+
+    def __getitem__(self, index: int | slice) -> JenkinsJob | list[JenkinsJob]:
+        """Return the job at an index, decoding only its record if needed."""
+        if isinstance(index, slice):
+            return list(self.decoded()[index])
+        if self._jobs is not None:
+            return self._jobs[index]
+        position = index + self._count if index < 0 else index
+        if not 0 <= position < self._count:
+            raise IndexError("job index out of range")
+        return self._decode(position)
+
+    def __iter__(self) -> Iterator[JenkinsJob]:
+        """Iterate over all jobs, decoding the list on first use."""
+        return iter(self.decoded())
+
+    def decoded(self) -> tuple[JenkinsJob, ...]:
+        """Get every job, decoding the whole list once.
+
+        Returns:
+            Tuple of all jobs, shared by every caller
+        """
+        if self._jobs is None:
+            with self._jobs_lock:
+                if self._jobs is None:
+                    strings = self._string_table()
+                    records = memoryview(self._payload)[
+                        self._records_offset : self._strings_offset
+                    ]
+                    self._jobs = tuple(
+                        self._job(fields, strings)
+                        for fields in _RECORD.iter_unpack(records)
+                    )
+        return self._jobs
+
+    def _string_table(self) -> list[str]:
+        """Decode the string table once."""
+        if self._strings is None:
+            with self._lock:
+                if self._strings is None:
+                    blob = self._payload[self._strings_offset :]
+                    self._strings = [
+                        sys.intern(s) for s in blob.decode("utf-8").split("\x00")
+                    ]
+        return self._strings
+
+    def _decode(self, index: int) -> JenkinsJob:
+        """Decode a single job record."""
+        fields = _RECORD.unpack_from(
+            self._payload, self._records_offset + index * _RECORD.size
+        )
+        return self._job(fields, self._string_table())
+
+    def _job(self, fields: tuple, strings: list[str]) -> JenkinsJob:
+        """Build the job of an unpacked record."""
+        name, url, status, flags, result, number, timestamp, duration = fields
+        if self._legacy:
+            # Schema 1: a building byte and -1 for missing numbers
+            flags = (
+                (_BUILDING if flags else 0)
+                | (0 if number == _LEGACY_NO_VALUE else _HAS_NUMBER)
+                | (0 if timestamp == _LEGACY_NO_VALUE else _HAS_TIMESTAMP)
+                | (0 if duration == _LEGACY_NO_VALUE else _HAS_DURATION)
+            )
+        return JenkinsJob.from_fields(
+            strings[name],
+            strings[url],
+            _STATUSES[status],
+            number if flags & _HAS_NUMBER else None,
+            None if result == _NO_STRING else strings[result],
+            timestamp if flags & _HAS_TIMESTAMP else None,
+            duration if flags & _HAS_DURATION else None,
+            bool(flags & _BUILDING),
+        )
@@ -0,0 +1,200 @@
+"""On-demand job details shared across sessions.
+
+The job listing only carries lightweight fields. Full details (the job's
+build fields plus its recent builds) are fetched when someone opens a job and
+kept in a process-wide cache with a TTL. Concurrent requests for the same job
+share one fetch, and a background prefetcher warms the jobs people are
+likely to open (failing, unstable, recently changed) so opening them is
+instant. Details of the long tail of green jobs are never fetched unless
+someone asks for them.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from models.job import JenkinsJob, JobDetails, JobStatus
+
+# How long fetched details are served before being fetched again
+DETAILS_TTL_SECONDS = 300
+
+# Jobs whose details are kept in memory
+DETAILS_CACHE_SIZE = 2000
+
+# Concurrent background fetches
+PREFETCH_WORKERS = 4
+
+# Jobs warmed per poll
+PREFETCH_LIMIT = 50
+
+# Status changes within this many seconds mark a job as recently changed
+PREFETCH_CHANGE_WINDOW = 3600
+
+# Statuses whose details are warmed first
+PREFETCH_STATUSES = (JobStatus.FAILURE, JobStatus.UNSTABLE)
+
+
+class JobDetailsCache:
+    """Process-wide TTL cache of job details with single-flight fetching."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], JobDetails],
+        ttl: float = DETAILS_TTL_SECONDS,
+        max_entries: int = DETAILS_CACHE_SIZE,
+        prefetch_workers: int = PREFETCH_WORKERS,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            fetch: Function fetching the details of a job by name
+            ttl: Seconds fetched details stay fresh
+            max_entries: Number of jobs kept before the least recently used
+                one is evicted
+            prefetch_workers: Threads used for background prefetching
+        """
+        self._fetch = fetch
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, JobDetails]] = OrderedDict()
+        self._in_flight: dict[str, Future[JobDetails]] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=prefetch_workers, thread_name_prefix="job-details"
+        )
+
+    def get(self, job_name: str) -> JobDetails:
+        """Get the details of a job, fetching them if not cached.
+
+        If another caller is already fetching the job, waits for that fetch
+        instead of starting a second one. Failed fetches are not cached.
+
+        Args:
+            job_name: Name of the Jenkins job
+
+        Returns:
+            JobDetails for the job
+
+        Raises:
+            JenkinsJobNotFoundError: If the job does not exist
+            JenkinsConnectionError: If unable to connect to Jenkins
+        """
+        with self._lock:
+            details = self._fresh_locked(job_name)
+            if details is not None:
+                return details
+            future = self._in_flight.get(job_name)
+            owner = future is None
+            if future is None:
+                future = self._in_flight[job_name] = Future()
+
+        if owner:
+            self._run(job_name, future)
+        return future.result()
+
+    def peek(self, job_name: str) -> JobDetails | None:
+        """Get the details of a job only if they are cached and fresh.
+
+        Args:
+            job_name: Name of the Jenkins job
+
+        Returns:
+            Cached JobDetails, or None
+        """
+        with self._lock:
+            return self._fresh_locked(job_name)
+
+    def prefetch(self, job_names: Iterable[str]) -> int:
+        """Fetch details of jobs in the background.
+
+        Jobs that are cached and fresh or already being fetched are skipped.
+
+        Args:
+            job_names: Names of the jobs to warm
+
+        Returns:
+            Number of fetches scheduled
+        """
+        scheduled = []
+        with self._lock:
+            for name in job_names:
+                if self._fresh_locked(name) is None and name not in self._in_flight:
+                    future = self._in_flight[name] = Future()
+                    scheduled.append((name, future))
+
+        for name, future in scheduled:
+            self._executor.submit(self._run, name, future)
+        return len(scheduled)
+
+    def close(self) -> None:
+        """Stop the prefetch threads, dropping fetches not yet started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job_name: str, future: Future[JobDetails]) -> None:
+        """Fetch a job's details and publish the outcome to waiters.
+
+        Any failure, including a BaseException such as KeyboardInterrupt, is
+        handed to the waiters and clears the in-flight entry so nobody waits
+        forever. A BaseException is also re-raised in the fetching thread.
+        """
+        try:
+            details = self._fetch(job_name)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[job_name]
+            future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        with self._lock:
+            self._entries[job_name] = (time.monotonic() + self._ttl, details)
+            self._entries.move_to_end(job_name)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            del self._in_flight[job_name]
+        future.set_result(details)
+
+    def _fresh_locked(self, job_name: str) -> JobDetails | None:
+        """Get cached details if not expired.
+
+        Caller must hold the lock.
+        """
+        entry = self._entries.get(job_name)
+        if entry is None:
+            return None
+        expires, details = entry
+        if expires <= time.monotonic():
+            del self._entries[job_name]
+            return None
+        self._entries.move_to_end(job_name)
+        return details
+
+
+def select_prefetch(
+    jobs: Sequence[JenkinsJob],
+    changed: Iterable[str] = (),
+    limit: int = PREFETCH_LIMIT,
+) -> list[str]:
+    """Pick the jobs whose details are most likely to be opened.
+
+    Failing and unstable jobs come first, then recently changed jobs.
+
+    Args:
+        jobs: Jobs of the current snapshot
+        changed: Names of jobs whose status changed recently, newest first
+        limit: Maximum number of jobs to pick
+
+    Returns:
+        Job names, most likely first
+    """
+    names = {job.name for job in jobs}
+    picked = dict.fromkeys(job.name for job in jobs if job.status in PREFETCH_STATUSES)
+    for name in changed:
+        if len(picked) >= limit:
+            break
+        if name in names:
+            picked.setdefault(name)
+    return list(picked)[:limit]
@@ -0,0 +1,188 @@
+"""Grouped views of job snapshots.
+
+Jobs are grouped by folder path or by name prefix. Group membership and the
+group header counts are computed once per snapshot in a single pass over the
+query columns; each distinct ordering is then split into its groups with one
+stable sort of the jobs' group codes, so the order within a group follows the
+table's sort and filters.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from models.job import JobStatus
+from services.job_query import JobColumns
+
+# Ways jobs can be grouped
+GROUP_BY_OPTIONS = ("Folder", "Prefix")
+
+# Group of jobs that are not inside a folder
+ROOT_GROUP = "(root)"
+
+# Group splits kept per grouping, one per distinct ordering
+PARTITION_CACHE_SIZE = 8
+
+# Separators ending a job name prefix
+_PREFIX_SPLIT = re.compile(r"[/\-_.]")
+
+_STATUSES = list(JobStatus)
+_STATUS_INDEX = {status: index for index, status in enumerate(_STATUSES)}
+
+
+@dataclass(frozen=True, slots=True)
+class JobGroup:
+    """A group of jobs with the counts shown in its header."""
+
+    key: str
+    total: int
+    failure: int
+    building: int
+    success_rate: float  # percentage, counted as in calculate_statistics
+
+
+class JobGrouping:
+    """Group membership and header counts of a snapshot's jobs."""
+
+    def __init__(self, groups: Sequence[JobGroup], codes: np.ndarray) -> None:
+        """Initialize a grouping.
+
+        Args:
+            groups: Groups in display order
+            codes: Index into groups of each job, aligned with the job list
+        """
+        self.groups = tuple(groups)
+        self._codes = codes
+        self._partitions: OrderedDict[
+            int, tuple[Sequence[int], list[tuple[JobGroup, tuple[int, ...]]]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of groups."""
+        return len(self.groups)
+
+    def partition(self, order: Sequence[int]) -> list[tuple[JobGroup, tuple[int, ...]]]:
+        """Split an ordering of the jobs into groups.
+
+        Splits are cached per ordering object, so orderings shared through
+        the view cache also share their splits.
+
+        Args:
+            order: Indices of the jobs to include, in display order
+
+        Returns:
+            Groups with at least one job in order, in display order, each
+            with its jobs in the order given; callers must not modify it
+        """
+        with self._lock:
+            entry = self._partitions.get(id(order))
+            if entry is not None and entry[0] is order:
+                self._partitions.move_to_end(id(order))
+                return entry[1]
+
+        if not order:
+            return []
+        indices = np.fromiter(order, dtype=np.intp, count=len(order))
+        codes = self._codes[indices]
+        by_group = np.argsort(codes, kind="stable")
+        codes = codes[by_group]
+        indices = indices[by_group]
+        starts = np.flatnonzero(np.diff(codes, prepend=-1))
+        ends = [*starts[1:].tolist(), len(indices)]
+        parts = [
+            (self.groups[codes[start]], tuple(indices[start:end].tolist()))
+            for start, end in zip(starts.tolist(), ends, strict=True)
+        ]
+
+        with self._lock:
+            # Keeping the ordering referenced keeps its id from being reused
+            self._partitions[id(order)] = (order, parts)
+            if len(self._partitions) > PARTITION_CACHE_SIZE:
+                self._partitions.popitem(last=False)
+        return parts
+
+
+def group_key(name: str, group_by: str) -> str:
+    """Get the group of a job name.
+
+    Args:
+        name: Full job name including folders, as in JenkinsJob.name
+        group_by: 'Folder' for the folder path, 'Prefix' for the part of the
+            name before the first separator (/, -, _ or .)
+
+    Returns:
+        Group key
+    """
+    if group_by == "Folder":
+        return name.rpartition("/")[0] or ROOT_GROUP
+    return _PREFIX_SPLIT.split(name, maxsplit=1)[0] or ROOT_GROUP
+
+
+def group_jobs(columns: JobColumns, group_by: str) -> JobGrouping:
+    """Group a job list and count each group's statuses in one pass.
+
+    Args:
+        columns: Columns of the job list, from build_job_columns
+        group_by: One of GROUP_BY_OPTIONS
+
+    Returns:
+        JobGrouping with groups sorted by key
+    """
+    if group_by == "Folder":
+        # Folders are already coded in the query columns
+        keys = [value or ROOT_GROUP for value in columns.folder_values]
+        codes = columns.folder_codes
+    else:
+        known: dict[str, int] = {}
+        codes = np.fromiter(
+            (
+                known.setdefault(group_key(name, group_by), len(known))
+                for name in columns.names
+            ),
+            dtype=np.int32,
+            count=len(columns),
+        )
+        keys = list(known)
+
+    # Renumber groups in key order, merging keys that map to the same label
+    labels = sorted(set(keys))
+    position = {label: index for index, label in enumerate(labels)}
+    remap = np.array([position[key] for key in keys], dtype=np.int32)
+    codes = remap[codes]
+
+    statuses = len(_STATUSES)
+    counts = np.bincount(
+        codes.astype(np.intp) * statuses + columns.status,
+        minlength=len(labels) * statuses,
+    ).reshape(len(labels), statuses)
+
+    groups = [
+        _make_group(label, row.tolist())
+        for label, row in zip(labels, counts, strict=True)
+    ]
+    return JobGrouping(groups, codes)
+
+
+def _make_group(key: str, counts: list[int]) -> JobGroup:
+    """Build a group from its per-status job counts."""
+    total = sum(counts)
+    success = counts[_STATUS_INDEX[JobStatus.SUCCESS]]
+    building = counts[_STATUS_INDEX[JobStatus.BUILDING]]
+    countable = (
+        total
+        - counts[_STATUS_INDEX[JobStatus.DISABLED]]
+        - counts[_STATUS_INDEX[JobStatus.NOT_BUILT]]
+        - building
+    )
+    return JobGroup(
+        key=key,
+        total=total,
+        failure=counts[_STATUS_INDEX[JobStatus.FAILURE]],
+        building=building,
+        success_rate=round(success / countable * 100, 1) if countable > 0 else 0.0,
+    )
@@ -0,0 +1,364 @@
+"""Filter query language for job views.
+
+A query is a whitespace-separated list of terms, all of which must hold::
+
+    status:failure,unstable folder:payments/* age>2h duration>10m building:false
+
+Terms are ``field:values`` (comma-separated alternatives) or
+``field<op>value`` with one of ``> >= < <= = !=``; a leading ``-`` negates a
+term. Fields:
+
+    status    job status (success, failure, unstable, building, ...)
+    result    last build result (SUCCESS, FAILURE, ...)
+    folder    glob on the folder path; "payments/*" also matches "payments"
+    name      glob on the full job name
+    building  true or false
+    age       time since the last build started, e.g. 30m, 2h, 1d
+    duration  last build duration, e.g. 45s, 10m
+    build     last build number
+
+Queries are compiled once per query string into predicates evaluated
+vectorized over JobColumns, column arrays built once per job list. String
+fields are matched once per distinct value rather than once per job.
+"""
+
+import operator
+import re
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from functools import lru_cache
+
+import numpy as np
+
+from models.exceptions import JobQueryError
+from models.job import JenkinsJob, JobStatus
+
+# Compiled queries kept, by query string
+COMPILED_QUERY_CACHE_SIZE = 256
+
+_STATUSES = list(JobStatus)
+_STATUS_CODES = {status.value: code for code, status in enumerate(_STATUSES)}
+
+_MISSING = -1
+
+_TERM = re.compile(r"^(-?)([a-z_]+)(>=|<=|!=|>|<|=|:)(.+)$", re.IGNORECASE)
+_DURATION = re.compile(r"^(\d+(?:\.\d+)?)([smhd]?)$", re.IGNORECASE)
+_UNIT_MS = {"": 1000, "s": 1000, "m": 60_000, "h": 3_600_000, "d": 86_400_000}
+_BOOLEANS = {
+    "true": True,
+    "yes": True,
+    "1": True,
+    "false": False,
+    "no": False,
+    "0": False,
+}
+_COMPARISONS: dict[str, Callable[[np.ndarray, int], np.ndarray]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "=": operator.eq,
+    ":": operator.eq,
+    "!=": operator.ne,
+}
+
+Predicate = Callable[["JobColumns", int], np.ndarray]
+
+
+@dataclass(frozen=True)
+class JobColumns:
+    """Job fields as column arrays, aligned with the job list by index.
+
+    Missing numbers are -1. String fields are stored as codes into a tuple of
+    their distinct values.
+    """
+
+    status: np.ndarray  # status codes, in JobStatus order
+    building: np.ndarray
+    build_number: np.ndarray
+    timestamp_ms: np.ndarray
+    duration_ms: np.ndarray
+    names: tuple[str, ...]
+    folder_values: tuple[str, ...]
+    folder_codes: np.ndarray
+    result_values: tuple[str, ...]
+    result_codes: np.ndarray
+
+    def __len__(self) -> int:
+        """Return the number of jobs."""
+        return len(self.names)
+
+
+def build_job_columns(jobs: Sequence[JenkinsJob]) -> JobColumns:
+    """Build column arrays for a job list in a single pass.
+
+    Args:
+        jobs: Jobs to build columns for
+
+    Returns:
+        JobColumns aligned with jobs
+    """
+    status, building, numbers, timestamps, durations, names = [], [], [], [], [], []
+    folders: dict[str, int] = {}
+    results: dict[str, int] = {}
+    folder_codes, result_codes = [], []
+    for job in jobs:
+        status.append(_STATUS_CODES[job.status.value])
+        building.append(job.is_building)
+        numbers.append(_number(job.last_build_number))
+        timestamps.append(_number(job.last_build_timestamp_ms))
+        durations.append(_number(job.last_build_duration_ms))
+        names.append(job.name)
+        folder = job.name.rpartition("/")[0]
+        folder_codes.append(folders.setdefault(folder, len(folders)))
+        result = job.last_build_result or ""
+        result_codes.append(results.setdefault(result, len(results)))
+
+    return JobColumns(
+        status=np.array(status, dtype=np.uint8),
+        building=np.array(building, dtype=bool),
+        build_number=np.array(numbers, dtype=np.int64),
+        timestamp_ms=np.array(timestamps, dtype=np.int64),
+        duration_ms=np.array(durations, dtype=np.int64),
+        names=tuple(names),
+        folder_values=tuple(folders),
+        folder_codes=np.array(folder_codes, dtype=np.int32),
+        result_values=tuple(results),
+        result_codes=np.array(result_codes, dtype=np.int32),
+    )
+
+
+def _number(value: int | None) -> int:
+    """Map an optional number to its column value."""
+    return _MISSING if value is None else value
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """A parsed filter query, ready to evaluate against job columns."""
+
+    text: str  # normalized query text
+    predicates: tuple[Predicate, ...]
+    time_dependent: bool  # whether the result depends on the current time
+
+    def mask(self, columns: JobColumns, now_ms: int | None = None) -> np.ndarray:
+        """Evaluate the query.
+
+        Args:
+            columns: Columns of the job list
+            now_ms: Reference time for age terms in epoch milliseconds
+                (default: now)
+
+        Returns:
+            Boolean array, True for matching jobs
+        """
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        result = np.ones(len(columns), dtype=bool)
+        for predicate in self.predicates:
+            result &= predicate(columns, now_ms)
+        return result
+
+
+def compile_query(text: str) -> CompiledQuery:
+    """Parse and compile a filter query, reusing earlier compilations.
+
+    Args:
+        text: Query text
+
+    Returns:
+        CompiledQuery; matches every job if the text is blank
+
+    Raises:
+        JobQueryError: If the query cannot be parsed
+    """
+    return _compile(" ".join(text.split()))
+
+
+def status_query(statuses: Iterable[str]) -> str:
+    """Build the query term selecting jobs by status.
+
+    Args:
+        statuses: Status values; all jobs if empty
+
+    Returns:
+        Query text, empty if no status is given
+    """
+    values = ",".join(statuses)
+    return f"status:{values}" if values else ""
+
+
+@lru_cache(maxsize=COMPILED_QUERY_CACHE_SIZE)
+def _compile(text: str) -> CompiledQuery:
+    """Compile normalized query text."""
+    predicates = []
+    time_dependent = False
+    for term in text.split():
+        match = _TERM.match(term)
+        if match is None:
+            raise JobQueryError(
+                f"Cannot parse '{term}'; expected field:value or field>value"
+            )
+        negate, field, op, value = match.groups()
+        field = field.lower()
+        compiler = _FIELDS.get(field)
+        if compiler is None:
+            raise JobQueryError(
+                f"Unknown field '{field}'; use one of {', '.join(_FIELDS)}"
+            )
+        predicate = compiler(op, value)
+        if negate:
+            predicate = _negate(predicate)
+        predicates.append(predicate)
+        time_dependent = time_dependent or field == "age"
+    return CompiledQuery(
+        text=text, predicates=tuple(predicates), time_dependent=time_dependent
+    )
+
+
+def _negate(predicate: Predicate) -> Predicate:
+    """Invert a predicate."""
+    return lambda columns, now_ms: ~predicate(columns, now_ms)
+
+
+def _require_equality(field: str, op: str) -> None:
+    """Reject comparison operators on fields that only support matching."""
+    if op not in (":", "="):
+        raise JobQueryError(f"'{field}' only supports ':' (e.g. {field}:value)")
+
+
+def _compile_status(op: str, value: str) -> Predicate:
+    """Compile a status term."""
+    _require_equality("status", op)
+    codes = []
+    for item in value.lower().split(","):
+        code = _STATUS_CODES.get(item)
+        if code is None:
+            raise JobQueryError(
+                f"Unknown status '{item}'; use one of {', '.join(_STATUS_CODES)}"
+            )
+        codes.append(code)
+    wanted = np.array(codes, dtype=np.uint8)
+    return lambda columns, _now_ms: np.isin(columns.status, wanted)
+
+
+def _compile_result(op: str, value: str) -> Predicate:
+    """Compile a last build result term."""
+    _require_equality("result", op)
+    wanted = set(value.upper().split(","))
+    return _coded_match(
+        lambda c: (c.result_values, c.result_codes), lambda v: v in wanted
+    )
+
+
+def _compile_folder(op: str, value: str) -> Predicate:
+    """Compile a folder glob term."""
+    _require_equality("folder", op)
+    patterns = value.lower().split(",")
+
+    def matches(folder: str) -> bool:
+        folder = folder.lower()
+        return any(
+            fnmatchcase(folder, p) or fnmatchcase(folder + "/", p) for p in patterns
+        )
+
+    return _coded_match(lambda c: (c.folder_values, c.folder_codes), matches)
+
+
+def _compile_name(op: str, value: str) -> Predicate:
+    """Compile a job name glob term."""
+    _require_equality("name", op)
+    patterns = value.lower().split(",")
+
+    def predicate(columns: JobColumns, _now_ms: int) -> np.ndarray:
+        return np.fromiter(
+            (any(fnmatchcase(n.lower(), p) for p in patterns) for n in columns.names),
+            dtype=bool,
+            count=len(columns),
+        )
+
+    return predicate
+
+
+def _compile_building(op: str, value: str) -> Predicate:
+    """Compile a building term."""
+    _require_equality("building", op)
+    wanted = _BOOLEANS.get(value.lower())
+    if wanted is None:
+        raise JobQueryError(f"'building' expects true or false, not '{value}'")
+    return lambda columns, _now_ms: columns.building == wanted
+
+
+def _compile_age(op: str, value: str) -> Predicate:
+    """Compile a last build age comparison."""
+    threshold = _parse_duration(value)
+    compare = _COMPARISONS[op]
+
+    def predicate(columns: JobColumns, now_ms: int) -> np.ndarray:
+        timestamps = columns.timestamp_ms
+        matched: np.ndarray = (timestamps != _MISSING) & compare(
+            now_ms - timestamps, threshold
+        )
+        return matched
+
+    return predicate
+
+
+def _compile_duration(op: str, value: str) -> Predicate:
+    """Compile a last build duration comparison."""
+    threshold = _parse_duration(value)
+    compare = _COMPARISONS[op]
+    return lambda columns, _now_ms: (
+        (columns.duration_ms != _MISSING) & compare(columns.duration_ms, threshold)
+    )
+
+
+def _compile_build(op: str, value: str) -> Predicate:
+    """Compile a last build number comparison."""
+    if not value.isdigit():
+        raise JobQueryError(f"'build' expects a build number, not '{value}'")
+    threshold = int(value)
+    compare = _COMPARISONS[op]
+    return lambda columns, _now_ms: (
+        (columns.build_number != _MISSING) & compare(columns.build_number, threshold)
+    )
+
+
+def _coded_match(
+    column: Callable[[JobColumns], tuple[tuple[str, ...], np.ndarray]],
+    matches: Callable[[str], bool],
+) -> Predicate:
+    """Build a predicate testing each distinct value of a coded column once."""
+
+    def predicate(columns: JobColumns, _now_ms: int) -> np.ndarray:
+        values, codes = column(columns)
+        matched = np.fromiter(
+            (matches(v) for v in values), dtype=bool, count=len(values)
+        )
+        rows: np.ndarray = matched[codes]
+        return rows
+
+    return predicate
+
+
+def _parse_duration(value: str) -> int:
+    """Parse a duration such as 45s, 10m, 2h or 1d into milliseconds."""
+    match = _DURATION.match(value)
+    if match is None:
+        raise JobQueryError(f"Cannot parse duration '{value}'; use e.g. 30s, 10m, 2h")
+    amount, unit = match.groups()
+    return int(float(amount) * _UNIT_MS[unit.lower()])
+
+
+_FIELDS: dict[str, Callable[[str, str], Predicate]] = {
+    "status": _compile_status,
+    "result": _compile_result,
+    "folder": _compile_folder,
+    "name": _compile_name,
+    "building": _compile_building,
+    "age": _compile_age,
+    "duration": _compile_duration,
+    "build": _compile_build,
+}
@@ -0,0 +1,180 @@
+"""Job name search index.
+
+The index is built once per snapshot from the job names. It answers:
+
+- name and token prefixes with binary search over sorted names and over the
+  sorted name tokens (the parts between separators such as "-" and "/"),
+- substrings by intersecting trigram posting lists and verifying the
+  candidates,
+- fuzzy matches (typos, transpositions) by the share of the query's
+  trigrams a name contains, for terms nothing else matched.
+
+Each whitespace-separated term of a query must match; results are ranked by
+how well the worst term matched, then by name.
+"""
+
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Sequence
+
+# Match tiers, best first
+EXACT = 0
+NAME_PREFIX = 1
+TOKEN = 2
+TOKEN_PREFIX = 3
+SUBSTRING = 4
+FUZZY = 5
+
+# Share of a term's trigrams a name must contain to count as a fuzzy match
+FUZZY_MIN_SIMILARITY = 0.4
+
+# Shortest term matched fuzzily; shorter terms have too few trigrams
+FUZZY_MIN_LENGTH = 4
+
+_TOKEN_SPLIT = re.compile(r"[^a-z0-9]+")
+
+
+def _trigrams(text: str) -> set[str]:
+    """Get the distinct trigrams of a string."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class JobSearchIndex:
+    """Prefix, substring and fuzzy search over job names."""
+
+    def __init__(self, names: Sequence[str]) -> None:
+        """Build the index.
+
+        Args:
+            names: Job names, aligned with the job list by index. Matching is
+                case-insensitive.
+        """
+        self._names = [name.lower() for name in names]
+
+        name_order = sorted(range(len(self._names)), key=self._names.__getitem__)
+        self._sorted_names = [self._names[i] for i in name_order]
+        self._sorted_name_ids = name_order
+
+        tokens: list[tuple[str, int]] = []
+        postings: dict[str, array] = {}
+        for index, name in enumerate(self._names):
+            for token in set(_TOKEN_SPLIT.split(name)):
+                if token:
+                    tokens.append((token, index))
+            for trigram in _trigrams(name):
+                posting = postings.get(trigram)
+                if posting is None:
+                    posting = postings[trigram] = array("I")
+                posting.append(index)
+        tokens.sort()
+        self._sorted_tokens = [token for token, _ in tokens]
+        self._sorted_token_ids = [index for _, index in tokens]
+        self._postings = postings
+
+    def __len__(self) -> int:
+        """Return the number of indexed names."""
+        return len(self._names)
+
+    def search(self, query: str) -> list[int]:
+        """Find jobs matching a query.
+
+        Args:
+            query: Search text; every whitespace-separated term must match
+
+        Returns:
+            Indices of matching jobs, best match first; all jobs in name
+            order for an empty query
+        """
+        terms = query.lower().split()
+        if not terms:
+            return list(self._sorted_name_ids)
+
+        ranks = self._match(terms[0])
+        for term in terms[1:]:
+            if not ranks:
+                break
+            ranks = {
+                i: max(rank, ranks[i])
+                for i, rank in self._match(term).items()
+                if i in ranks
+            }
+        if not ranks:
+            return []
+
+        if len(ranks) * 16 < len(self._names):
+            names = self._names
+            return sorted(ranks, key=lambda i: (ranks[i], names[i]))
+
+        # Large result sets: bucket by rank in name order instead of sorting
+        buckets: dict[tuple[int, float], list[int]] = {}
+        for index in self._sorted_name_ids:
+            rank = ranks.get(index)
+            if rank is not None:
+                buckets.setdefault(rank, []).append(index)
+        return [index for rank in sorted(buckets) for index in buckets[rank]]
+
+    def _match(self, term: str) -> dict[int, tuple[int, float]]:
+        """Match one lowercase term.
+
+        Returns:
+            Mapping of job index to (tier, negated similarity), lower is better
+        """
+        ranks: dict[int, tuple[int, float]] = {}
+
+        # Name prefixes, exact name first. Later passes only add jobs not yet
+        # matched, since each pass is a worse tier than the ones before it.
+        names = self._sorted_names
+        name_ids = self._sorted_name_ids
+        for pos in range(bisect_left(names, term), len(names)):
+            if not names[pos].startswith(term):
+                break
+            ranks[name_ids[pos]] = (EXACT if names[pos] == term else NAME_PREFIX, -1.0)
+
+        # Token prefixes, whole tokens first
+        tokens = self._sorted_tokens
+        token_ids = self._sorted_token_ids
+        token_matches: dict[int, tuple[int, float]] = {}
+        for pos in range(bisect_left(tokens, term), len(tokens)):
+            if not tokens[pos].startswith(term):
+                break
+            rank = (TOKEN if tokens[pos] == term else TOKEN_PREFIX, -1.0)
+            index = token_ids[pos]
+            if rank < token_matches.get(index, (FUZZY + 1, 0.0)):
+                token_matches[index] = rank
+        for index, rank in token_matches.items():
+            ranks.setdefault(index, rank)
+
+        trigrams = _trigrams(term)
+        if not trigrams:
+            return ranks
+
+        # Postings of the term's trigrams that occur in any name
+        postings = [p for t in trigrams if (p := self._postings.get(t))]
+        if len(postings) == len(trigrams):
+            # Substrings: candidates hold every trigram of the term
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    break
+            all_names = self._names
+            substring = (SUBSTRING, -1.0)
+            for index in candidates:
+                if index not in ranks and term in all_names[index]:
+                    ranks[index] = substring
+
+        # Fuzzy matching is a fallback for terms nothing else matched
+        if not ranks and len(term) >= FUZZY_MIN_LENGTH:
+            needed = max(2, math.ceil(len(trigrams) * FUZZY_MIN_SIMILARITY))
+            shared: Counter[int] = Counter()
+            for posting in postings:
+                shared.update(posting)
+            for index, count in shared.items():
+                if count >= needed:
+                    ranks[index] = (FUZZY, -count / len(trigrams))
+
+        return ranks
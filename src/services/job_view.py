@@ -0,0 +1,297 @@
+"""Sorted, filtered and searched views of job snapshots.
+
+Orderings are computed from per-job sort keys, filtered with compiled query
+masks and returned as tuples of indices into the snapshot's job list.
+JobViewCache memoizes them by snapshot version and query, so sessions looking
+at the same snapshot with the same controls share one computed ordering
+instead of re-sorting on every rerun. Misses are computed outside the cache
+lock, and concurrent sessions missing on the same entry wait for one build.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Hashable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import numpy as np
+
+from models.job import JenkinsJob, JobStatus
+from services.job_groups import JobGrouping, group_jobs
+from services.job_query import (
+    JobColumns,
+    build_job_columns,
+    compile_query,
+    status_query,
+)
+from services.job_search import JobSearchIndex
+
+# Status sort order: FAILURE first, then BUILDING, then others
+STATUS_PRIORITY: dict[JobStatus, int] = {
+    JobStatus.FAILURE: 0,
+    JobStatus.BUILDING: 1,
+    JobStatus.UNSTABLE: 2,
+    JobStatus.SUCCESS: 3,
+    JobStatus.ABORTED: 4,
+    JobStatus.NOT_BUILT: 5,
+    JobStatus.DISABLED: 6,
+    JobStatus.UNKNOWN: 7,
+}
+
+# Orderings kept across all sessions
+VIEW_CACHE_SIZE = 64
+
+# Snapshots whose sort keys and columns are kept (the live one plus a few
+# older ones)
+SORT_KEYS_CACHE_SIZE = 4
+
+# Groupings kept, one per snapshot and way of grouping
+GROUPING_CACHE_SIZE = 4
+
+# Orderings of queries with age terms are recomputed at this interval
+AGE_QUERY_RESOLUTION_SECONDS = 60
+
+# Snapshots whose search index is kept
+SEARCH_INDEX_CACHE_SIZE = 2
+
+# Sort option ordering search results by how well they match
+RELEVANCE = "Relevance"
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class JobSortKeys:
+    """Per-job sort and filter keys, aligned with the job list by index."""
+
+    name: list[str]
+    status_rank: list[int]
+    last_build: list[int]
+
+
+def build_sort_keys(jobs: Sequence[JenkinsJob]) -> JobSortKeys:
+    """Compute sort and filter keys for a job list in a single pass.
+
+    Args:
+        jobs: Jobs to compute keys for
+
+    Returns:
+        JobSortKeys aligned with jobs
+    """
+    keys = JobSortKeys(name=[], status_rank=[], last_build=[])
+    for job in jobs:
+        keys.name.append(job.name.lower())
+        keys.status_rank.append(STATUS_PRIORITY.get(job.status, 99))
+        keys.last_build.append(job.last_build_number or 0)
+    return keys
+
+
+def order_jobs(
+    keys: JobSortKeys,
+    sort_by: str,
+    mask: np.ndarray | None = None,
+    matches: Sequence[int] | None = None,
+) -> tuple[int, ...]:
+    """Sort and filter jobs by their precomputed keys.
+
+    Args:
+        keys: Keys from build_sort_keys
+        sort_by: Sort criteria ('Name', 'Status', 'Last Build', or
+            'Relevance' to keep the order of matches)
+        mask: Boolean array of jobs to keep, from a compiled query; all jobs
+            if None
+        matches: Search results, best first; all jobs if None
+
+    Returns:
+        Indices into the job list, in display order
+    """
+    count = len(keys.name)
+    if matches is not None:
+        matched = np.zeros(count, dtype=bool)
+        matched[np.asarray(matches, dtype=np.intp)] = True
+        mask = matched if mask is None else mask & matched
+
+    indices = range(count)
+    if matches is not None and sort_by == RELEVANCE:
+        order = matches
+    elif sort_by == "Name":
+        order = sorted(indices, key=keys.name.__getitem__)
+    elif sort_by == "Status":
+        order = sorted(indices, key=keys.status_rank.__getitem__)
+    elif sort_by == "Last Build":
+        # Newest first
+        order = sorted(indices, key=keys.last_build.__getitem__, reverse=True)
+    else:
+        order = indices
+
+    if mask is None:
+        return tuple(order)
+    ordered = np.fromiter(order, dtype=np.intp, count=len(order))
+    return tuple(ordered[mask[ordered]].tolist())
+
+
+class JobViewCache:
+    """Process-wide LRU cache of job orderings keyed by snapshot and query."""
+
+    def __init__(self, max_entries: int = VIEW_CACHE_SIZE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Number of orderings kept before the least recently
+                used one is evicted
+        """
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._orders: OrderedDict[tuple, tuple[int, ...]] = OrderedDict()
+        self._sort_keys_cache: OrderedDict[int, tuple[JobSortKeys, JobColumns]] = (
+            OrderedDict()
+        )
+        self._search_indexes: OrderedDict[int, JobSearchIndex] = OrderedDict()
+        self._groupings: OrderedDict[tuple[int, str], JobGrouping] = OrderedDict()
+        self._in_flight: dict[tuple[int, Hashable], Future[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def order(
+        self,
+        version: int,
+        jobs: Sequence[JenkinsJob],
+        sort_by: str,
+        filter_status: Collection[str] = (),
+        search: str = "",
+        query: str = "",
+    ) -> tuple[int, ...]:
+        """Get the ordering of a snapshot's jobs for a query.
+
+        Args:
+            version: Version of the snapshot the jobs belong to
+            jobs: The snapshot's jobs; only read on a cache miss
+            sort_by: Sort criteria ('Name', 'Status', 'Last Build', or
+                'Relevance' for search results)
+            filter_status: Status values to keep; all jobs if empty. Applied
+                as a status term of the query.
+            search: Job name search text; all jobs if blank
+            query: Filter query (see services.job_query); all jobs if blank
+
+        Returns:
+            Indices into jobs, in display order
+
+        Raises:
+            JobQueryError: If the query cannot be parsed
+        """
+        compiled = compile_query(f"{status_query(sorted(filter_status))} {query}")
+        search = " ".join(search.lower().split())
+        now = int(time.time())
+        key = (
+            version,
+            sort_by,
+            compiled.text,
+            search,
+            now // AGE_QUERY_RESOLUTION_SECONDS if compiled.time_dependent else None,
+        )
+        with self._lock:
+            order = self._orders.get(key)
+            if order is not None:
+                self._orders.move_to_end(key)
+                self.hits += 1
+                return order
+            self.misses += 1
+
+        def build() -> tuple[int, ...]:
+            keys, columns = self._sort_keys(version, jobs)
+            mask = compiled.mask(columns, now * 1000) if compiled.predicates else None
+            matches = (
+                self._search_index(version, keys).search(search) if search else None
+            )
+            return order_jobs(keys, sort_by, mask, matches)
+
+        return self._shared(self._orders, key, self._max_entries, build)
+
+    def groups(
+        self, version: int, jobs: Sequence[JenkinsJob], group_by: str
+    ) -> JobGrouping:
+        """Get the grouping of a snapshot's jobs, computing it once.
+
+        Args:
+            version: Version of the snapshot the jobs belong to
+            jobs: The snapshot's jobs; only read on a cache miss
+            group_by: One of services.job_groups.GROUP_BY_OPTIONS
+
+        Returns:
+            JobGrouping shared by every caller asking for this snapshot
+        """
+        return self._shared(
+            self._groupings,
+            (version, group_by),
+            GROUPING_CACHE_SIZE,
+            lambda: group_jobs(self._sort_keys(version, jobs)[1], group_by),
+        )
+
+    def _sort_keys(
+        self, version: int, jobs: Sequence[JenkinsJob]
+    ) -> tuple[JobSortKeys, JobColumns]:
+        """Get the sort keys and query columns of a snapshot, building them once."""
+        return self._shared(
+            self._sort_keys_cache,
+            version,
+            SORT_KEYS_CACHE_SIZE,
+            lambda: (build_sort_keys(jobs), build_job_columns(jobs)),
+        )
+
+    def _search_index(self, version: int, keys: JobSortKeys) -> JobSearchIndex:
+        """Get the search index of a snapshot's job names, building it once.
+
+        Indexes are keyed by snapshot version; the snapshot store keeps the
+        version of a poll whose job list did not change, so such polls share
+        one index.
+        """
+        return self._shared(
+            self._search_indexes,
+            version,
+            SEARCH_INDEX_CACHE_SIZE,
+            lambda: JobSearchIndex(keys.name),
+        )
+
+    def _shared(
+        self,
+        cache: OrderedDict[Any, _T],
+        key: Hashable,
+        max_entries: int,
+        build: Callable[[], _T],
+    ) -> _T:
+        """Get a cache entry, building it outside the lock on a miss.
+
+        If another caller is already building the entry, waits for that build
+        instead of starting a second one. Failed builds are not cached.
+        """
+        flight_key = (id(cache), key)
+        with self._lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+                return value
+            future: Future[_T] | None = self._in_flight.get(flight_key)
+            owner = future is None
+            if future is None:
+                future = self._in_flight[flight_key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = build()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[flight_key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            cache[key] = value
+            if len(cache) > max_entries:
+                cache.popitem(last=False)
+            del self._in_flight[flight_key]
+        future.set_result(value)
+        return value
@@ -7,12 +7,28 @@ import streamlit as st
 from models.audit import AuditAction, AuditResult
 from models.user import User
 from services.audit import log_event
-from services.mock_ldap import MockLDAPService
-from services.whitelist import WhitelistService
+from services.directory import create_mock_directory
+from services.group_access import GroupAccess, GroupMembershipCache
+from services.whitelist import create_whitelist_service
 
 # Services
-ldap_service = MockLDAPService()
-whitelist_service = WhitelistService()
+ldap_service = create_mock_directory()
+whitelist_service = create_whitelist_service()
+group_access = GroupAccess(
+    whitelist_service,
+    GroupMembershipCache(
+        lambda group: [user.email for user in ldap_service.get_group_members(group)]
+    ),
+)
+
+
+def get_user_identity() -> str | None:
+    """Get the email the demo session is logged in as, without a lookup.
+
+    Returns:
+        Email if logged in, None otherwise.
+    """
+    return st.session_state.get("demo_user_email") or None
 
 
 def mock_authenticate_user() -> User | None:
@@ -40,15 +56,18 @@ def mock_authenticate_user() -> User | None:
 
 
 def check_authorization(user: User) -> bool:
-    """Check if user is in the whitelist.
+    """Check if user is in the whitelist or in an allowed group.
 
     Args:
         user: The user to check.
 
     Returns:
-        True if user is whitelisted, False otherwise.
+        True if user is whitelisted directly or through a group, False
+        otherwise.
     """
-    return whitelist_service.is_user_allowed(user.email)
+    if whitelist_service.is_user_allowed(user.email):
+        return True
+    return group_access.is_allowed(user)
 
 
 def mock_logout_user(user: User, ip_address: str = "") -> None:
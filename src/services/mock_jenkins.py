@@ -3,7 +3,8 @@
 import random
 from datetime import datetime, timedelta
 
-from models.job import JenkinsJob, JobStatus
+from models.job import BuildSummary, JenkinsJob, JobDetails, JobStatus
+from services.jenkins import RECENT_BUILDS_LIMIT
 
 
 # Demo job configurations
@@ -136,3 +137,40 @@ class MockJenkinsService:
             status=JobStatus.UNKNOWN,
             base_build=self._base_build,
         )
+
+    def get_job_details_with_builds(
+        self, job_name: str, limit: int = RECENT_BUILDS_LIMIT
+    ) -> JobDetails:
+        """Get details and recent builds for a specific mock job.
+
+        Args:
+            job_name: Name of the job
+            limit: Maximum number of recent builds to include
+
+        Returns:
+            Mock JobDetails object with builds newest first
+        """
+        job = self.get_job_details(job_name)
+        if job.last_build_number is None:
+            return JobDetails(job=job, recent_builds=())
+
+        builds = []
+        timestamp_ms = job.last_build_timestamp_ms or 0
+        for number in range(
+            job.last_build_number, max(0, job.last_build_number - limit), -1
+        ):
+            latest = number == job.last_build_number
+            duration_ms = random.randint(30_000, 600_000)
+            builds.append(
+                BuildSummary(
+                    number=number,
+                    result=job.last_build_result
+                    if latest
+                    else random.choice(["SUCCESS", "SUCCESS", "FAILURE"]),
+                    timestamp_ms=timestamp_ms,
+                    duration_ms=job.last_build_duration_ms if latest else duration_ms,
+                    is_building=job.is_building and latest,
+                )
+            )
+            timestamp_ms -= random.randint(1, 12) * 3_600_000
+        return JobDetails(job=job, recent_builds=tuple(builds))
@@ -1,7 +1,23 @@
-"""Mock LDAP service for development and testing."""
+"""Mock LDAP service for development and testing.
 
+MockLDAPService stands in for a connection to a directory server. Each
+operation can be given an artificial latency, the cost of a bind and search
+on a real server, so the effect of services.directory caching and pooling
+can be measured locally.
+
+Connections share a MockDirectory, the directory "server" state: its users
+and their search index. generate_directory creates directories of any size
+for trying the admin user picker and benchmarking the search.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 
+from services.directory_search import DirectorySearchIndex
+
 
 @dataclass
 class LDAPUser:
@@ -60,13 +76,110 @@ MOCK_CREDENTIALS: dict[str, str] = {
 }
 
 
+# Name parts and departments of generated directories
+_FIRST_NAMES = (
+    "Alex", "Ana", "Ben", "Carla", "Chen", "David", "Elena", "Farid", "Grace",
+    "Hiro", "Ines", "Jamal", "Julia", "Kai", "Lena", "Marco", "Maya", "Nina",
+    "Omar", "Priya", "Ravi", "Sara", "Tom", "Yuki", "Zoe",
+)  # fmt: skip
+_LAST_NAMES = (
+    "Andersen", "Brown", "Chen", "Costa", "Dubois", "Garcia", "Huang", "Ivanov",
+    "Kim", "Kowalski", "Lee", "Lin", "Meyer", "Nakamura", "Novak", "Okafor",
+    "Patel", "Rossi", "Santos", "Schmidt", "Silva", "Tanaka", "Wang", "Wu",
+)  # fmt: skip
+_DEPARTMENTS = ("Engineering", "Product", "IT", "Sales", "Finance", "Support")
+
+
+def generate_directory(count: int, seed: int = 0) -> list[LDAPUser]:
+    """Generate a directory of random people.
+
+    Args:
+        count: Number of people.
+        seed: Random seed; the same seed gives the same directory.
+
+    Returns:
+        List of LDAPUser objects with unique emails under generated.company.com.
+    """
+    rng = random.Random(seed)
+    users = []
+    for i in range(count):
+        first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+        department = rng.choice(_DEPARTMENTS)
+        uid = f"{first}.{last}{i}".lower()
+        users.append(
+            LDAPUser(
+                dn=f"cn={uid},ou=users,dc=generated,dc=company,dc=com",
+                uid=uid,
+                email=f"{uid}@generated.company.com",
+                display_name=f"{first} {last}",
+                department=department,
+                groups=["employees", department.lower()],
+            )
+        )
+    return users
+
+
+class MockDirectory:
+    """Users of a mock directory server and their search index."""
+
+    def __init__(self, users: Iterable[LDAPUser]) -> None:
+        """Load the directory.
+
+        Args:
+            users: Directory entries.
+        """
+        self._lock = threading.Lock()
+        self.users = {user.email.lower(): user for user in users}
+        self.index = DirectorySearchIndex(
+            (user.email, user.display_name) for user in self.users.values()
+        )
+
+    def add_user(self, user: LDAPUser) -> None:
+        """Add or replace a directory entry.
+
+        Args:
+            user: Entry to store.
+        """
+        with self._lock:
+            self.users[user.email.lower()] = user
+            self.index.add(user.email, user.display_name)
+
+    def remove_user(self, email: str) -> None:
+        """Remove a directory entry.
+
+        Args:
+            email: Email of the entry; ignored if not present.
+        """
+        with self._lock:
+            self.users.pop(email.lower(), None)
+            self.index.remove(email)
+
+
 class MockLDAPService:
     """Mock LDAP service that simulates directory lookups."""
 
-    def __init__(self) -> None:
-        """Initialize mock LDAP service."""
-        self._users = MOCK_LDAP_USERS
+    def __init__(
+        self, latency: float = 0.0, directory: MockDirectory | None = None
+    ) -> None:
+        """Initialize mock LDAP service.
+
+        Args:
+            latency: Seconds each directory operation takes.
+            directory: Directory to serve; the demo users if not provided.
+        """
+        if directory is None:
+            directory = MockDirectory(MOCK_LDAP_USERS.values())
+        self._directory = directory
+        self._users = directory.users
         self._credentials = MOCK_CREDENTIALS
+        self._latency = latency
+        self.calls = 0
+
+    def _round_trip(self) -> None:
+        """Simulate a request to the directory server."""
+        self.calls += 1
+        if self._latency:
+            time.sleep(self._latency)
 
     def authenticate(self, email: str, password: str) -> LDAPUser | None:
         """Simulate LDAP authentication.
@@ -78,6 +191,7 @@ class MockLDAPService:
         Returns:
             LDAPUser if authenticated, None otherwise.
         """
+        self._round_trip()
         email_lower = email.lower()
         if email_lower in self._credentials and self._credentials[email_lower] == password:
             return self._users.get(email_lower)
@@ -92,26 +206,27 @@ class MockLDAPService:
         Returns:
             LDAPUser if found, None otherwise.
         """
+        self._round_trip()
         return self._users.get(email.lower())
 
-    def search_users(self, query: str) -> list[LDAPUser]:
+    def search_users(self, query: str, limit: int | None = None) -> list[LDAPUser]:
         """Search for users matching query.
 
         Args:
-            query: Search string to match against email or name.
+            query: Search string; each word is matched as a prefix of the
+                email or of a word of the email or name.
+            limit: Most users returned; all matches if None.
 
         Returns:
-            List of matching LDAPUser objects.
+            List of matching LDAPUser objects, best match first.
         """
-        results = []
-        query_lower = query.lower()
-        for user in self._users.values():
-            if (
-                query_lower in user.email.lower()
-                or query_lower in user.display_name.lower()
-            ):
-                results.append(user)
-        return results
+        self._round_trip()
+        users = self._users
+        return [
+            users[email]
+            for email in self._directory.index.search(query, limit)
+            if email in users
+        ]
 
     def get_user_groups(self, email: str) -> list[str]:
         """Get groups for a user.
@@ -122,5 +237,23 @@ class MockLDAPService:
         Returns:
             List of group names, empty list if user not found.
         """
+        self._round_trip()
         user = self._users.get(email.lower())
         return user.groups if user else []
+
+    def get_group_members(self, group: str) -> list[LDAPUser]:
+        """Get the members of a group.
+
+        Args:
+            group: Group name.
+
+        Returns:
+            List of LDAPUser objects in the group, empty list if none.
+        """
+        self._round_trip()
+        group_lower = group.lower()
+        return [
+            user
+            for user in self._users.values()
+            if group_lower in (g.lower() for g in user.groups)
+        ]
@@ -0,0 +1,231 @@
+"""Shared job snapshot store for the Jenkins Dashboard."""
+
+import itertools
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+from models.job import JenkinsJob
+from services.job_codec import EncodedJobList, encode_jobs
+
+# Sessions that have not rerun for this long stop holding their snapshot
+DEFAULT_SESSION_IDLE_TIMEOUT = 300  # seconds
+
+# Process-wide counter so snapshot versions never collide
+_version_counter = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class JobSnapshot:
+    """Immutable job list shared by every session that references it.
+
+    Jobs are held in encoded form and decoded lazily on first access.
+    """
+
+    version: int
+    jobs: EncodedJobList
+    created_at: datetime
+
+    @property
+    def payload(self) -> bytes:
+        """Encoded job list backing this snapshot."""
+        return self.jobs.payload
+
+
+def make_snapshot(
+    jobs: Iterable[JenkinsJob], created_at: datetime | None = None
+) -> JobSnapshot:
+    """Create a snapshot with a new, process-unique version.
+
+    Args:
+        jobs: Jobs to freeze into the snapshot
+        created_at: Time the job list was observed (default: now)
+
+    Returns:
+        New JobSnapshot instance
+    """
+    return _new_snapshot(encode_jobs(jobs), created_at or datetime.now())
+
+
+def _new_snapshot(payload: bytes, created_at: datetime) -> JobSnapshot:
+    """Create a snapshot of an encoded job list with a new version."""
+    return JobSnapshot(
+        version=next(_version_counter),
+        jobs=EncodedJobList(payload),
+        created_at=created_at,
+    )
+
+
+class SnapshotStore:
+    """Reference-counted store of job snapshots shared across sessions.
+
+    Sessions hold only a snapshot version. A version is kept alive while it is
+    the current snapshot or at least one session references it, and is freed
+    as soon as neither is true.
+    """
+
+    def __init__(self, idle_timeout: float = DEFAULT_SESSION_IDLE_TIMEOUT) -> None:
+        """Initialize the snapshot store.
+
+        Args:
+            idle_timeout: Seconds after which an inactive session's reference
+                is dropped
+        """
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._snapshots: dict[int, JobSnapshot] = {}
+        self._refcounts: dict[int, int] = {}
+        # session key -> (version, monotonic time of last access)
+        self._holders: dict[str, tuple[int, float]] = {}
+        self._current: int | None = None
+        self._polled_at: datetime | None = None
+
+    def publish(self, jobs: Iterable[JenkinsJob]) -> JobSnapshot:
+        """Publish a job list as the current snapshot.
+
+        A job list identical to the current snapshot's does not create a new
+        version, so polls that changed nothing keep every version-keyed cache
+        valid.
+
+        Args:
+            jobs: Freshly fetched jobs
+
+        Returns:
+            The newly created JobSnapshot, or the current one if the job list
+            is unchanged
+        """
+        payload = encode_jobs(jobs)
+        with self._lock:
+            current = (
+                self._snapshots.get(self._current)
+                if self._current is not None
+                else None
+            )
+            if current is not None and current.payload == payload:
+                self._polled_at = datetime.now()
+                self._expire_idle_locked(time.monotonic())
+                return current
+
+        snapshot = _new_snapshot(payload, datetime.now())
+        with self._lock:
+            self._snapshots[snapshot.version] = snapshot
+            self._refcounts.setdefault(snapshot.version, 0)
+            previous = self._current
+            self._current = snapshot.version
+            self._polled_at = snapshot.created_at
+            self._expire_idle_locked(time.monotonic())
+            if previous is not None:
+                self._free_if_unused_locked(previous)
+        return snapshot
+
+    def current(self) -> JobSnapshot | None:
+        """Get the most recently published snapshot.
+
+        Returns:
+            Current JobSnapshot, or None if nothing was published yet
+        """
+        with self._lock:
+            if self._current is None:
+                return None
+            return self._snapshots.get(self._current)
+
+    def last_poll(self) -> datetime | None:
+        """Get when a job list was last published, whether it changed or not.
+
+        Returns:
+            Time of the last publish, or None if nothing was published yet
+        """
+        with self._lock:
+            return self._polled_at
+
+    def get(self, version: int) -> JobSnapshot | None:
+        """Get a snapshot by version.
+
+        Args:
+            version: Snapshot version
+
+        Returns:
+            JobSnapshot if still alive, None if it has been freed
+        """
+        with self._lock:
+            return self._snapshots.get(version)
+
+    def acquire(self, session_key: str, version: int) -> JobSnapshot | None:
+        """Point a session at a snapshot version.
+
+        Any version the session held before is released.
+
+        Args:
+            session_key: Unique key of the session
+            version: Snapshot version the session wants to display
+
+        Returns:
+            The referenced JobSnapshot, or None if that version is gone
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(version)
+            if snapshot is None:
+                self._release_locked(session_key)
+                return None
+
+            held = self._holders.get(session_key)
+            if held is None or held[0] != version:
+                self._release_locked(session_key)
+                self._refcounts[version] += 1
+            self._holders[session_key] = (version, time.monotonic())
+            return snapshot
+
+    def release(self, session_key: str) -> None:
+        """Drop a session's snapshot reference.
+
+        Args:
+            session_key: Unique key of the session
+        """
+        with self._lock:
+            self._release_locked(session_key)
+
+    def expire_idle_sessions(self) -> int:
+        """Drop references held by sessions that went idle.
+
+        Returns:
+            Number of session references dropped
+        """
+        with self._lock:
+            return self._expire_idle_locked(time.monotonic())
+
+    def live_versions(self) -> list[int]:
+        """List versions currently held in memory.
+
+        Returns:
+            Sorted list of live snapshot versions
+        """
+        with self._lock:
+            return sorted(self._snapshots)
+
+    def _release_locked(self, session_key: str) -> None:
+        """Release a session reference. Caller must hold the lock."""
+        held = self._holders.pop(session_key, None)
+        if held is None:
+            return
+        version = held[0]
+        self._refcounts[version] -= 1
+        self._free_if_unused_locked(version)
+
+    def _free_if_unused_locked(self, version: int) -> None:
+        """Free a version nobody references. Caller must hold the lock."""
+        if version != self._current and self._refcounts.get(version, 0) <= 0:
+            self._snapshots.pop(version, None)
+            self._refcounts.pop(version, None)
+
+    def _expire_idle_locked(self, now: float) -> int:
+        """Release references of idle sessions. Caller must hold the lock."""
+        idle = [
+            key
+            for key, (_, last_seen) in self._holders.items()
+            if now - last_seen > self._idle_timeout
+        ]
+        for key in idle:
+            self._release_locked(key)
+        return len(idle)
@@ -0,0 +1,359 @@
+"""Read-only HTTP endpoint for job snapshots.
+
+Office TVs and chat bots only read the board, so they do not need a
+Streamlit session each. This server runs on a thread of the Streamlit
+process and serves:
+
+    /api/jobs     current job list and statistics as JSON
+    /wallboard    auto-refreshing HTML wallboard
+
+Snapshots come from the same cached Jenkins fetch the dashboard sessions use.
+Each response body is rendered and gzip-compressed once per snapshot version,
+poll and minute (the wallboard shows relative build times and the last poll
+time, which move on while the job list stays the same), and clients sending a
+matching If-None-Match get an empty 304, so serving a client costs a token
+check and a dictionary lookup.
+
+Clients authenticate with a token issued for a whitelisted email
+(issue_token), passed as a bearer token or as a ``token`` query parameter.
+Tokens are signed, so deactivating the email in the whitelist revokes them.
+"""
+
+import base64
+import gzip
+import hashlib
+import hmac
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from email.message import Message
+from html import escape
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from services.dashboard import calculate_statistics
+from services.snapshot import JobSnapshot
+
+# Environment variables configuring the endpoint; it is disabled unless both
+# the port and the token secret are set
+SNAPSHOT_API_HOST_ENV = "SNAPSHOT_API_HOST"
+SNAPSHOT_API_PORT_ENV = "SNAPSHOT_API_PORT"
+SNAPSHOT_API_SECRET_ENV = "SNAPSHOT_API_SECRET"
+
+# Interface the endpoint listens on unless SNAPSHOT_API_HOST widens it
+DEFAULT_HOST = "127.0.0.1"
+
+# Seconds a whitelist decision for a token's email is reused
+TOKEN_CACHE_TTL = 60
+
+# Rendered responses kept (two representations of the latest snapshots)
+RESPONSE_CACHE_SIZE = 4
+
+# Seconds a rendered response's relative build times are reused
+RESPONSE_TIME_RESOLUTION = 60
+
+# Responses smaller than this many bytes are not compressed
+GZIP_MIN_SIZE = 512
+
+_CONTENT_TYPES = {
+    "/api/jobs": "application/json",
+    "/wallboard": "text/html; charset=utf-8",
+}
+
+_WALLBOARD_PAGE = (
+    '<!doctype html><html><head><meta charset="utf-8">'
+    '<meta http-equiv="refresh" content="{refresh}">'
+    "<title>Jenkins Dashboard</title>"
+    "<style>body{{margin:8px;background:#111;color:#eee;"
+    "font-family:sans-serif}}p{{margin:0 0 8px}}</style>"
+    "</head><body><p>{summary}</p>{wallboard}</body></html>"
+)
+
+
+def issue_token(email: str, secret: bytes) -> str:
+    """Issue an endpoint token for an email.
+
+    Args:
+        email: Whitelisted email the token acts for
+        secret: Token signing secret
+
+    Returns:
+        URL-safe token
+    """
+    subject = base64.urlsafe_b64encode(email.lower().encode()).rstrip(b"=")
+    return f"{subject.decode()}.{_sign(subject, secret)}"
+
+
+def verify_token(token: str, secret: bytes) -> str | None:
+    """Check a token's signature.
+
+    Args:
+        token: Token from issue_token
+        secret: Token signing secret
+
+    Returns:
+        Email the token was issued for, or None if the token is invalid
+    """
+    subject, _, signature = token.partition(".")
+    # Compared as bytes: compare_digest rejects non-ASCII str with TypeError
+    expected = _sign(subject.encode(), secret).encode()
+    if not hmac.compare_digest(expected, signature.encode()):
+        return None
+    try:
+        return base64.urlsafe_b64decode(subject + "=" * (-len(subject) % 4)).decode()
+    except ValueError:
+        return None
+
+
+def _sign(subject: bytes, secret: bytes) -> str:
+    """Compute a token signature."""
+    return hmac.new(secret, subject, hashlib.sha256).hexdigest()[:32]
+
+
+@dataclass(frozen=True)
+class _Rendered:
+    """A response body in plain and compressed form, with its content hash."""
+
+    body: bytes
+    gzipped: bytes | None
+    etag: str  # content hash and time bucket
+
+
+class SnapshotServer:
+    """Session-less read-only JSON and HTML views of the current snapshot."""
+
+    def __init__(
+        self,
+        fetch: Callable[[], JobSnapshot | None],
+        is_allowed: Callable[[str], bool],
+        secret: bytes,
+        render_wallboard: Callable[[JobSnapshot, int], str],
+        refresh_seconds: int = 30,
+        last_poll: Callable[[], datetime | None] | None = None,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            fetch: Returns the current snapshot, or None if there is none;
+                called once per request, so it must be cached
+            is_allowed: Checks whether an email may read the board
+            secret: Token signing secret
+            render_wallboard: Builds the wallboard HTML of a snapshot, with
+                relative build times against a time in epoch milliseconds
+            refresh_seconds: Interval at which the wallboard page reloads
+            last_poll: Returns when Jenkins was last polled; the snapshot
+                time is shown if not given or None
+        """
+        self._fetch = fetch
+        self._is_allowed = is_allowed
+        self._secret = secret
+        self._render_wallboard = render_wallboard
+        self._refresh_seconds = refresh_seconds
+        self._last_poll = last_poll
+        self._lock = threading.Lock()
+        self._responses: OrderedDict[tuple[int, str, int, datetime], _Rendered] = (
+            OrderedDict()
+        )
+        self._allowed: dict[str, tuple[float, bool]] = {}
+        self._httpd: ThreadingHTTPServer | None = None
+
+    def handle(
+        self, target: str, headers: Mapping[str, str] | Message
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Answer a GET request.
+
+        Args:
+            target: Request path with query string
+            headers: Request headers; a Message looks names up
+                case-insensitively
+
+        Returns:
+            Tuple of (status code, response headers, body)
+        """
+        url = urlsplit(target)
+        content_type = _CONTENT_TYPES.get(url.path)
+        if content_type is None:
+            return self._error(HTTPStatus.NOT_FOUND, "Not found")
+
+        status = self._authorize(url.query, headers.get("Authorization", ""))
+        if status is not HTTPStatus.OK:
+            return self._error(status, status.phrase)
+
+        snapshot = self._fetch()
+        if snapshot is None:
+            return self._error(HTTPStatus.SERVICE_UNAVAILABLE, "No job data yet")
+
+        polled_at = (self._last_poll() if self._last_poll else None) or (
+            snapshot.created_at
+        )
+        rendered = self._rendered(snapshot, url.path, polled_at)
+        response_headers = {
+            "Content-Type": content_type,
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding, Authorization",
+        }
+        body, etag = rendered.body, f'"{rendered.etag}"'
+        if rendered.gzipped is not None and "gzip" in headers.get(
+            "Accept-Encoding", ""
+        ):
+            # Each encoding of a body gets its own strong validator
+            body, etag = rendered.gzipped, f'"{rendered.etag}-gzip"'
+            response_headers["Content-Encoding"] = "gzip"
+        response_headers["ETag"] = etag
+
+        if etag in headers.get("If-None-Match", ""):
+            response_headers.pop("Content-Encoding", None)
+            return HTTPStatus.NOT_MODIFIED, response_headers, b""
+        return HTTPStatus.OK, response_headers, body
+
+    def serve(self, host: str = DEFAULT_HOST, port: int = 0) -> tuple[str, int]:
+        """Start serving on a background thread.
+
+        Args:
+            host: Interface to listen on; loopback only by default
+            port: Port to listen on; any free port if 0
+
+        Returns:
+            Bound (host, port)
+        """
+        self._httpd = ThreadingHTTPServer((host, port), _handler_class(self))
+        self._httpd.daemon_threads = True
+        threading.Thread(
+            target=self._httpd.serve_forever, name="snapshot-server", daemon=True
+        ).start()
+        bound_host, bound_port = self._httpd.server_address[:2]
+        return str(bound_host), int(bound_port)
+
+    def close(self) -> None:
+        """Stop serving."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def _authorize(self, query: str, authorization: str) -> HTTPStatus:
+        """Check the request token and whether its email is whitelisted."""
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer":
+            token = next(iter(parse_qs(query).get("token", [])), "")
+        email = verify_token(token, self._secret) if token else None
+        if email is None:
+            return HTTPStatus.UNAUTHORIZED
+
+        now = time.monotonic()
+        with self._lock:
+            cached = self._allowed.get(email)
+        if cached is None or cached[0] <= now:
+            cached = (now + TOKEN_CACHE_TTL, self._is_allowed(email))
+            with self._lock:
+                self._allowed[email] = cached
+        return HTTPStatus.OK if cached[1] else HTTPStatus.FORBIDDEN
+
+    def _rendered(
+        self, snapshot: JobSnapshot, path: str, polled_at: datetime
+    ) -> _Rendered:
+        """Get a snapshot's response body, rendering it once per poll and minute."""
+        bucket = int(time.time() // RESPONSE_TIME_RESOLUTION)
+        key = (snapshot.version, path, bucket, polled_at)
+        with self._lock:
+            rendered = self._responses.get(key)
+            if rendered is not None:
+                self._responses.move_to_end(key)
+                return rendered
+
+        if path == "/wallboard":
+            now_ms = bucket * RESPONSE_TIME_RESOLUTION * 1000
+            body = self._wallboard_page(snapshot, polled_at, now_ms).encode()
+        else:
+            document = _snapshot_json(snapshot, polled_at)
+            body = json.dumps(document, separators=(",", ":")).encode()
+        rendered = _Rendered(
+            body=body,
+            gzipped=gzip.compress(body, mtime=0)
+            if len(body) >= GZIP_MIN_SIZE
+            else None,
+            etag=f"{hashlib.blake2b(body, digest_size=12).hexdigest()}-{bucket:x}",
+        )
+
+        with self._lock:
+            self._responses[key] = rendered
+            if len(self._responses) > RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        return rendered
+
+    def _wallboard_page(
+        self, snapshot: JobSnapshot, polled_at: datetime, now_ms: int
+    ) -> str:
+        """Build the standalone wallboard page of a snapshot."""
+        stats = calculate_statistics(snapshot.jobs)
+        summary = (
+            f"{stats['total']} jobs · {stats['failure']} failing · "
+            f"{stats['building']} building · {stats['success_rate']}% success · "
+            f"updated {polled_at:%H:%M:%S}"
+        )
+        return _WALLBOARD_PAGE.format(
+            refresh=self._refresh_seconds,
+            summary=escape(summary),
+            wallboard=self._render_wallboard(snapshot, now_ms),
+        )
+
+    @staticmethod
+    def _error(status: HTTPStatus, message: str) -> tuple[int, dict[str, str], bytes]:
+        """Build a JSON error response."""
+        body = json.dumps({"error": message}).encode()
+        return status, {"Content-Type": "application/json"}, body
+
+
+def _snapshot_json(snapshot: JobSnapshot, polled_at: datetime) -> dict:
+    """Build the JSON document of a snapshot."""
+    return {
+        "version": snapshot.version,
+        "created_at": snapshot.created_at.isoformat(),
+        "polled_at": polled_at.isoformat(),
+        "statistics": calculate_statistics(snapshot.jobs),
+        "jobs": [
+            {
+                "name": job.name,
+                "url": job.url,
+                "status": job.status.value,
+                "last_build_number": job.last_build_number,
+                "last_build_result": job.last_build_result,
+                "last_build_timestamp": _isoformat(job.last_build_timestamp),
+                "last_build_duration_ms": job.last_build_duration_ms,
+                "is_building": job.is_building,
+            }
+            for job in snapshot.jobs
+        ],
+    }
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    """Format an optional datetime."""
+    return value.isoformat() if value else None
+
+
+def _handler_class(server: SnapshotServer) -> type[BaseHTTPRequestHandler]:
+    """Build a request handler class bound to a SnapshotServer."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            status, headers, body = server.handle(self.path, self.headers)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args: object) -> None:
+            # Polling clients would flood the Streamlit log
+            pass
+
+    return Handler
@@ -0,0 +1,233 @@
+"""Snapshot timeline for replaying past states of the dashboard.
+
+Polls are stored as periodic keyframes (the full job list) plus deltas that
+hold only the jobs that changed and the names of jobs that disappeared.
+Reconstructing a point in time seeks to the nearest keyframe at or before it
+and applies the deltas that follow, so the work is bounded by the keyframe
+interval rather than by the length of the history.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+from models.job import JenkinsJob
+from services.job_codec import decode_jobs, encode_jobs
+from services.snapshot import JobSnapshot, make_snapshot
+
+# Default timeline database path
+TIMELINE_DB_PATH = Path("history/timeline.db")
+
+# A full keyframe is written after this many deltas (1 hour of 30s polls)
+KEYFRAME_INTERVAL = 120
+
+# How long frames are kept
+RETENTION_SECONDS = 7 * 86400
+
+# Reconstructed snapshots kept for repeated slider positions
+RECONSTRUCTION_CACHE_SIZE = 16
+
+_KEYFRAME = 0
+_DELTA = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS frames (
+    ts INTEGER PRIMARY KEY,
+    kind INTEGER NOT NULL,
+    jobs BLOB NOT NULL,
+    removed TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS frames_keyframes ON frames (kind, ts);
+"""
+
+
+class SnapshotTimeline:
+    """Keyframe + delta store of job snapshots over time."""
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+    ) -> None:
+        """Open (or create) the timeline store.
+
+        Args:
+            path: SQLite database path, or ":memory:". Uses default if not
+                provided.
+            keyframe_interval: Number of deltas written between keyframes
+        """
+        path = path or TIMELINE_DB_PATH
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._keyframe_interval = keyframe_interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._cache: OrderedDict[int, JobSnapshot] = OrderedDict()
+
+        # Last recorded state; rebuilt from disk so deltas continue after restart
+        self._last_jobs: dict[str, JenkinsJob] = {}
+        self._deltas_since_keyframe = self._keyframe_interval
+        last_ts = self._conn.execute("SELECT MAX(ts) FROM frames").fetchone()[0]
+        reconstructed = self._reconstruct_locked(last_ts) if last_ts else None
+        if reconstructed is not None:
+            self._last_jobs = reconstructed[1]
+            self._deltas_since_keyframe = self._conn.execute(
+                "SELECT COUNT(*) FROM frames WHERE kind = ? AND ts > "
+                "(SELECT MAX(ts) FROM frames WHERE kind = ?)",
+                (_DELTA, _KEYFRAME),
+            ).fetchone()[0]
+
+    def record(self, jobs: Iterable[JenkinsJob], timestamp: int | None = None) -> None:
+        """Record the job list of one poll.
+
+        Polls that changed nothing are not stored. A poll in the same second
+        as the previous frame is folded into that frame: a keyframe stays a
+        keyframe, and a delta absorbs the new changes.
+
+        Args:
+            jobs: Jobs of the poll
+            timestamp: Poll time in epoch seconds (default: now)
+        """
+        ts = int(time.time()) if timestamp is None else timestamp
+        current = {job.name: job for job in jobs}
+
+        with self._lock:
+            existing = self._conn.execute(
+                "SELECT kind, jobs, removed FROM frames WHERE ts = ?", (ts,)
+            ).fetchone()
+            if self._deltas_since_keyframe >= self._keyframe_interval:
+                row = (ts, _KEYFRAME, encode_jobs(current.values()), "")
+                self._deltas_since_keyframe = 0
+            else:
+                last = self._last_jobs
+                changed = {
+                    name for name, job in current.items() if last.get(name) != job
+                }
+                removed = {name for name in last if name not in current}
+                if not changed and not removed:
+                    return
+                if existing is not None and existing[0] == _KEYFRAME:
+                    row = (ts, _KEYFRAME, encode_jobs(current.values()), "")
+                else:
+                    if existing is not None:
+                        # Net change of both polls since the frame before
+                        changed |= {job.name for job in decode_jobs(existing[1])}
+                        removed |= set(existing[2].split("\n")) - {""}
+                    else:
+                        self._deltas_since_keyframe += 1
+                    row = (
+                        ts,
+                        _DELTA,
+                        encode_jobs(
+                            job for name, job in current.items() if name in changed
+                        ),
+                        "\n".join(sorted(removed - current.keys())),
+                    )
+
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO frames (ts, kind, jobs, removed) "
+                    "VALUES (?, ?, ?, ?)",
+                    row,
+                )
+                self._prune_locked(ts - RETENTION_SECONDS)
+            self._cache.pop(ts, None)
+            self._last_jobs = current
+
+    def bounds(self) -> tuple[datetime, datetime] | None:
+        """Get the time range covered by the timeline.
+
+        Returns:
+            (first, last) frame times, or None if nothing was recorded
+        """
+        with self._lock:
+            first, last = self._conn.execute(
+                "SELECT MIN(ts), MAX(ts) FROM frames"
+            ).fetchone()
+        if first is None:
+            return None
+        return datetime.fromtimestamp(first), datetime.fromtimestamp(last)
+
+    def snapshot_at(self, moment: datetime) -> JobSnapshot | None:
+        """Reconstruct the job list as it was at a point in time.
+
+        Args:
+            moment: Point in time to reconstruct
+
+        Returns:
+            JobSnapshot of the board at that time (created_at is the time of
+            the frame it was built from), or None if the timeline does not
+            reach back that far
+        """
+        at = int(moment.timestamp())
+        with self._lock:
+            frame_ts = self._conn.execute(
+                "SELECT MAX(ts) FROM frames WHERE ts <= ?", (at,)
+            ).fetchone()[0]
+            if frame_ts is None:
+                return None
+
+            snapshot = self._cache.get(frame_ts)
+            if snapshot is not None:
+                self._cache.move_to_end(frame_ts)
+                return snapshot
+
+            reconstructed = self._reconstruct_locked(frame_ts)
+            if reconstructed is None:
+                return None
+            snapshot = make_snapshot(
+                reconstructed[1].values(), datetime.fromtimestamp(frame_ts)
+            )
+            self._cache[frame_ts] = snapshot
+            if len(self._cache) > RECONSTRUCTION_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            return snapshot
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _reconstruct_locked(self, at: int) -> tuple[int, dict[str, JenkinsJob]] | None:
+        """Apply frames from the nearest keyframe up to a time.
+
+        Caller must hold the lock.
+
+        Returns:
+            (keyframe time, jobs by name), or None if no keyframe precedes it
+        """
+        keyframe_ts = self._conn.execute(
+            "SELECT MAX(ts) FROM frames WHERE kind = ? AND ts <= ?",
+            (_KEYFRAME, at),
+        ).fetchone()[0]
+        if keyframe_ts is None:
+            return None
+
+        jobs: dict[str, JenkinsJob] = {}
+        for blob, removed in self._conn.execute(
+            "SELECT jobs, removed FROM frames WHERE ts >= ? AND ts <= ? ORDER BY ts",
+            (keyframe_ts, at),
+        ):
+            for name in removed.split("\n") if removed else ():
+                jobs.pop(name, None)
+            for job in decode_jobs(blob):
+                jobs[job.name] = job
+        return keyframe_ts, jobs
+
+    def _prune_locked(self, cutoff: int) -> None:
+        """Delete frames no longer needed to reconstruct times after cutoff.
+
+        Caller must hold the lock.
+        """
+        keyframe_ts = self._conn.execute(
+            "SELECT MAX(ts) FROM frames WHERE kind = ? AND ts <= ?",
+            (_KEYFRAME, cutoff),
+        ).fetchone()[0]
+        if keyframe_ts is not None:
+            self._conn.execute("DELETE FROM frames WHERE ts < ?", (keyframe_ts,))
@@ -1,50 +1,330 @@
-"""User whitelist management service."""
+"""User whitelist management service.
 
+The parsed whitelist is cached in process, shared by every service instance
+reading the same file. The file is checked for changes (modification time,
+size and inode) at most once per check interval, so the authorization checks
+made on every rerun of every session do not re-read and re-parse it. Writes
+through the service update the cache immediately.
+
+Each loaded whitelist is indexed by normalized email once, so checking a user
+is a dictionary lookup rather than a scan of every entry.
+
+Deactivated entries are moved to an archive file next to the whitelist by
+compact once they have been inactive longer than a retention window, which
+keeps the file read and parsed by every process small. Adding an archived
+user again restores their entry from the archive.
+
+Besides individual emails, the whitelist holds directory groups whose
+members are allowed; see services.group_access for how they are checked.
+
+For large whitelists and concurrent admins, SqliteWhitelistService offers the
+same API on SQLite, with single-row transactional updates instead of
+rewriting the whole file. create_whitelist_service picks the backend from the
+environment.
+"""
+
+import copy
+import dataclasses
+import functools
+import itertools
 import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
-from models.whitelist import Whitelist, WhitelistEntry
+from models.whitelist import (
+    BulkImportReport,
+    Whitelist,
+    WhitelistEntry,
+    WhitelistGroup,
+)
 
 DEFAULT_WHITELIST_PATH = Path(__file__).parent.parent / "data" / "allowed_users.json"
+DEFAULT_WHITELIST_DB_PATH = DEFAULT_WHITELIST_PATH.with_suffix(".db")
+
+# Environment variables selecting the whitelist storage: "json" (default) or
+# "sqlite", and the SQLite database path
+WHITELIST_BACKEND_ENV = "WHITELIST_BACKEND"
+WHITELIST_DB_PATH_ENV = "WHITELIST_DB_PATH"
+
+# Days a deactivated entry stays in the whitelist before compact archives it
+WHITELIST_ARCHIVE_RETENTION_DAYS = 90
+
+# Minimum seconds between checks of the whitelist file for outside changes
+WHITELIST_CHECK_INTERVAL = 0.5
+
+# File identity of a parsed whitelist: (mtime_ns, size, inode), or None if the
+# file did not exist
+FileStamp = tuple[int, int, int] | None
+
+
+@dataclass(frozen=True)
+class _WhitelistIndex:
+    """Positions of whitelist entries by normalized email."""
+
+    users: dict[str, int]
+    admins: dict[str, int]
+    groups: dict[str, int]  # by normalized group name
+    active_groups: frozenset[str]
+
+
+# Source of whitelist versions; every parsed or saved whitelist gets a new one
+_generations = itertools.count(1)
+
+
+@dataclass
+class _CachedWhitelist:
+    """A parsed whitelist, its index and the file state it was parsed from."""
+
+    whitelist: Whitelist
+    index: _WhitelistIndex
+    stamp: FileStamp
+    checked_at: float  # monotonic time of the last file check
+    generation: int = field(default_factory=lambda: next(_generations))
+
+
+_cache: dict[Path, _CachedWhitelist] = {}
+_cache_lock = threading.Lock()
+
+
+def _normalize_email(email: str) -> str:
+    """Normalize an email for comparison."""
+    return email.lower()
+
+
+def _index_entries(entries: list[WhitelistEntry]) -> dict[str, int]:
+    """Map normalized emails to entry positions, preferring active entries.
+
+    Args:
+        entries: Whitelist entries.
+
+    Returns:
+        Dictionary of normalized email to position in entries.
+    """
+    index: dict[str, int] = {}
+    for position, entry in enumerate(entries):
+        email = _normalize_email(entry.email)
+        current = index.get(email)
+        if current is None or (entry.active and not entries[current].active):
+            index[email] = position
+    return index
+
+
+def _normalize_group(name: str) -> str:
+    """Normalize a directory group name for comparison."""
+    return name.strip().lower()
+
+
+def _merge_entries(
+    entries: list[WhitelistEntry], newer: list[WhitelistEntry]
+) -> list[WhitelistEntry]:
+    """Append entries, replacing any existing ones with the same email."""
+    keys = {_normalize_email(entry.email) for entry in newer}
+    kept = [entry for entry in entries if _normalize_email(entry.email) not in keys]
+    return kept + newer
+
+
+def _build_index(whitelist: Whitelist) -> _WhitelistIndex:
+    """Index a whitelist's users and admins by normalized email."""
+    groups = {_normalize_group(g.name): i for i, g in enumerate(whitelist.groups)}
+    return _WhitelistIndex(
+        users=_index_entries(whitelist.users),
+        admins=_index_entries(whitelist.admins),
+        groups=groups,
+        active_groups=frozenset(
+            key for key, i in groups.items() if whitelist.groups[i].active
+        ),
+    )
+
+
+def _find(
+    entries: list[WhitelistEntry], index: dict[str, int], email: str
+) -> WhitelistEntry | None:
+    """Look up an entry by email, an active one if there are duplicates."""
+    position = index.get(_normalize_email(email))
+    return entries[position] if position is not None else None
+
+
+def _find_for_update(
+    entries: list[WhitelistEntry], index: dict[str, int], email: str
+) -> WhitelistEntry | None:
+    """Look up an entry like _find, swapping in a private copy to modify.
+
+    Args:
+        entries: Entry list of a whitelist from _load_for_update.
+        index: Positions of the entries by normalized email.
+        email: Email to look up.
+
+    Returns:
+        Copy of the entry, now stored in entries, or None if not found.
+    """
+    position = index.get(_normalize_email(email))
+    if position is None:
+        return None
+    entry = entries[position] = copy.copy(entries[position])
+    return entry
 
 
 class WhitelistService:
     """Service for managing the user access whitelist."""
 
-    def __init__(self, path: Path | None = None) -> None:
+    def __init__(
+        self,
+        path: Path | None = None,
+        check_interval: float = WHITELIST_CHECK_INTERVAL,
+        archive_path: Path | None = None,
+    ) -> None:
         """Initialize whitelist service.
 
         Args:
             path: Path to whitelist JSON file. Uses default if not provided.
+            check_interval: Minimum seconds between checks of the file for
+                changes made outside this process.
+            archive_path: Path to the archive of compacted entries. Defaults
+                to <whitelist name>.archive.json next to the whitelist.
         """
-        self._path = path or DEFAULT_WHITELIST_PATH
+        self._path = (path or DEFAULT_WHITELIST_PATH).resolve()
+        self._check_interval = check_interval
+        self._archive_path = (
+            archive_path or self._path.with_name(f"{self._path.stem}.archive.json")
+        ).resolve()
 
     def _load(self) -> Whitelist:
-        """Load whitelist from JSON file.
+        """Load the whitelist, from the in-process cache if the file is unchanged.
+
+        The returned object is shared; callers must not modify it. Use
+        _load_for_update to get a copy to change and save.
 
         Returns:
             Whitelist object with all entries.
         """
-        if not self._path.exists():
-            return self._create_default()
+        return self._load_indexed()[0]
+
+    def _load_indexed(self) -> tuple[Whitelist, _WhitelistIndex]:
+        """Load the whitelist and its email index.
+
+        Returns:
+            Tuple of (shared Whitelist object, its index).
+        """
+        cached = self._load_cached()
+        return cached.whitelist, cached.index
+
+    def _load_cached(self) -> _CachedWhitelist:
+        """Get the cache entry of the whitelist, re-reading the file if changed.
+
+        Returns:
+            Shared cache entry.
+        """
+        now = time.monotonic()
+        with _cache_lock:
+            cached = _cache.get(self._path)
+            if cached is not None and now - cached.checked_at < self._check_interval:
+                return cached
+
+        stamp = self._stamp()
+        if cached is not None and cached.stamp == stamp:
+            with _cache_lock:
+                cached.checked_at = now
+            return cached
 
+        whitelist = self._read() if stamp is not None else self._create_default()
+        cached = _CachedWhitelist(whitelist, _build_index(whitelist), stamp, now)
+        with _cache_lock:
+            _cache[self._path] = cached
+        return cached
+
+    def _load_for_update(self) -> tuple[Whitelist, _WhitelistIndex]:
+        """Load a copy of the whitelist to modify and save.
+
+        Only the whitelist and its entry lists are copied; the entries are
+        still shared with readers, so an entry must be copied before it is
+        changed (see _find_for_update).
+
+        Returns:
+            Tuple of (Whitelist object with lists not shared with readers,
+            its index).
+        """
+        whitelist, index = self._load_indexed()
+        return (
+            dataclasses.replace(
+                whitelist,
+                users=list(whitelist.users),
+                admins=list(whitelist.admins),
+                groups=list(whitelist.groups),
+            ),
+            index,
+        )
+
+    def _read(self) -> Whitelist:
+        """Read and parse the whitelist JSON file.
+
+        Returns:
+            Parsed Whitelist object.
+        """
         with open(self._path, encoding="utf-8") as f:
             data = json.load(f)
 
         return self._parse_whitelist(data)
 
+    def _stamp(self) -> FileStamp:
+        """Get the modification time, size and inode of the whitelist file.
+
+        Returns:
+            File stamp, or None if the file does not exist.
+        """
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
     def _save(self, whitelist: Whitelist) -> None:
-        """Save whitelist to JSON file.
+        """Save whitelist to JSON file and make it the cached whitelist.
 
         Args:
-            whitelist: Whitelist object to save.
+            whitelist: Whitelist object to save; must not be modified after.
         """
         self._path.parent.mkdir(parents=True, exist_ok=True)
         data = self._serialize_whitelist(whitelist)
         with open(self._path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
+        index = _build_index(whitelist)
+        stamp = self._stamp()
+        with _cache_lock:
+            _cache[self._path] = _CachedWhitelist(
+                whitelist, index, stamp, time.monotonic()
+            )
+
+    def _archive(self) -> "WhitelistService":
+        """Get a service for the archive file, which has the whitelist format.
+
+        Returns:
+            WhitelistService reading and writing the archive.
+        """
+        return WhitelistService(self._archive_path, self._check_interval)
+
+    def _drop_archived(self, emails: Iterable[str]) -> None:
+        """Remove restored users from the archive.
+
+        Args:
+            emails: Emails of the users restored to the whitelist.
+        """
+        keys = {_normalize_email(email) for email in emails}
+        if not keys:
+            return
+        archive = self._archive()
+        whitelist, _ = archive._load_for_update()
+        users = [u for u in whitelist.users if _normalize_email(u.email) not in keys]
+        if len(users) != len(whitelist.users):
+            whitelist.users = users
+            archive._save(whitelist)
+
     def _create_default(self) -> Whitelist:
         """Create a default empty whitelist.
 
@@ -73,6 +353,17 @@ class WhitelistService:
             timestamp_str = timestamp_str[:-1] + "+00:00"
         return datetime.fromisoformat(timestamp_str)
 
+    def _parse_optional_timestamp(self, timestamp_str: str | None) -> datetime | None:
+        """Parse an ISO format timestamp string that may be missing.
+
+        Args:
+            timestamp_str: Timestamp string in ISO format, or None.
+
+        Returns:
+            Parsed datetime object, or None.
+        """
+        return self._parse_timestamp(timestamp_str) if timestamp_str else None
+
     def _parse_whitelist(self, data: dict) -> Whitelist:
         """Parse JSON data into Whitelist object.
 
@@ -89,6 +380,7 @@ class WhitelistService:
                 added_at=self._parse_timestamp(u["added_at"]),
                 added_by=u["added_by"],
                 active=u.get("active", True),
+                deactivated_at=self._parse_optional_timestamp(u.get("deactivated_at")),
             )
             for u in data.get("users", [])
         ]
@@ -100,16 +392,28 @@ class WhitelistService:
                 added_at=self._parse_timestamp(a["added_at"]),
                 added_by=a["added_by"],
                 active=a.get("active", True),
+                deactivated_at=self._parse_optional_timestamp(a.get("deactivated_at")),
             )
             for a in data.get("admins", [])
         ]
 
+        groups = [
+            WhitelistGroup(
+                name=g["name"],
+                added_at=self._parse_timestamp(g["added_at"]),
+                added_by=g["added_by"],
+                active=g.get("active", True),
+            )
+            for g in data.get("groups", [])
+        ]
+
         return Whitelist(
             version=data.get("version", "1.0"),
             last_updated=self._parse_timestamp(data["last_updated"]),
             updated_by=data.get("updated_by", "unknown"),
             users=users,
             admins=admins,
+            groups=groups,
         )
 
     def _serialize_whitelist(self, whitelist: Whitelist) -> dict:
@@ -132,6 +436,9 @@ class WhitelistService:
                     "added_at": u.added_at.isoformat(),
                     "added_by": u.added_by,
                     "active": u.active,
+                    "deactivated_at": u.deactivated_at.isoformat()
+                    if u.deactivated_at
+                    else None,
                 }
                 for u in whitelist.users
             ],
@@ -142,11 +449,34 @@ class WhitelistService:
                     "added_at": a.added_at.isoformat(),
                     "added_by": a.added_by,
                     "active": a.active,
+                    "deactivated_at": a.deactivated_at.isoformat()
+                    if a.deactivated_at
+                    else None,
                 }
                 for a in whitelist.admins
             ],
+            "groups": [
+                {
+                    "name": g.name,
+                    "added_at": g.added_at.isoformat(),
+                    "added_by": g.added_by,
+                    "active": g.active,
+                }
+                for g in whitelist.groups
+            ],
         }
 
+    def version(self) -> int:
+        """Get the version of the whitelist.
+
+        The version changes whenever the whitelist is saved or the file is
+        found changed, so it can tag results derived from the whitelist.
+
+        Returns:
+            Opaque version number.
+        """
+        return self._load_cached().generation
+
     def is_user_allowed(self, email: str) -> bool:
         """Check if user email is in whitelist.
 
@@ -156,12 +486,12 @@ class WhitelistService:
         Returns:
             True if user is whitelisted and active.
         """
-        whitelist = self._load()
-        all_entries = whitelist.users + whitelist.admins
-        return any(
-            entry.email.lower() == email.lower() and entry.active
-            for entry in all_entries
-        )
+        whitelist, index = self._load_indexed()
+        user = _find(whitelist.users, index.users, email)
+        if user is not None and user.active:
+            return True
+        admin = _find(whitelist.admins, index.admins, email)
+        return admin is not None and admin.active
 
     def is_admin(self, email: str) -> bool:
         """Check if user email is an admin.
@@ -172,11 +502,9 @@ class WhitelistService:
         Returns:
             True if user is an active admin.
         """
-        whitelist = self._load()
-        return any(
-            admin.email.lower() == email.lower() and admin.active
-            for admin in whitelist.admins
-        )
+        whitelist, index = self._load_indexed()
+        admin = _find(whitelist.admins, index.admins, email)
+        return admin is not None and admin.active
 
     def add_user(self, email: str, name: str, added_by: str) -> bool:
         """Add a user to the whitelist.
@@ -189,21 +517,28 @@ class WhitelistService:
         Returns:
             True if user was added, False if already exists.
         """
-        whitelist = self._load()
+        whitelist, index = self._load_for_update()
 
         # Check if user already exists
-        for user in whitelist.users:
-            if user.email.lower() == email.lower():
-                if not user.active:
-                    # Reactivate existing user
-                    user.active = True
-                    user.added_at = datetime.now()
-                    user.added_by = added_by
-                    whitelist.last_updated = datetime.now()
-                    whitelist.updated_by = added_by
-                    self._save(whitelist)
-                    return True
+        user = _find_for_update(whitelist.users, index.users, email)
+        if user is not None:
+            if user.active:
                 return False
+            # Reactivate existing user
+            user.active = True
+            user.added_at = datetime.now()
+            user.added_by = added_by
+            user.deactivated_at = None
+            whitelist.last_updated = datetime.now()
+            whitelist.updated_by = added_by
+            self._save(whitelist)
+            return True
+
+        archive, archive_index = self._archive()._load_indexed()
+        archived = _find(archive.users, archive_index.users, email)
+        if archived is not None:
+            # Restore the archived user, keeping their name
+            name = archived.name
 
         # Add new user
         new_user = WhitelistEntry(
@@ -217,8 +552,67 @@ class WhitelistService:
         whitelist.last_updated = datetime.now()
         whitelist.updated_by = added_by
         self._save(whitelist)
+        if archived is not None:
+            self._drop_archived([email])
         return True
 
+    def add_users(
+        self, entries: Iterable[tuple[str, str]], added_by: str
+    ) -> BulkImportReport:
+        """Add many users to the whitelist with a single load and save.
+
+        Args:
+            entries: (email, name) pairs to add.
+            added_by: Email of admin adding the users.
+
+        Returns:
+            BulkImportReport of added, reactivated and skipped emails.
+        """
+        whitelist, index = self._load_for_update()
+        archive, archive_index = self._archive()._load_indexed()
+        report = BulkImportReport()
+        restored = []
+        seen: set[str] = set()
+        now = datetime.now()
+        for email, name in entries:
+            key = _normalize_email(email)
+            if key in seen:
+                report.skipped.append(email)
+                continue
+            seen.add(key)
+
+            user = _find_for_update(whitelist.users, index.users, email)
+            if user is None:
+                archived = _find(archive.users, archive_index.users, email)
+                whitelist.users.append(
+                    WhitelistEntry(
+                        email=email,
+                        name=archived.name if archived is not None else name,
+                        added_at=now,
+                        added_by=added_by,
+                    )
+                )
+                if archived is not None:
+                    restored.append(email)
+                    report.reactivated.append(email)
+                else:
+                    report.added.append(email)
+            elif user.active:
+                report.skipped.append(email)
+            else:
+                user.active = True
+                user.added_at = now
+                user.added_by = added_by
+                user.deactivated_at = None
+                report.reactivated.append(email)
+
+        if report.changed:
+            whitelist.last_updated = now
+            whitelist.updated_by = added_by
+            self._save(whitelist)
+            self._drop_archived(restored)
+        return report
+
     def remove_user(self, email: str, removed_by: str) -> bool:
         """Remove (deactivate) a user from whitelist.
 
@@ -229,17 +623,44 @@ class WhitelistService:
         Returns:
             True if user was removed, False if not found.
         """
-        whitelist = self._load()
+        whitelist, index = self._load_for_update()
+
+        user = _find_for_update(whitelist.users, index.users, email)
+        if user is None or not user.active:
+            return False
+
+        user.active = False
+        user.deactivated_at = datetime.now()
+        whitelist.last_updated = datetime.now()
+        whitelist.updated_by = removed_by
+        self._save(whitelist)
+        return True
+
+    def remove_users(self, emails: Iterable[str], removed_by: str) -> list[str]:
+        """Remove (deactivate) many users with a single load and save.
 
-        for user in whitelist.users:
-            if user.email.lower() == email.lower() and user.active:
+        Args:
+            emails: User emails to remove.
+            removed_by: Email of admin removing the users.
+
+        Returns:
+            Emails that were deactivated; unknown or inactive ones are left out.
+        """
+        whitelist, index = self._load_for_update()
+        removed = []
+        now = datetime.now()
+        for email in emails:
+            user = _find_for_update(whitelist.users, index.users, email)
+            if user is not None and user.active:
                 user.active = False
-                whitelist.last_updated = datetime.now()
-                whitelist.updated_by = removed_by
-                self._save(whitelist)
-                return True
+                user.deactivated_at = now
+                removed.append(email)
 
-        return False
+        if removed:
+            whitelist.last_updated = now
+            whitelist.updated_by = removed_by
+            self._save(whitelist)
+        return removed
 
     def list_users(self, include_inactive: bool = False) -> list[WhitelistEntry]:
         """List all whitelisted users.
@@ -252,7 +673,7 @@ class WhitelistService:
         """
         whitelist = self._load()
         if include_inactive:
-            return whitelist.users
+            return list(whitelist.users)
         return [u for u in whitelist.users if u.active]
 
     def list_admins(self, include_inactive: bool = False) -> list[WhitelistEntry]:
@@ -266,5 +687,642 @@ class WhitelistService:
         """
         whitelist = self._load()
         if include_inactive:
-            return whitelist.admins
+            return list(whitelist.admins)
         return [a for a in whitelist.admins if a.active]
+
+    def allowed_groups(self) -> frozenset[str]:
+        """Get the directory groups whose members are allowed.
+
+        Returns:
+            Normalized (lowercase) names of the active group rules.
+        """
+        return self._load_indexed()[1].active_groups
+
+    def add_group(self, name: str, added_by: str) -> bool:
+        """Allow the members of a directory group.
+
+        Args:
+            name: Group name, matched case-insensitively.
+            added_by: Email of admin adding the group.
+
+        Returns:
+            True if the group was added, False if already allowed.
+        """
+        whitelist, index = self._load_for_update()
+        now = datetime.now()
+        position = index.groups.get(_normalize_group(name))
+        if position is None:
+            whitelist.groups.append(
+                WhitelistGroup(name=name.strip(), added_at=now, added_by=added_by)
+            )
+        elif whitelist.groups[position].active:
+            return False
+        else:
+            group = whitelist.groups[position] = copy.copy(whitelist.groups[position])
+            group.active = True
+            group.added_at = now
+            group.added_by = added_by
+
+        whitelist.last_updated = now
+        whitelist.updated_by = added_by
+        self._save(whitelist)
+        return True
+
+    def remove_group(self, name: str, removed_by: str) -> bool:
+        """Stop allowing the members of a directory group.
+
+        Args:
+            name: Group name, matched case-insensitively.
+            removed_by: Email of admin removing the group.
+
+        Returns:
+            True if the group was removed, False if not allowed.
+        """
+        whitelist, index = self._load_for_update()
+        position = index.groups.get(_normalize_group(name))
+        if position is None or not whitelist.groups[position].active:
+            return False
+
+        group = whitelist.groups[position] = copy.copy(whitelist.groups[position])
+        group.active = False
+        whitelist.last_updated = datetime.now()
+        whitelist.updated_by = removed_by
+        self._save(whitelist)
+        return True
+
+    def list_groups(self, include_inactive: bool = False) -> list[WhitelistGroup]:
+        """List the directory group rules.
+
+        Args:
+            include_inactive: Include removed groups if True.
+
+        Returns:
+            List of WhitelistGroup objects.
+        """
+        whitelist = self._load()
+        if include_inactive:
+            return list(whitelist.groups)
+        return [g for g in whitelist.groups if g.active]
+
+    def compact(
+        self,
+        retention_days: float = WHITELIST_ARCHIVE_RETENTION_DAYS,
+        compacted_by: str = "system",
+    ) -> int:
+        """Move long-inactive entries from the whitelist to the archive.
+
+        The archive is written before the whitelist, so an interrupted
+        compaction leaves entries in both files rather than in neither.
+
+        Args:
+            retention_days: Days an entry must have been inactive (or, for
+                entries without a deactivation time, since it was added).
+            compacted_by: Email of admin (or job) running the compaction.
+
+        Returns:
+            Number of entries archived.
+        """
+        cutoff = time.time() - retention_days * 86400
+
+        def expired(entry: WhitelistEntry) -> bool:
+            since = entry.deactivated_at or entry.added_at
+            return not entry.active and since.timestamp() < cutoff
+
+        whitelist, _ = self._load_for_update()
+        old_users = [u for u in whitelist.users if expired(u)]
+        old_admins = [a for a in whitelist.admins if expired(a)]
+        if not old_users and not old_admins:
+            return 0
+
+        now = datetime.now()
+        archive_service = self._archive()
+        archive, _ = archive_service._load_for_update()
+        archive.users = _merge_entries(archive.users, old_users)
+        archive.admins = _merge_entries(archive.admins, old_admins)
+        archive.last_updated = now
+        archive.updated_by = compacted_by
+        archive_service._save(archive)
+
+        whitelist.users = [u for u in whitelist.users if not expired(u)]
+        whitelist.admins = [a for a in whitelist.admins if not expired(a)]
+        whitelist.last_updated = now
+        whitelist.updated_by = compacted_by
+        self._save(whitelist)
+        return len(old_users) + len(old_admins)
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS whitelist (
+    role TEXT NOT NULL CHECK (role IN ('user', 'admin')),
+    email_key TEXT NOT NULL,
+    email TEXT NOT NULL,
+    name TEXT NOT NULL,
+    added_at TEXT NOT NULL,
+    added_by TEXT NOT NULL,
+    active INTEGER NOT NULL DEFAULT 1,
+    deactivated_at TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS whitelist_role_email
+    ON whitelist (role, email_key);
+CREATE TABLE IF NOT EXISTS whitelist_groups (
+    name_key TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    added_at TEXT NOT NULL,
+    added_by TEXT NOT NULL,
+    active INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS whitelist_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Roles stored in the whitelist table
+_USER = "user"
+_ADMIN = "admin"
+
+
+class SqliteWhitelistService:
+    """User access whitelist stored in SQLite.
+
+    Has the public API of WhitelistService. Entries are keyed by role and
+    normalized email, every edit is a single-row statement in its own
+    transaction, and the database runs in WAL mode so readers never block on
+    a writer. Concurrent edits by several admins therefore all apply.
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        """Open (or create) the whitelist database.
+
+        Args:
+            path: SQLite database path, or ":memory:". Uses default if not
+                provided.
+        """
+        path = path or DEFAULT_WHITELIST_DB_PATH
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(str(path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SQLITE_SCHEMA)
+        self._migrate()
+
+    def version(self) -> int:
+        """Get the version of the whitelist.
+
+        The version changes whenever this or another connection commits a
+        change, so it can tag results derived from the whitelist.
+
+        Returns:
+            Opaque version number.
+        """
+        with self._lock:
+            # data_version only counts commits made by other connections
+            (data_version,) = self._conn.execute("PRAGMA data_version").fetchone()
+            return int(data_version) + self._writes
+
+    def is_user_allowed(self, email: str) -> bool:
+        """Check if user email is in whitelist.
+
+        Args:
+            email: User email to check.
+
+        Returns:
+            True if user is whitelisted and active.
+        """
+        return self._exists(email, (_USER, _ADMIN))
+
+    def is_admin(self, email: str) -> bool:
+        """Check if user email is an admin.
+
+        Args:
+            email: User email to check.
+
+        Returns:
+            True if user is an active admin.
+        """
+        return self._exists(email, (_ADMIN,))
+
+    def add_user(self, email: str, name: str, added_by: str) -> bool:
+        """Add a user to the whitelist.
+
+        Args:
+            email: User email to add.
+            name: User display name.
+            added_by: Email of admin adding the user.
+
+        Returns:
+            True if user was added, False if already exists.
+        """
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            # Inserts, reactivates an inactive entry, or changes nothing
+            cursor = self._conn.execute(
+                "INSERT INTO whitelist "
+                "(role, email_key, email, name, added_at, added_by, active) "
+                "VALUES (?, ?, ?, ?, ?, ?, 1) "
+                "ON CONFLICT (role, email_key) DO UPDATE SET "
+                "active = 1, added_at = excluded.added_at, "
+                "added_by = excluded.added_by, deactivated_at = NULL "
+                "WHERE active = 0",
+                (_USER, _normalize_email(email), email, name, now, added_by),
+            )
+            if cursor.rowcount:
+                self._touch(now, added_by)
+            return cursor.rowcount > 0
+
+    def add_users(
+        self, entries: Iterable[tuple[str, str]], added_by: str
+    ) -> BulkImportReport:
+        """Add many users to the whitelist in a single transaction.
+
+        Args:
+            entries: (email, name) pairs to add.
+            added_by: Email of admin adding the users.
+
+        Returns:
+            BulkImportReport of added, reactivated and skipped emails.
+        """
+        report = BulkImportReport()
+        inserts: list[tuple] = []
+        reactivations: list[tuple] = []
+        seen: set[str] = set()
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            for email, name in entries:
+                key = _normalize_email(email)
+                if key in seen:
+                    report.skipped.append(email)
+                    continue
+                seen.add(key)
+
+                row = self._conn.execute(
+                    "SELECT active FROM whitelist WHERE role = ? AND email_key = ?",
+                    (_USER, key),
+                ).fetchone()
+                if row is None:
+                    inserts.append((_USER, key, email, name, now, added_by))
+                    report.added.append(email)
+                elif row[0]:
+                    report.skipped.append(email)
+                else:
+                    reactivations.append((now, added_by, _USER, key))
+                    report.reactivated.append(email)
+
+            self._conn.executemany(
+                "INSERT INTO whitelist "
+                "(role, email_key, email, name, added_at, added_by, active) "
+                "VALUES (?, ?, ?, ?, ?, ?, 1)",
+                inserts,
+            )
+            self._conn.executemany(
+                "UPDATE whitelist SET active = 1, added_at = ?, added_by = ?, "
+                "deactivated_at = NULL WHERE role = ? AND email_key = ?",
+                reactivations,
+            )
+            if report.changed:
+                self._touch(now, added_by)
+        return report
+
+    def remove_user(self, email: str, removed_by: str) -> bool:
+        """Remove (deactivate) a user from whitelist.
+
+        Args:
+            email: User email to remove.
+            removed_by: Email of admin removing the user.
+
+        Returns:
+            True if user was removed, False if not found.
+        """
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE whitelist SET active = 0, deactivated_at = ? "
+                "WHERE role = ? AND email_key = ? AND active = 1",
+                (now, _USER, _normalize_email(email)),
+            )
+            if cursor.rowcount:
+                self._touch(now, removed_by)
+            return cursor.rowcount > 0
+
+    def remove_users(self, emails: Iterable[str], removed_by: str) -> list[str]:
+        """Remove (deactivate) many users in a single transaction.
+
+        Args:
+            emails: User emails to remove.
+            removed_by: Email of admin removing the users.
+
+        Returns:
+            Emails that were deactivated; unknown or inactive ones are left out.
+        """
+        removed = []
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            for email in emails:
+                cursor = self._conn.execute(
+                    "UPDATE whitelist SET active = 0, deactivated_at = ? "
+                    "WHERE role = ? AND email_key = ? AND active = 1",
+                    (now, _USER, _normalize_email(email)),
+                )
+                if cursor.rowcount:
+                    removed.append(email)
+            if removed:
+                self._touch(now, removed_by)
+        return removed
+
+    def list_users(self, include_inactive: bool = False) -> list[WhitelistEntry]:
+        """List all whitelisted users.
+
+        Args:
+            include_inactive: Include deactivated users if True.
+
+        Returns:
+            List of WhitelistEntry objects.
+        """
+        return self._list(_USER, include_inactive)
+
+    def list_admins(self, include_inactive: bool = False) -> list[WhitelistEntry]:
+        """List all admin users.
+
+        Args:
+            include_inactive: Include deactivated admins if True.
+
+        Returns:
+            List of WhitelistEntry objects for admins.
+        """
+        return self._list(_ADMIN, include_inactive)
+
+    def allowed_groups(self) -> frozenset[str]:
+        """Get the directory groups whose members are allowed.
+
+        Returns:
+            Normalized (lowercase) names of the active group rules.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name_key FROM whitelist_groups WHERE active = 1"
+            ).fetchall()
+        return frozenset(key for (key,) in rows)
+
+    def add_group(self, name: str, added_by: str) -> bool:
+        """Allow the members of a directory group.
+
+        Args:
+            name: Group name, matched case-insensitively.
+            added_by: Email of admin adding the group.
+
+        Returns:
+            True if the group was added, False if already allowed.
+        """
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO whitelist_groups (name_key, name, added_at, added_by) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (name_key) DO UPDATE SET "
+                "active = 1, added_at = excluded.added_at, "
+                "added_by = excluded.added_by WHERE active = 0",
+                (_normalize_group(name), name.strip(), now, added_by),
+            )
+            if cursor.rowcount:
+                self._touch(now, added_by)
+            return cursor.rowcount > 0
+
+    def remove_group(self, name: str, removed_by: str) -> bool:
+        """Stop allowing the members of a directory group.
+
+        Args:
+            name: Group name, matched case-insensitively.
+            removed_by: Email of admin removing the group.
+
+        Returns:
+            True if the group was removed, False if not allowed.
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE whitelist_groups SET active = 0 "
+                "WHERE name_key = ? AND active = 1",
+                (_normalize_group(name),),
+            )
+            if cursor.rowcount:
+                self._touch(datetime.now().isoformat(), removed_by)
+            return cursor.rowcount > 0
+
+    def list_groups(self, include_inactive: bool = False) -> list[WhitelistGroup]:
+        """List the directory group rules.
+
+        Args:
+            include_inactive: Include removed groups if True.
+
+        Returns:
+            List of WhitelistGroup objects.
+        """
+        query = "SELECT name, added_at, added_by, active FROM whitelist_groups"
+        if not include_inactive:
+            query += " WHERE active = 1"
+        with self._lock:
+            rows = self._conn.execute(f"{query} ORDER BY rowid").fetchall()
+        return [
+            WhitelistGroup(
+                name=name,
+                added_at=datetime.fromisoformat(added_at),
+                added_by=added_by,
+                active=bool(active),
+            )
+            for name, added_at, added_by, active in rows
+        ]
+
+    def compact(
+        self,
+        retention_days: float = WHITELIST_ARCHIVE_RETENTION_DAYS,  # noqa: ARG002
+        compacted_by: str = "system",  # noqa: ARG002
+    ) -> int:
+        """Archive long-inactive entries; nothing to do for this backend.
+
+        Inactive rows do not slow down indexed lookups or single-row
+        updates, so they stay in the table.
+
+        Args:
+            retention_days: Unused; kept for API compatibility.
+            compacted_by: Unused; kept for API compatibility.
+
+        Returns:
+            Number of entries archived, always 0.
+        """
+        return 0
+
+    def import_json(self, path: Path | None = None) -> int:
+        """Copy the entries of a JSON whitelist into the database.
+
+        Entries and group rules already in the database are kept. Where the
+        file lists an email more than once, an active entry wins.
+
+        Args:
+            path: JSON whitelist file. Uses the default if not provided.
+
+        Returns:
+            Number of entries imported.
+        """
+        source = WhitelistService(path)
+        # Active entries first, so they win over inactive duplicates
+        entries = sorted(
+            (
+                (role, entry)
+                for role, role_entries in (
+                    (_USER, source.list_users(include_inactive=True)),
+                    (_ADMIN, source.list_admins(include_inactive=True)),
+                )
+                for entry in role_entries
+            ),
+            key=lambda item: not item[1].active,
+        )
+        rows = [
+            (
+                role,
+                _normalize_email(entry.email),
+                entry.email,
+                entry.name,
+                entry.added_at.isoformat(),
+                entry.added_by,
+                int(entry.active),
+                entry.deactivated_at.isoformat() if entry.deactivated_at else None,
+            )
+            for role, entry in entries
+        ]
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT INTO whitelist (role, email_key, email, name, added_at, "
+                "added_by, active, deactivated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (role, email_key) DO NOTHING",
+                rows,
+            )
+            self._conn.executemany(
+                "INSERT INTO whitelist_groups "
+                "(name_key, name, added_at, added_by, active) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (name_key) DO NOTHING",
+                [
+                    (
+                        _normalize_group(group.name),
+                        group.name,
+                        group.added_at.isoformat(),
+                        group.added_by,
+                        int(group.active),
+                    )
+                    for group in source.list_groups(include_inactive=True)
+                ],
+            )
+            imported = self._conn.total_changes - before
+            if imported:
+                self._touch(datetime.now().isoformat(), "import")
+            return imported
+
+    def is_empty(self) -> bool:
+        """Check whether the database holds no entries.
+
+        Returns:
+            True if there are no users or admins, active or not.
+        """
+        with self._lock:
+            return (
+                self._conn.execute("SELECT 1 FROM whitelist LIMIT 1").fetchone() is None
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _migrate(self) -> None:
+        """Add the columns that databases created by older versions lack."""
+        with self._lock, self._conn:
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(whitelist)")
+            }
+            if "deactivated_at" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE whitelist ADD COLUMN deactivated_at TEXT"
+                )
+
+    def _exists(self, email: str, roles: tuple[str, ...]) -> bool:
+        """Check for an active entry with one of the roles."""
+        placeholders = ", ".join("?" * len(roles))
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT 1 FROM whitelist WHERE role IN ({placeholders}) "
+                "AND email_key = ? AND active = 1 LIMIT 1",
+                (*roles, _normalize_email(email)),
+            ).fetchone()
+        return row is not None
+
+    def _list(self, role: str, include_inactive: bool) -> list[WhitelistEntry]:
+        """List the entries of a role in the order they were added."""
+        query = (
+            "SELECT email, name, added_at, added_by, active, deactivated_at "
+            "FROM whitelist WHERE role = ?"
+        )
+        if not include_inactive:
+            query += " AND active = 1"
+        with self._lock:
+            rows = self._conn.execute(f"{query} ORDER BY rowid", (role,)).fetchall()
+        return [
+            WhitelistEntry(
+                email=email,
+                name=name,
+                added_at=datetime.fromisoformat(added_at),
+                added_by=added_by,
+                active=bool(active),
+                deactivated_at=datetime.fromisoformat(deactivated_at)
+                if deactivated_at
+                else None,
+            )
+            for email, name, added_at, added_by, active, deactivated_at in rows
+        ]
+
+    def _touch(self, updated_at: str, updated_by: str) -> None:
+        """Record who last changed the whitelist. Caller holds a transaction."""
+        self._writes += 1
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO whitelist_meta (key, value) VALUES (?, ?)",
+            [("last_updated", updated_at), ("updated_by", updated_by)],
+        )
+
+
+# Either whitelist backend; both have the same public API
+WhitelistBackend = WhitelistService | SqliteWhitelistService
+
+
+def create_whitelist_service() -> WhitelistBackend:
+    """Get the whitelist service selected by the environment.
+
+    WHITELIST_BACKEND chooses "json" (default) or "sqlite", and
+    WHITELIST_DB_PATH the SQLite database. An empty SQLite database is
+    filled from the JSON whitelist the first time it is opened. Services are
+    shared per backend and path within the process.
+
+    Returns:
+        Whitelist service instance.
+
+    Raises:
+        ValueError: If the backend is not known.
+    """
+    backend = os.environ.get(WHITELIST_BACKEND_ENV, "json").lower()
+    if backend == "json":
+        return WhitelistService()
+    if backend == "sqlite":
+        return _sqlite_service(
+            os.environ.get(WHITELIST_DB_PATH_ENV, str(DEFAULT_WHITELIST_DB_PATH))
+        )
+    raise ValueError(f"Unknown {WHITELIST_BACKEND_ENV} '{backend}'; use json or sqlite")
+
+
+@functools.cache
+def _sqlite_service(path: str) -> SqliteWhitelistService:
+    """Open the SQLite whitelist at a path, importing the JSON one if empty."""
+    service = SqliteWhitelistService(path)
+    if service.is_empty() and DEFAULT_WHITELIST_PATH.exists():
+        service.import_json(DEFAULT_WHITELIST_PATH)
+    return service
@@ -0,0 +1,210 @@
+"""Bulk import and export of whitelist entries.
+
+Imports are parsed and validated here into (email, name) pairs, which the
+whitelist services apply in one write with add_users. Exports return the
+whole document: Streamlit's download button holds the file in memory anyway.
+"""
+
+import csv
+import io
+import itertools
+import json
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from models.whitelist import WhitelistEntry
+from services.directory import DirectoryClient
+
+# Upload formats accepted by parse_upload, by file extension
+IMPORT_FORMATS = ("csv", "json")
+
+# Columns written by the CSV export; imports only need email and name
+EXPORT_COLUMNS = ("email", "name", "added_at", "added_by", "active")
+
+_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+@dataclass
+class ParsedImport:
+    """Entries read from an import source, and the rows that were rejected."""
+
+    entries: list[tuple[str, str]] = field(default_factory=list)
+    invalid: list[str] = field(default_factory=list)
+
+    def add(self, row: str, email: str | None, name: str | None) -> None:
+        """Validate a row and keep it as an entry or record why it is invalid.
+
+        Args:
+            row: Location of the row in the source, for error messages.
+            email: Email of the row.
+            name: Display name of the row; the email's local part if blank.
+        """
+        email = (email or "").strip()
+        if not _EMAIL.match(email):
+            self.invalid.append(f"{row}: invalid email '{email}'")
+            return
+        name = (name or "").strip() or email.split("@")[0]
+        self.entries.append((email, name))
+
+
+def parse_csv(text: str) -> ParsedImport:
+    """Parse CSV whitelist entries.
+
+    The first row may be a header naming the email and name columns;
+    otherwise the columns are taken as email, then name.
+
+    Args:
+        text: CSV text.
+
+    Returns:
+        ParsedImport of the rows.
+    """
+    parsed = ParsedImport()
+    reader = csv.reader(io.StringIO(text))
+    first = next(reader, None)
+    if first is None:
+        return parsed
+
+    header = [column.strip().lower() for column in first]
+    pending = []
+    if "email" in header:
+        email_column = header.index("email")
+        name_column = header.index("name") if "name" in header else None
+    else:
+        email_column, name_column = 0, 1
+        pending.append(first)
+
+    for row in itertools.chain(pending, reader):
+        if not any(cell.strip() for cell in row):
+            continue
+        parsed.add(
+            f"line {reader.line_num}",
+            _cell(row, email_column),
+            _cell(row, name_column),
+        )
+    return parsed
+
+
+def parse_json(text: str) -> ParsedImport:
+    """Parse JSON whitelist entries.
+
+    Accepts a list of objects with ``email`` and ``name``, or a document
+    with such a list under ``users`` (the whitelist file format).
+
+    Args:
+        text: JSON text.
+
+    Returns:
+        ParsedImport of the entries.
+    """
+    parsed = ParsedImport()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        parsed.invalid.append(f"invalid JSON: {e}")
+        return parsed
+
+    if isinstance(data, dict):
+        data = data.get("users", [])
+    if not isinstance(data, list):
+        parsed.invalid.append("expected a list of users")
+        return parsed
+
+    for position, item in enumerate(data, start=1):
+        if isinstance(item, dict):
+            parsed.add(f"entry {position}", item.get("email"), item.get("name"))
+        else:
+            parsed.invalid.append(f"entry {position}: expected an object")
+    return parsed
+
+
+def parse_upload(file_name: str, data: bytes) -> ParsedImport:
+    """Parse an uploaded import file by its extension.
+
+    Args:
+        file_name: Name of the uploaded file.
+        data: File contents, UTF-8 encoded.
+
+    Returns:
+        ParsedImport of the file.
+    """
+    text = data.decode("utf-8-sig", errors="replace")
+    if file_name.lower().endswith(".json"):
+        return parse_json(text)
+    return parse_csv(text)
+
+
+def ldap_group_entries(ldap_service: DirectoryClient, group: str) -> ParsedImport:
+    """Read the members of a directory group as import entries.
+
+    Args:
+        ldap_service: Directory service to look the group up in.
+        group: Group name.
+
+    Returns:
+        ParsedImport of the group members.
+    """
+    parsed = ParsedImport()
+    for member in ldap_service.get_group_members(group):
+        parsed.add(member.dn, member.email, member.display_name)
+    return parsed
+
+
+def export_csv(entries: Iterable[WhitelistEntry]) -> str:
+    """Export whitelist entries as CSV.
+
+    Args:
+        entries: Entries to export.
+
+    Returns:
+        The header line, then one line per entry.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(EXPORT_COLUMNS)
+    writer.writerows(
+        (
+            entry.email,
+            entry.name,
+            entry.added_at.isoformat(),
+            entry.added_by,
+            entry.active,
+        )
+        for entry in entries
+    )
+    return buffer.getvalue()
+
+
+def export_json(entries: Iterable[WhitelistEntry]) -> str:
+    """Export whitelist entries as a JSON list, readable by parse_json.
+
+    Args:
+        entries: Entries to export.
+
+    Returns:
+        A JSON list with one object per line.
+    """
+    items = [
+        json.dumps(
+            {
+                "email": entry.email,
+                "name": entry.name,
+                "added_at": entry.added_at.isoformat(),
+                "added_by": entry.added_by,
+                "active": entry.active,
+            },
+            ensure_ascii=False,
+        )
+        for entry in entries
+    ]
+    if not items:
+        return "[]\n"
+    return "[\n  " + ",\n  ".join(items) + "\n]\n"
+
+
+def _cell(row: list[str], column: int | None) -> str | None:
+    """Get a cell of a CSV row, or None if the row is too short."""
+    if column is None or column >= len(row):
+        return None
+    return row[column]
@@ -0,0 +1,119 @@
+"""Searched and sorted views of the whitelisted users for the admin page.
+
+The user list, its search index over email and name, and its sort orders
+are built once per whitelist version and shared by every admin session, so
+paging through thousands of users only slices a cached ordering.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+from models.whitelist import WhitelistEntry
+from services.job_search import JobSearchIndex
+
+# Ways the user list can be sorted; "Relevance" only applies to searches
+SORT_OPTIONS = ("Newest", "Oldest", "Email", "Name")
+RELEVANCE = "Relevance"
+
+# User lists kept, one per whitelist version
+WHITELIST_VIEW_CACHE_SIZE = 2
+
+# Orderings kept per user list, by search and sort
+ORDER_CACHE_SIZE = 32
+
+
+class WhitelistUserView:
+    """A user list with its search index and cached orderings."""
+
+    def __init__(self, entries: Sequence[WhitelistEntry]) -> None:
+        """Index a user list.
+
+        Args:
+            entries: Users, in whitelist order
+        """
+        self.entries = tuple(entries)
+        self._index = JobSearchIndex([f"{e.email} {e.name}" for e in self.entries])
+        self._lock = threading.Lock()
+        self._orders: OrderedDict[tuple[str, str], tuple[int, ...]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of users."""
+        return len(self.entries)
+
+    def order(self, search: str = "", sort_by: str = "Newest") -> tuple[int, ...]:
+        """Get the users matching a search, sorted.
+
+        Args:
+            search: Text matched against email and name; all users if blank
+            sort_by: One of SORT_OPTIONS, or RELEVANCE to rank search results
+
+        Returns:
+            Indices into entries, in display order
+        """
+        search = " ".join(search.lower().split())
+        key = (search, sort_by)
+        with self._lock:
+            order = self._orders.get(key)
+            if order is not None:
+                self._orders.move_to_end(key)
+                return order
+
+        matches = self._index.search(search) if search else range(len(self.entries))
+        if sort_by == RELEVANCE and search:
+            order = tuple(matches)
+        else:
+            order = tuple(
+                sorted(
+                    matches,
+                    key=self._sort_key(sort_by),
+                    reverse=sort_by == "Newest",
+                )
+            )
+
+        with self._lock:
+            self._orders[key] = order
+            if len(self._orders) > ORDER_CACHE_SIZE:
+                self._orders.popitem(last=False)
+        return order
+
+    def _sort_key(self, sort_by: str) -> Callable[[int], str | float]:
+        """Get the sort key function of a sort option."""
+        entries = self.entries
+        if sort_by == "Email":
+            return lambda i: entries[i].email.lower()
+        if sort_by == "Name":
+            return lambda i: entries[i].name.lower()
+        # Newest and Oldest; ties keep whitelist order
+        return lambda i: entries[i].added_at.timestamp()
+
+
+class WhitelistViewCache:
+    """Process-wide cache of user views keyed by whitelist version."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._lock = threading.Lock()
+        self._views: OrderedDict[int, WhitelistUserView] = OrderedDict()
+
+    def get(
+        self, version: int, load: Callable[[], Sequence[WhitelistEntry]]
+    ) -> WhitelistUserView:
+        """Get the view of a whitelist version, building it once.
+
+        Args:
+            version: Whitelist version, from the whitelist service
+            load: Lists the users of that version; only called on a miss
+
+        Returns:
+            WhitelistUserView shared by every caller of this version
+        """
+        with self._lock:
+            view = self._views.get(version)
+            if view is None:
+                view = self._views[version] = WhitelistUserView(load())
+                if len(self._views) > WHITELIST_VIEW_CACHE_SIZE:
+                    self._views.popitem(last=False)
+            else:
+                self._views.move_to_end(version)
+            return view
@@ -129,23 +129,46 @@ def mock_jenkins_server() -> MagicMock:
     """Create a mock Jenkins server instance."""
     server = MagicMock()
     server.get_version.return_value = "2.400.1"
-    server.get_all_jobs.return_value = [
-        {
-            "name": "frontend-build",
-            "url": "https://jenkins.company.com/job/frontend-build/",
-            "color": "blue",
-        },
-        {
-            "name": "backend-tests",
-            "url": "https://jenkins.company.com/job/backend-tests/",
-            "color": "red",
-        },
-        {
-            "name": "api-deploy",
-            "url": "https://jenkins.company.com/job/api-deploy/",
-            "color": "blue_anime",
-        },
-    ]
+    server.get_info.return_value = {
+        "jobs": [
+            {
+                "name": "frontend-build",
+                "url": "https://jenkins.company.com/job/frontend-build/",
+                "color": "blue",
+                "lastBuild": {
+                    "number": 142,
+                    "result": "SUCCESS",
+                    "timestamp": 1704708600000,
+                    "duration": 45000,
+                    "building": False,
+                },
+            },
+            {
+                "name": "backend-tests",
+                "url": "https://jenkins.company.com/job/backend-tests/",
+                "color": "red",
+                "lastBuild": {
+                    "number": 87,
+                    "result": "FAILURE",
+                    "timestamp": 1704705000000,
+                    "duration": 120000,
+                    "building": False,
+                },
+            },
+            {
+                "name": "api-deploy",
+                "url": "https://jenkins.company.com/job/api-deploy/",
+                "color": "blue_anime",
+                "lastBuild": {
+                    "number": 56,
+                    "result": None,
+                    "timestamp": 1704710000000,
+                    "duration": 0,
+                    "building": True,
+                },
+            },
+        ]
+    }
     return server
 
 
@@ -76,7 +76,7 @@ class TestJenkinsIntegration:
         with patch.dict(os.environ, mock_env_vars):
             with patch("services.jenkins.jenkins.Jenkins") as mock_jenkins:
                 mock_server = MagicMock()
-                mock_server.get_all_jobs.side_effect = Exception("401 Unauthorized")
+                mock_server.get_info.side_effect = Exception("401 Unauthorized")
                 mock_jenkins.return_value = mock_server
 
                 service = JenkinsService()
@@ -92,7 +92,7 @@ class TestJenkinsIntegration:
         with patch.dict(os.environ, mock_env_vars):
             with patch("services.jenkins.jenkins.Jenkins") as mock_jenkins:
                 mock_server = MagicMock()
-                mock_server.get_all_jobs.side_effect = Exception("Connection refused")
+                mock_server.get_info.side_effect = Exception("Connection refused")
                 mock_jenkins.return_value = mock_server
 
                 service = JenkinsService()
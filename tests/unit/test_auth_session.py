@@ -0,0 +1,95 @@
+"""Unit tests for per-session authorization caching."""
+
+from datetime import datetime
+
+import pytest
+
+from models.user import User
+from services import auth_session
+from services.auth_session import SESSION_AUTH_KEY, authorize_session
+
+
+class Checks:
+    """Counting authenticate and authorize callables."""
+
+    def __init__(self, allowed: bool = True) -> None:
+        self.allowed = allowed
+        self.authentications = 0
+        self.authorizations = 0
+
+    def authenticate(self) -> User:
+        self.authentications += 1
+        return User(
+            id="u1",
+            email="pm@company.com",
+            name="PM",
+            roles=[],
+            login_time=datetime.now(),
+        )
+
+    def authorize(self, _user: User) -> bool:
+        self.authorizations += 1
+        return self.allowed
+
+
+def _authorize(state: dict, checks: Checks, version: int = 1, identity: str = "pm"):
+    return authorize_session(
+        state, identity, version, checks.authenticate, checks.authorize
+    )
+
+
+class TestAuthorizeSession:
+    """Tests for authorize_session."""
+
+    def test_reused_while_version_unchanged(self) -> None:
+        """Test that reruns reuse the result without checking again."""
+        state: dict = {}
+        checks = Checks()
+
+        first = _authorize(state, checks)
+        second = _authorize(state, checks)
+
+        assert second == first
+        assert second[1] is True
+        assert checks.authentications == checks.authorizations == 1
+
+    def test_rechecked_when_version_changes(self) -> None:
+        """Test that a whitelist change takes effect on the next rerun."""
+        state: dict = {}
+        checks = Checks()
+        _authorize(state, checks, version=1)
+        checks.allowed = False
+
+        user, authorized = _authorize(state, checks, version=2)
+
+        assert user is not None
+        assert not authorized
+        assert checks.authorizations == 2
+
+    def test_rechecked_when_expired(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a result is not reused past the TTL."""
+        state: dict = {}
+        checks = Checks()
+        clock = iter([0.0, auth_session.AUTH_CACHE_TTL + 1])
+        monkeypatch.setattr(auth_session.time, "monotonic", lambda: next(clock))
+
+        _authorize(state, checks)
+        _authorize(state, checks)
+
+        assert checks.authorizations == 2
+
+    def test_identity_change_and_logout(self) -> None:
+        """Test that another login re-authenticates and logout clears."""
+        state: dict = {}
+        checks = Checks()
+        _authorize(state, checks, identity="pm")
+        _authorize(state, checks, identity="other")
+
+        assert checks.authentications == 2
+        assert authorize_session(
+            state, None, 1, checks.authenticate, checks.authorize
+        ) == (
+            None,
+            False,
+        )
+        assert SESSION_AUTH_KEY not in state
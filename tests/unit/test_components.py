@@ -3,9 +3,30 @@
 from datetime import datetime
 
 import pytest
-
-from components.job_card import get_status_color, get_status_emoji
+from streamlit.testing.v1 import AppTest
+
+from components.job_card import (
+    build_job_display,
+    format_duration,
+    format_relative_time,
+    get_status_color,
+    get_status_emoji,
+    get_status_icon,
+)
+from components.job_table import _page_table_markdown
+from components.render_model import JobRenderModel, RenderModelCache
+from components.wallboard import (
+    MAX_TILE_WIDTH,
+    MIN_TILE_WIDTH,
+    build_wallboard_html,
+    tile_width,
+)
 from models.job import JenkinsJob, JobStatus
+from services.snapshot import make_snapshot
+
+
+# Reference time for render models, on a minute boundary
+NOW_MS = 1_704_067_200_000
 
 
 class TestJobCardFunctions:
@@ -171,3 +192,240 @@ class TestJobSorting:
         # Higher build number first
         assert sorted_jobs[0].last_build_number == 142
         assert sorted_jobs[1].last_build_number == 89
+
+
+class TestDisplayFormatting:
+    """Tests for table cell formatting helpers."""
+
+    def test_get_status_icon_all_statuses(self) -> None:
+        """Test that every status has an icon."""
+        for status in JobStatus:
+            assert get_status_icon(status)
+
+    def test_format_duration(self) -> None:
+        """Test seconds below a minute and minutes above."""
+        assert format_duration(30000) == "30.0s"
+        assert format_duration(120000) == "2.0m"
+
+    def test_format_relative_time(self) -> None:
+        """Test relative time buckets."""
+        now_ms = 10 * 86400 * 1000
+        assert format_relative_time(now_ms - 5000, now_ms) == "just now"
+        assert format_relative_time(now_ms - 5 * 60000, now_ms) == "5m ago"
+        assert format_relative_time(now_ms - 3 * 3600000, now_ms) == "3h ago"
+        assert format_relative_time(now_ms - 2 * 86400000, now_ms) == "2d ago"
+
+
+def _job_table_app(job_count: int) -> None:
+    """Streamlit script rendering the job table for a synthetic job list."""
+    from components.job_table import render_job_table
+    from models.job import JenkinsJob, JobStatus
+
+    render_job_table(
+        [
+            JenkinsJob(
+                name=f"job-{i}",
+                url=f"https://jenkins.company.com/job/job-{i}/",
+                status=JobStatus.SUCCESS,
+                last_build_number=i + 1,
+                last_build_result="SUCCESS",
+                last_build_timestamp=None,
+                last_build_duration_ms=1000,
+                is_building=False,
+            )
+            for i in range(job_count)
+        ]
+    )
+
+
+class TestJobTableRendering:
+    """Tests for the paginated job table."""
+
+    @staticmethod
+    def _run(job_count: int) -> AppTest:
+        """Run the job table script and check it raised nothing."""
+        app = AppTest.from_function(_job_table_app, args=(job_count,))
+        app.run()
+        assert not app.exception
+        return app
+
+    @staticmethod
+    def _element_count(app: AppTest) -> int:
+        """Count the elements rendered in the main area."""
+        return sum(1 for _ in app.main)
+
+    def test_element_count_does_not_grow_with_jobs(self) -> None:
+        """Test that 2000 jobs render as many elements as 60 jobs."""
+        small = self._run(60)
+        large = self._run(2000)
+
+        assert self._element_count(small) == self._element_count(large)
+        assert len(large.expander) == 0
+
+    def test_only_current_page_is_rendered(self) -> None:
+        """Test that the table holds only the rows of the current page."""
+        app = self._run(2000)
+        table = next(m.value for m in app.markdown if m.value.startswith("| |"))
+
+        assert "job-0]" in table
+        assert "job-1999]" not in table
+        assert table.count("\n") == 51  # header, separator and 50 rows
+
+    def test_job_names_and_urls_are_escaped(self) -> None:
+        """Test that markdown in names and URLs cannot break the table."""
+        job = JenkinsJob(
+            name="team/a_b*c [x](y) `z` | w\nnext",
+            url="https://jenkins.company.com/job/team/job/a b (1)/",
+            status=JobStatus.SUCCESS,
+            last_build_number=1,
+            last_build_result="SUCCESS",
+        )
+
+        lines = _page_table_markdown([build_job_display(job)]).splitlines()
+
+        assert len(lines) == 3
+        assert (
+            "[team/a\\_b\\*c \\[x\\]\\(y\\) \\`z\\` \\| w next]"
+            "(https://jenkins.company.com/job/team/job/a%20b%20%281%29/)"
+        ) in lines[2]
+
+    def test_table_view_renders_one_dataframe(self) -> None:
+        """Test that the table view renders every job in one dataframe."""
+        app = self._run(2000)
+        app.radio[0].set_value("Table").run()
+
+        assert not app.exception
+        assert len(app.dataframe) == 1
+        assert len(app.dataframe[0].value) == 2000
+
+    def test_wallboard_view_renders_one_html_block(self) -> None:
+        """Test that the wallboard view renders every job in one element."""
+        small = self._run(60)
+        large = self._run(2000)
+        for app in (small, large):
+            app.radio[0].set_value("Wallboard").run()
+
+        assert not large.exception
+        assert self._element_count(small) == self._element_count(large)
+        assert large.get("html")[0].proto.body.count('class="tile"') == 2000
+
+
+class TestRenderModel:
+    """Tests for the shared per-snapshot render model."""
+
+    def test_build_job_display(self, mock_jenkins_job_success: JenkinsJob) -> None:
+        """Test that display strings match the job."""
+        display = build_job_display(mock_jenkins_job_success)
+
+        assert display.status_text == "SUCCESS"
+        assert display.title == f":white_check_mark: {mock_jenkins_job_success.name}"
+        assert display.build_label == f"#{mock_jenkins_job_success.last_build_number}"
+        assert display.time.startswith("20")
+
+    def test_job_without_builds(self) -> None:
+        """Test display strings for a job that was never built."""
+        job = JenkinsJob(
+            name="new-job",
+            url="",
+            status=JobStatus.NOT_BUILT,
+            last_build_number=None,
+            last_build_result=None,
+        )
+        display = build_job_display(job)
+
+        assert display.build_label == "No builds"
+        assert display.time == display.duration == display.relative_time == ""
+
+    def test_jobs_are_formatted_once(self, mock_jobs_list: list[JenkinsJob]) -> None:
+        """Test that repeated reads return the same display object."""
+        model = JobRenderModel(mock_jobs_list, 0)
+
+        assert model.display(0) is model.display(0)
+        assert len(model) == len(mock_jobs_list)
+
+    def test_columns_are_shared_per_ordering(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that columns are cached per ordering object."""
+        model = JobRenderModel(mock_jobs_list, 0)
+        order = tuple(reversed(range(len(mock_jobs_list))))
+
+        columns = model.columns(order)
+
+        assert model.columns(order) is columns
+        assert columns["Job"] == [j.name for j in reversed(mock_jobs_list)]
+
+    def test_cache_shares_model_per_version(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that sessions on one snapshot share its render model."""
+        cache = RenderModelCache(max_entries=1)
+        first = make_snapshot(mock_jobs_list)
+        second = make_snapshot(mock_jobs_list)
+
+        model = cache.get(first, NOW_MS)
+
+        assert cache.get(first, NOW_MS + 1000) is model
+        assert cache.get(second, NOW_MS) is not model
+        assert cache.get(first, NOW_MS) is not model  # evicted
+
+    def test_relative_times_follow_the_clock(
+        self, mock_jenkins_job_success: JenkinsJob
+    ) -> None:
+        """Test that an unchanged snapshot's relative times still advance."""
+        cache = RenderModelCache()
+        snapshot = make_snapshot([mock_jenkins_job_success])
+        built_ms = mock_jenkins_job_success.last_build_timestamp_ms
+        assert built_ms is not None
+
+        earlier = cache.get(snapshot, built_ms + 5 * 60_000).display(0)
+        later = cache.get(snapshot, built_ms + 65 * 60_000).display(0)
+
+        assert earlier.relative_time == "5m ago"
+        assert later.relative_time == "1h ago"
+        assert later.title is earlier.title
+
+
+class TestWallboard:
+    """Tests for the wallboard HTML."""
+
+    def test_tiles_shrink_with_job_count(self) -> None:
+        """Test that tile widths stay within bounds as boards grow."""
+        assert tile_width(1) == MAX_TILE_WIDTH
+        assert tile_width(100_000) == MIN_TILE_WIDTH
+        assert tile_width(50) > tile_width(500)
+
+    def test_names_are_escaped(self) -> None:
+        """Test that job names cannot inject markup."""
+        job = JenkinsJob(
+            name="<script>x</script>",
+            url="",
+            status=JobStatus.FAILURE,
+            last_build_number=None,
+            last_build_result=None,
+        )
+        board = build_wallboard_html([build_job_display(job)], 1)
+
+        assert "<script>" not in board
+        assert "&lt;script&gt;" in board
+        assert "\n" not in board
+
+    def test_fixed_columns(self, mock_jobs_list: list[JenkinsJob]) -> None:
+        """Test a wallboard with a fixed number of columns."""
+        model = JobRenderModel(mock_jobs_list, 0)
+
+        assert "repeat(4," in model.wallboard(columns=4)
+        assert "auto-fill" in model.wallboard()
+
+    def test_wallboard_is_shared_per_ordering(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that reruns on the same ordering reuse the built HTML."""
+        model = JobRenderModel(mock_jobs_list, 0)
+        order = (1, 0)
+
+        board = model.wallboard(order)
+
+        assert model.wallboard(order) is board
+        assert board.count('class="tile"') == 2
+        assert board.index(mock_jobs_list[1].name) < board.index(mock_jobs_list[0].name)
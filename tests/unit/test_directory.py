@@ -0,0 +1,156 @@
+"""Unit tests for the pooled, cached directory client."""
+
+import threading
+
+import pytest
+
+from models.exceptions import DirectoryUnavailableError
+from services import directory
+from services.directory import CachedDirectory, DirectoryConnectionPool
+from services.mock_ldap import MockLDAPService
+
+
+@pytest.fixture
+def connections() -> list[MockLDAPService]:
+    """Record every connection the pool opens."""
+    return []
+
+
+@pytest.fixture
+def pool(connections: list[MockLDAPService]) -> DirectoryConnectionPool:
+    """Pool of two mock directory connections."""
+
+    def connect() -> MockLDAPService:
+        connection = MockLDAPService()
+        connections.append(connection)
+        return connection
+
+    return DirectoryConnectionPool(connect, size=2, timeout=0.05)
+
+
+def _calls(connections: list[MockLDAPService]) -> int:
+    """Count directory round trips over all connections."""
+    return sum(connection.calls for connection in connections)
+
+
+class TestDirectoryConnectionPool:
+    """Tests for DirectoryConnectionPool."""
+
+    def test_connections_reused(
+        self, pool: DirectoryConnectionPool, connections: list[MockLDAPService]
+    ) -> None:
+        """Test that sequential use keeps a single connection."""
+        for _ in range(3):
+            with pool.connection() as connection:
+                connection.lookup_user("alice@company.com")
+
+        assert len(connections) == 1
+
+    def test_bounded(self, pool: DirectoryConnectionPool) -> None:
+        """Test that an exhausted pool times out instead of opening more."""
+        with (
+            pool.connection(),
+            pool.connection(),
+            pytest.raises(DirectoryUnavailableError),
+            pool.connection(),
+        ):
+            pass
+
+        with pool.connection():
+            assert pool.opened == 2
+
+    def test_waits_for_returned_connection(self, pool: DirectoryConnectionPool) -> None:
+        """Test that a waiting caller gets a connection released meanwhile."""
+        pool._timeout = 5
+        release = threading.Event()
+
+        def hold() -> None:
+            with pool.connection():
+                release.wait()
+
+        holders = [threading.Thread(target=hold) for _ in range(2)]
+        for thread in holders:
+            thread.start()
+        while pool.opened < 2:
+            pass
+        threading.Timer(0.05, release.set).start()
+
+        with pool.connection() as connection:
+            assert connection is not None
+        for thread in holders:
+            thread.join()
+
+
+class TestCachedDirectory:
+    """Tests for CachedDirectory."""
+
+    def test_lookups_cached(
+        self, pool: DirectoryConnectionPool, connections: list[MockLDAPService]
+    ) -> None:
+        """Test that repeated lookups and group reads hit the directory once."""
+        client = CachedDirectory(pool)
+
+        user = client.lookup_user("Alice@company.com")
+        assert client.lookup_user("alice@company.com") is user
+        assert client.get_user_groups("alice@company.com") == user.groups
+
+        assert _calls(connections) == 1
+        assert (client.hits, client.misses) == (2, 1)
+
+    def test_negative_cache(
+        self,
+        pool: DirectoryConnectionPool,
+        connections: list[MockLDAPService],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that unknown emails are remembered for the negative TTL."""
+        now = [0.0]
+        monkeypatch.setattr(directory.time, "monotonic", lambda: now[0])
+        client = CachedDirectory(pool, ttl=300, negative_ttl=60)
+
+        assert client.lookup_user("nobody@company.com") is None
+        assert client.get_user_groups("nobody@company.com") == []
+        assert _calls(connections) == 1
+
+        now[0] = 61
+        client.lookup_user("nobody@company.com")
+        client.lookup_user("alice@company.com")
+        now[0] = 200
+        client.lookup_user("alice@company.com")
+        assert _calls(connections) == 3
+
+    def test_lru_eviction(
+        self, pool: DirectoryConnectionPool, connections: list[MockLDAPService]
+    ) -> None:
+        """Test that the least recently used lookup is evicted."""
+        client = CachedDirectory(pool, cache_size=1)
+
+        client.lookup_user("alice@company.com")
+        client.lookup_user("bob@company.com")
+        client.lookup_user("alice@company.com")
+
+        assert _calls(connections) == 3
+
+    def test_authenticate_not_cached(
+        self, pool: DirectoryConnectionPool, connections: list[MockLDAPService]
+    ) -> None:
+        """Test that every login is checked but primes the lookup cache."""
+        client = CachedDirectory(pool)
+
+        assert client.authenticate("alice@company.com", "wrong") is None
+        assert client.authenticate("alice@company.com", "alice123") is not None
+        client.lookup_user("alice@company.com")
+
+        assert _calls(connections) == 2
+
+    def test_invalidate(
+        self, pool: DirectoryConnectionPool, connections: list[MockLDAPService]
+    ) -> None:
+        """Test that an invalidated email is looked up again."""
+        client = CachedDirectory(pool)
+        client.lookup_user("alice@company.com")
+
+        client.invalidate("ALICE@company.com")
+        client.lookup_user("alice@company.com")
+
+        assert _calls(connections) == 2
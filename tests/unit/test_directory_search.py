@@ -0,0 +1,111 @@
+"""Unit tests for the directory search index."""
+
+import pytest
+
+from services.directory_search import DirectorySearchIndex
+from services.mock_ldap import (
+    LDAPUser,
+    MockDirectory,
+    MockLDAPService,
+    generate_directory,
+)
+
+
+@pytest.fixture
+def index() -> DirectorySearchIndex:
+    """Index of a few people."""
+    return DirectorySearchIndex(
+        [
+            ("Alice.Chen@company.com", "Alice Chen"),
+            ("alan@company.com", "Alan Turing"),
+            ("bob@company.com", "Bob Wang"),
+            ("chen.li@company.com", "Li Chen"),
+        ]
+    )
+
+
+class TestDirectorySearchIndex:
+    """Tests for DirectorySearchIndex."""
+
+    def test_prefix_of_name_and_email_tokens(self, index: DirectorySearchIndex) -> None:
+        """Test that terms match prefixes of email and name tokens."""
+        assert index.search("AL") == ["alan@company.com", "alice.chen@company.com"]
+        assert index.search("wang") == ["bob@company.com"]
+        assert index.search("alice.c") == ["alice.chen@company.com"]
+        assert index.search("lic") == []
+
+    def test_exact_token_first(self, index: DirectorySearchIndex) -> None:
+        """Test that an exact token match ranks above longer tokens."""
+        index.add("chenoweth@company.com", "Ann Chenoweth")
+
+        assert index.search("chen")[-1] == "chenoweth@company.com"
+
+    def test_all_terms_must_match(self, index: DirectorySearchIndex) -> None:
+        """Test that every term of a query must match."""
+        assert index.search("chen li") == ["chen.li@company.com"]
+        assert index.search("chen alice") == ["alice.chen@company.com"]
+        assert index.search("chen bob") == []
+
+    def test_blank_query_and_limit(self, index: DirectorySearchIndex) -> None:
+        """Test blank queries and result limits."""
+        assert index.search("  ") == []
+        assert index.search("a", limit=1) == ["alan@company.com"]
+        assert len(index.search("a")) == 2
+
+    def test_non_ascii_names(self, index: DirectorySearchIndex) -> None:
+        """Test that accented and non-Latin names are found with or without marks."""
+        index.add("jgarcia@company.com", "José García")
+        index.add("zoe@company.com", "Zoë Ørsted")
+        index.add("wei@company.com", "王伟")
+
+        assert index.search("josé") == ["jgarcia@company.com"]
+        assert index.search("jose garc") == ["jgarcia@company.com"]
+        assert index.search("ZOË") == ["zoe@company.com"]
+        assert index.search("zoe") == ["zoe@company.com"]
+        assert index.search("ørs") == ["zoe@company.com"]
+        assert index.search("王") == ["wei@company.com"]
+
+    def test_incremental_updates(self, index: DirectorySearchIndex) -> None:
+        """Test that adding, renaming and removing people updates matches."""
+        index.add("dana@company.com", "Dana Scully")
+        index.add("bob@company.com", "Robert Wang")
+        index.remove("ALAN@company.com")
+        index.remove("nobody@company.com")
+
+        assert index.search("scully") == ["dana@company.com"]
+        assert index.search("bob") == ["bob@company.com"]
+        assert index.search("robert") == ["bob@company.com"]
+        assert index.search("turing") == []
+        assert len(index) == 4
+        assert index._entries == sorted(index._entries)
+
+
+class TestMockDirectory:
+    """Tests for the mock directory search."""
+
+    def test_generate_directory(self) -> None:
+        """Test that generated directories are unique and reproducible."""
+        users = generate_directory(500, seed=1)
+
+        assert len({user.email for user in users}) == 500
+        assert users == generate_directory(500, seed=1)
+
+    def test_search_users(self) -> None:
+        """Test that the service searches its directory's index."""
+        directory = MockDirectory(generate_directory(200))
+        service = MockLDAPService(directory=directory)
+        user = LDAPUser(
+            dn="cn=zed,ou=users,dc=company,dc=com",
+            uid="zed",
+            email="Zed@company.com",
+            display_name="Zed Quinn",
+            department="IT",
+            groups=["employees"],
+        )
+
+        directory.add_user(user)
+        assert service.search_users("quinn") == [user]
+
+        directory.remove_user("zed@company.com")
+        assert service.search_users("quinn") == []
+        assert len(service.search_users("a", limit=5)) == 5
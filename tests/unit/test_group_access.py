@@ -0,0 +1,203 @@
+"""Unit tests for group-based access rules."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from models.user import User
+from services import group_access
+from services.group_access import GroupAccess, GroupMembershipCache
+from services.whitelist import WhitelistService
+
+DIRECTORY = {
+    "engineering": ["alice@company.com", "Dave@company.com"],
+    "product": ["bob@company.com", "dave@company.com"],
+}
+
+
+def _user(email: str, roles: list[str] | None = None) -> User:
+    """Build a user with some roles."""
+    return User(
+        id=email,
+        email=email,
+        name=email.split("@")[0],
+        roles=roles or [],
+        login_time=datetime.now(),
+    )
+
+
+@pytest.fixture
+def fetched() -> list[str]:
+    """Record every directory group lookup."""
+    return []
+
+
+@pytest.fixture
+def memberships(fetched: list[str]) -> GroupMembershipCache:
+    """Membership cache over DIRECTORY."""
+
+    def fetch(group: str) -> list[str]:
+        fetched.append(group)
+        return DIRECTORY.get(group, [])
+
+    return GroupMembershipCache(fetch)
+
+
+@pytest.fixture
+def whitelist(tmp_path: Path) -> WhitelistService:
+    """Empty whitelist that is re-checked on every call."""
+    return WhitelistService(tmp_path / "allowed_users.json", check_interval=0)
+
+
+class TestGroupMembershipCache:
+    """Tests for GroupMembershipCache."""
+
+    def test_reverse_lookup(self, memberships: GroupMembershipCache) -> None:
+        """Test that members are found in every group listing them."""
+        groups = memberships.groups_of("DAVE@company.com", ["engineering", "product"])
+
+        assert groups == {"engineering", "product"}
+        assert memberships.groups_of("bob@company.com", ["engineering"]) == set()
+
+    def test_expansions_reused_until_ttl(
+        self,
+        memberships: GroupMembershipCache,
+        fetched: list[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the directory is only asked again after the TTL."""
+        now = [0.0]
+        monkeypatch.setattr(group_access.time, "monotonic", lambda: now[0])
+
+        memberships.groups_of("alice@company.com", ["engineering"])
+        memberships.groups_of("bob@company.com", ["engineering"])
+        assert fetched == ["engineering"]
+
+        now[0] = group_access.GROUP_CACHE_TTL + 1
+        memberships.groups_of("bob@company.com", ["engineering"])
+        assert fetched == ["engineering", "engineering"]
+
+    def test_invalidate_drops_only_given_groups(
+        self, memberships: GroupMembershipCache, fetched: list[str]
+    ) -> None:
+        """Test that invalidation refetches just the invalidated group."""
+        memberships.groups_of("dave@company.com", ["engineering", "product"])
+        memberships.invalidate(["product"])
+
+        memberships.groups_of("dave@company.com", ["engineering", "product"])
+
+        assert sorted(fetched) == ["engineering", "product", "product"]
+
+    def test_failed_refresh_keeps_stale_expansion(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a directory outage keeps the last known members."""
+        now = [0.0]
+        monkeypatch.setattr(group_access.time, "monotonic", lambda: now[0])
+        failing = [False]
+
+        def fetch(group: str) -> list[str]:
+            if failing[0]:
+                raise ConnectionError("directory down")
+            return DIRECTORY[group]
+
+        memberships = GroupMembershipCache(fetch)
+        memberships.groups_of("alice@company.com", ["engineering"])
+
+        failing[0] = True
+        now[0] = group_access.GROUP_CACHE_TTL + 1
+        groups = memberships.groups_of("alice@company.com", ["engineering"])
+
+        assert groups == {"engineering"}
+        assert "Could not fetch members of group engineering" in caplog.text
+
+    def test_failed_first_fetch_denies(self) -> None:
+        """Test that a group never fetched grants nothing while unreachable."""
+
+        def fetch(_group: str) -> list[str]:
+            raise ConnectionError("directory down")
+
+        memberships = GroupMembershipCache(fetch)
+
+        assert memberships.groups_of("alice@company.com", ["engineering"]) == set()
+
+    def test_outage_backs_off_and_logs_once(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that an unreachable directory is retried only after the delay."""
+        now = [0.0]
+        monkeypatch.setattr(group_access.time, "monotonic", lambda: now[0])
+        calls: list[str] = []
+        failing = [True]
+
+        def fetch(group: str) -> list[str]:
+            calls.append(group)
+            if failing[0]:
+                raise ConnectionError("directory down")
+            return DIRECTORY[group]
+
+        memberships = GroupMembershipCache(fetch)
+        for _ in range(3):
+            memberships.groups_of("alice@company.com", ["engineering"])
+        assert calls == ["engineering"]
+
+        now[0] = group_access.GROUP_RETRY_DELAY + 1
+        memberships.groups_of("alice@company.com", ["engineering"])
+        assert len(calls) == 2
+        assert caplog.text.count("Could not fetch members") == 1
+
+        failing[0] = False
+        now[0] = 2 * (group_access.GROUP_RETRY_DELAY + 1)
+        groups = memberships.groups_of("alice@company.com", ["engineering"])
+
+        assert groups == {"engineering"}
+        assert len(calls) == 3
+
+
+class TestGroupAccess:
+    """Tests for GroupAccess."""
+
+    def test_roles_match_without_directory(self, whitelist: WhitelistService) -> None:
+        """Test that SSO group claims in roles are matched case-insensitively."""
+        access = GroupAccess(whitelist)
+        whitelist.add_group("Engineering", "admin@company.com")
+
+        assert access.is_allowed(_user("x@company.com", ["engineering"]))
+        assert not access.is_allowed(_user("y@company.com", ["sales"]))
+
+    def test_directory_membership(
+        self,
+        whitelist: WhitelistService,
+        memberships: GroupMembershipCache,
+        fetched: list[str],
+    ) -> None:
+        """Test that directory members are allowed and reruns do no lookups."""
+        access = GroupAccess(whitelist, memberships)
+        assert not access.is_allowed(_user("bob@company.com"))
+        assert fetched == []
+
+        whitelist.add_group("product", "admin@company.com")
+        assert access.is_allowed(_user("bob@company.com"))
+        assert access.is_allowed(_user("bob@company.com"))
+        assert fetched == ["product"]
+
+    def test_rule_changes_invalidate_affected_groups(
+        self,
+        whitelist: WhitelistService,
+        memberships: GroupMembershipCache,
+        fetched: list[str],
+    ) -> None:
+        """Test that removing and re-adding a rule refetches only that group."""
+        access = GroupAccess(whitelist, memberships)
+        whitelist.add_group("product", "admin@company.com")
+        whitelist.add_group("engineering", "admin@company.com")
+        assert access.is_allowed(_user("dave@company.com"))
+        fetched.clear()
+
+        whitelist.remove_group("product", "admin@company.com")
+        assert not access.is_allowed(_user("bob@company.com"))
+        whitelist.add_group("product", "admin@company.com")
+        assert access.is_allowed(_user("bob@company.com"))
+
+        assert fetched == ["product"]
@@ -0,0 +1,148 @@
+"""Unit tests for the statistics history store."""
+
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from models.history import Resolution
+from models.job import JenkinsJob
+from services.dashboard import calculate_statistics
+from services.history import RAW_BUFFER_SIZE, StatsHistory
+
+# 2026-01-08 10:00:00 UTC, aligned to the hour
+BASE_TS = 1767866400
+
+
+@pytest.fixture
+def history() -> Iterator[StatsHistory]:
+    """Create an in-memory history store."""
+    store = StatsHistory(":memory:")
+    yield store
+    store.close()
+
+
+class TestStatsHistory:
+    """Tests for StatsHistory class."""
+
+    def test_record_appends_raw_point(
+        self, history: StatsHistory, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that a poll is stored as a raw point."""
+        history.record(calculate_statistics(mock_jobs_list), mock_jobs_list, BASE_TS)
+
+        points = history.points(Resolution.RAW)
+
+        assert len(points) == 1
+        assert points[0].counts["total"] == 3
+        assert points[0].counts["failure"] == 1
+        assert points[0].health == "warning"
+
+    def test_minute_rollup_averages_samples(
+        self,
+        history: StatsHistory,
+        mock_jenkins_job_success: JenkinsJob,
+        mock_jenkins_job_failure: JenkinsJob,
+    ) -> None:
+        """Test that raw samples roll up into averaged 1-minute buckets."""
+        healthy = [mock_jenkins_job_success] * 4
+        failing = [mock_jenkins_job_failure] * 4
+        history.record(calculate_statistics(healthy), healthy, BASE_TS)
+        history.record(calculate_statistics(failing), failing, BASE_TS + 30)
+        history.record(calculate_statistics(healthy), healthy, BASE_TS + 60)
+
+        points = history.points(Resolution.MINUTE)
+
+        assert [p.timestamp for p in points] == [BASE_TS, BASE_TS + 60]
+        assert points[0].samples == 2
+        assert points[0].counts["failure"] == 2
+        assert points[0].success_rate == 50.0
+        assert points[0].health == "critical"
+        assert points[1].samples == 1
+
+    def test_raw_ring_is_bounded(
+        self, history: StatsHistory, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that raw points beyond the buffer size are dropped."""
+        stats = calculate_statistics(mock_jobs_list)
+        for i in range(RAW_BUFFER_SIZE + 10):
+            history.record(stats, mock_jobs_list, BASE_TS + i * 30)
+
+        assert len(history.points(Resolution.RAW)) == RAW_BUFFER_SIZE
+
+    def test_delta_over_window(
+        self,
+        history: StatsHistory,
+        mock_jenkins_job_success: JenkinsJob,
+        mock_jenkins_job_failure: JenkinsJob,
+    ) -> None:
+        """Test the change of a field over a time window."""
+        before = [mock_jenkins_job_success] * 3
+        after = [mock_jenkins_job_success, mock_jenkins_job_failure]
+        history.record(calculate_statistics(before), before, BASE_TS)
+        history.record(calculate_statistics(after), after, BASE_TS + 3600)
+
+        assert history.delta("failure", 3600, now=BASE_TS + 3600) == 1
+        assert history.delta("total", 3600, now=BASE_TS + 3600) == -1
+        assert history.delta("total", 7200, now=BASE_TS + 3600) is None
+
+    def test_only_status_changes_are_logged(
+        self,
+        history: StatsHistory,
+        mock_jenkins_job_success: JenkinsJob,
+        mock_jenkins_job_failure: JenkinsJob,
+    ) -> None:
+        """Test that per-job status is stored only when it changes."""
+        jobs = [mock_jenkins_job_success, mock_jenkins_job_failure]
+        history.record(calculate_statistics(jobs), jobs, BASE_TS)
+        history.record(calculate_statistics(jobs), jobs, BASE_TS + 30)
+
+        changes = history.job_changes(since=BASE_TS + 1)
+
+        assert changes == []
+        assert len(history.job_changes(since=BASE_TS)) == 2
+
+    def test_history_survives_reopen(self, mock_jobs_list: list[JenkinsJob]) -> None:
+        """Test that closed buckets and job statuses are reloaded from disk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "history.db"
+            stats = calculate_statistics(mock_jobs_list)
+
+            store = StatsHistory(path)
+            store.record(stats, mock_jobs_list, BASE_TS)
+            store.record(stats, mock_jobs_list, BASE_TS + 60)
+            store.close()
+
+            reopened = StatsHistory(path)
+            reopened.record(stats, mock_jobs_list, BASE_TS + 90)
+
+            assert len(reopened.points(Resolution.RAW)) == 3
+            assert reopened.points(Resolution.MINUTE)[0].timestamp == BASE_TS
+            assert reopened.job_changes(since=BASE_TS + 1) == []
+            reopened.close()
+
+    def test_open_buckets_survive_reopen(
+        self,
+        mock_jenkins_job_success: JenkinsJob,
+        mock_jenkins_job_failure: JenkinsJob,
+    ) -> None:
+        """Test that samples of a still-open bucket are kept across restarts."""
+        healthy = [mock_jenkins_job_success] * 4
+        failing = [mock_jenkins_job_failure] * 4
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "history.db"
+
+            store = StatsHistory(path)
+            store.record(calculate_statistics(healthy), healthy, BASE_TS)
+            store.close()
+
+            reopened = StatsHistory(path)
+            reopened.record(calculate_statistics(failing), failing, BASE_TS + 30)
+            hour = reopened.points(Resolution.HOUR)
+            reopened.close()
+
+            assert len(hour) == 1
+            assert hour[0].samples == 2
+            assert hour[0].counts["failure"] == 2
+            assert hour[0].health == "critical"
@@ -104,7 +104,7 @@ class TestJenkinsService:
     ) -> None:
         """Test get_all_jobs raises JenkinsConnectionError on connection failure."""
         jenkins_service._server = mock_jenkins_server
-        mock_jenkins_server.get_all_jobs.side_effect = Exception("Connection refused")
+        mock_jenkins_server.get_info.side_effect = Exception("Connection refused")
 
         with pytest.raises(JenkinsConnectionError):
             jenkins_service.get_all_jobs()
@@ -155,3 +155,95 @@ class TestJenkinsService:
 
         assert job.status == JobStatus.BUILDING
         assert job.is_building is True
+
+    def test_get_all_jobs_makes_no_per_job_requests(
+        self,
+        jenkins_service: JenkinsService,
+        mock_jenkins_server: MagicMock,
+    ) -> None:
+        """Test that the listing uses only the job list response."""
+        jenkins_service._server = mock_jenkins_server
+
+        jobs = jenkins_service.get_all_jobs()
+
+        mock_jenkins_server.get_job_info.assert_not_called()
+        mock_jenkins_server.get_build_info.assert_not_called()
+        mock_jenkins_server.get_info.assert_called_once()
+        assert [job.status for job in jobs] == [
+            JobStatus.SUCCESS,
+            JobStatus.FAILURE,
+            JobStatus.BUILDING,
+        ]
+        assert jobs[2].is_building is True
+
+    def test_get_all_jobs_includes_last_build(
+        self,
+        jenkins_service: JenkinsService,
+        mock_jenkins_server: MagicMock,
+    ) -> None:
+        """Test that the listing fills the last build fields."""
+        jenkins_service._server = mock_jenkins_server
+
+        job = jenkins_service.get_all_jobs()[0]
+
+        query = mock_jenkins_server.get_info.call_args.kwargs["query"]
+        assert "lastBuild[number,result,timestamp,duration,building]" in query
+        assert job.last_build_number == 142
+        assert job.last_build_result == "SUCCESS"
+        assert job.last_build_timestamp_ms == 1704708600000
+        assert job.last_build_duration_ms == 45000
+
+    def test_get_all_jobs_walks_folders(
+        self,
+        jenkins_service: JenkinsService,
+        mock_jenkins_server: MagicMock,
+    ) -> None:
+        """Test that jobs in folders are listed and folders themselves are not."""
+        jenkins_service._server = mock_jenkins_server
+        deep_job = {"name": "deep", "url": "https://j/job/a/job/b/job/deep/"}
+        mock_jenkins_server.get_info.side_effect = [
+            {
+                "jobs": [
+                    {"name": "top", "url": "https://j/job/top/", "color": "blue"},
+                    {
+                        "name": "a",
+                        "url": "https://j/job/a/",
+                        "jobs": [
+                            {"name": "b", "url": "https://j/job/a/job/b/", "jobs": [{}]}
+                        ],
+                    },
+                ]
+            },
+            {"jobs": [{**deep_job, "color": "red"}]},
+        ]
+
+        jobs = jenkins_service.get_all_jobs()
+
+        assert [job.status for job in jobs] == [JobStatus.SUCCESS, JobStatus.FAILURE]
+        assert [job.name for job in jobs] == ["top", "a/b/deep"]
+        # Folders below the fetched depth are fetched from their own URL
+        assert mock_jenkins_server.get_info.call_args.args == ("/job/a/job/b",)
+
+    def test_get_job_details_with_builds(
+        self,
+        jenkins_service: JenkinsService,
+        mock_jenkins_server: MagicMock,
+        mock_job_info: dict,
+        mock_build_info: dict,
+    ) -> None:
+        """Test that details include the recent builds, newest first."""
+        jenkins_service._server = mock_jenkins_server
+        mock_jenkins_server.get_job_info.return_value = {
+            **mock_job_info,
+            "builds": [{"number": n} for n in range(142, 130, -1)],
+        }
+        mock_jenkins_server.get_build_info.side_effect = lambda _name, number: {
+            **mock_build_info,
+            "number": number,
+        }
+
+        details = jenkins_service.get_job_details_with_builds("frontend-build", 5)
+
+        assert details.job.last_build_number == 142
+        assert [b.number for b in details.recent_builds] == [142, 141, 140, 139, 138]
+        assert details.recent_builds[0].result == "SUCCESS"
@@ -0,0 +1,198 @@
+"""Unit tests for the job list codec."""
+
+import struct
+from unittest.mock import patch
+
+import pytest
+
+from models.exceptions import JobCodecError
+from models.job import JenkinsJob, JobStatus
+from services.dashboard import calculate_statistics
+from services.job_codec import EncodedJobList, decode_jobs, encode_jobs
+
+
+class TestJobCodec:
+    """Tests for encode_jobs / decode_jobs round trips."""
+
+    def test_round_trip_preserves_jobs(
+        self,
+        mock_jobs_list: list[JenkinsJob],
+        mock_jenkins_job_not_built: JenkinsJob,
+    ) -> None:
+        """Test that decoding returns jobs equal to the encoded ones."""
+        jobs = [*mock_jobs_list, mock_jenkins_job_not_built]
+
+        assert decode_jobs(encode_jobs(jobs)) == jobs
+
+    def test_round_trip_empty_list(self) -> None:
+        """Test encoding an empty job list."""
+        assert decode_jobs(encode_jobs([])) == []
+
+    def test_round_trip_non_ascii_names(
+        self, mock_jenkins_job_success: JenkinsJob
+    ) -> None:
+        """Test that UTF-8 job names survive encoding."""
+        job = JenkinsJob(
+            name="發布-流程",
+            url="https://jenkins.company.com/job/release/",
+            status=JobStatus.SUCCESS,
+            last_build_number=1,
+            last_build_result="SUCCESS",
+            last_build_timestamp=None,
+            last_build_duration_ms=0,
+            is_building=False,
+        )
+
+        assert decode_jobs(encode_jobs([job, mock_jenkins_job_success])) == [
+            job,
+            mock_jenkins_job_success,
+        ]
+
+    def test_float_values_are_truncated(
+        self, mock_jenkins_job_success: JenkinsJob
+    ) -> None:
+        """Test that float build values from Jenkins encode as integers."""
+        job = JenkinsJob.from_fields(
+            "float-job",
+            "https://jenkins.company.com/job/float-job/",
+            JobStatus.SUCCESS,
+            7,
+            "SUCCESS",
+            1704067200000.0,  # type: ignore[arg-type]
+            1234.9,  # type: ignore[arg-type]
+            False,
+        )
+
+        decoded = decode_jobs(encode_jobs([job, mock_jenkins_job_success]))
+
+        assert decoded[0].last_build_timestamp_ms == 1704067200000
+        assert decoded[0].last_build_duration_ms == 1234
+        assert decoded[1] == mock_jenkins_job_success
+
+    def test_out_of_range_values_are_clamped(self) -> None:
+        """Test that values beyond the 64-bit record fields are clamped."""
+        job = JenkinsJob.from_fields(
+            "huge-job",
+            "https://jenkins.company.com/job/huge-job/",
+            JobStatus.SUCCESS,
+            2**70,
+            "SUCCESS",
+            -(2**70),
+            float("inf"),  # type: ignore[arg-type]
+            False,
+        )
+
+        (decoded,) = decode_jobs(encode_jobs([job]))
+
+        assert decoded.last_build_number == 2**63 - 1
+        assert decoded.last_build_timestamp_ms == -(2**63)
+        assert decoded.last_build_duration_ms is None
+
+    def test_negative_values_round_trip(self) -> None:
+        """Test that -1 is kept apart from a missing value."""
+        job = JenkinsJob.from_fields(
+            "odd-job",
+            "https://jenkins.company.com/job/odd-job/",
+            JobStatus.ABORTED,
+            -1,
+            None,
+            -1,
+            -1,
+            True,
+        )
+        missing = JenkinsJob.from_fields(
+            "new-job", "", JobStatus.NOT_BUILT, None, None, None, None, False
+        )
+
+        assert decode_jobs(encode_jobs([job, missing])) == [job, missing]
+
+    def test_reads_legacy_schema(self) -> None:
+        """Test that schema 1 payloads, with -1 for missing values, decode."""
+        strings = "\x00".join(["legacy", "https://jenkins.company.com/job/legacy/"])
+        blob = strings.encode()
+        counts = [0] * len(JobStatus)
+        counts[list(JobStatus).index(JobStatus.SUCCESS)] = 1
+        status = list(JobStatus).index(JobStatus.SUCCESS)
+        payload = b"".join(
+            [
+                struct.pack("<4sHII", b"JJLC", 1, 1, len(blob)),
+                struct.pack(f"<{len(counts)}I", *counts),
+                struct.pack("<IIBBIqqq", 0, 1, status, 1, 0xFFFFFFFF, 12, -1, 500),
+                blob,
+            ]
+        )
+
+        (job,) = decode_jobs(payload)
+
+        assert job.name == "legacy"
+        assert job.last_build_number == 12
+        assert job.last_build_timestamp_ms is None
+        assert job.last_build_duration_ms == 500
+        assert job.is_building
+
+    def test_rejects_other_schema_version(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that a payload with a different schema is rejected."""
+        payload = bytearray(encode_jobs(mock_jobs_list))
+        struct.pack_into("<H", payload, 4, 99)
+
+        with pytest.raises(JobCodecError):
+            decode_jobs(bytes(payload))
+
+    def test_rejects_truncated_payload(self, mock_jobs_list: list[JenkinsJob]) -> None:
+        """Test that a truncated payload is rejected."""
+        with pytest.raises(JobCodecError):
+            decode_jobs(encode_jobs(mock_jobs_list)[:-3])
+
+
+class TestEncodedJobList:
+    """Tests for lazy decoding through EncodedJobList."""
+
+    def test_status_counts_without_decoding(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that counts come from the header and decode no job."""
+        jobs = EncodedJobList(encode_jobs(mock_jobs_list))
+
+        counts = jobs.status_counts()
+
+        assert counts[JobStatus.SUCCESS] == 1
+        assert counts[JobStatus.FAILURE] == 1
+        assert counts[JobStatus.BUILDING] == 1
+        assert jobs._strings is None
+
+    def test_single_job_access_decodes_one_job(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that indexing decodes only the requested job."""
+        jobs = EncodedJobList(encode_jobs(mock_jobs_list))
+
+        with patch.object(jobs, "_decode", wraps=jobs._decode) as decode:
+            assert jobs[-1] == mock_jobs_list[-1]
+
+        decode.assert_called_once_with(len(mock_jobs_list) - 1)
+
+    def test_walks_share_one_decoded_list(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that iterating decodes every job once for all consumers."""
+        jobs = EncodedJobList(encode_jobs(mock_jobs_list))
+
+        first = list(jobs)
+        with patch.object(jobs, "_decode", wraps=jobs._decode) as decode:
+            second = list(jobs)
+            assert jobs[0] is first[0]
+            assert jobs[1:] == first[1:]
+
+        assert all(a is b for a, b in zip(first, second, strict=True))
+        assert jobs.decoded() is jobs.decoded()
+        decode.assert_not_called()
+
+    def test_statistics_match_plain_list(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test calculate_statistics on an encoded list."""
+        jobs = EncodedJobList(encode_jobs(mock_jobs_list))
+
+        assert calculate_statistics(jobs) == calculate_statistics(mock_jobs_list)
@@ -0,0 +1,177 @@
+"""Unit tests for the on-demand job details cache."""
+
+import threading
+import time
+
+import pytest
+
+from models.exceptions import JenkinsConnectionError
+from models.job import JenkinsJob, JobDetails, JobStatus
+from services.job_details import JobDetailsCache, select_prefetch
+
+
+def _job(name: str, status: JobStatus = JobStatus.SUCCESS) -> JenkinsJob:
+    """Build a job with a given name and status."""
+    return JenkinsJob(
+        name=name,
+        url=f"https://jenkins.company.com/job/{name}/",
+        status=status,
+        last_build_number=1,
+        last_build_result=None,
+    )
+
+
+class _CountingFetch:
+    """Fetch function that counts calls and can block until released."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, name: str) -> JobDetails:
+        self.calls.append(name)
+        self.release.wait(5)
+        return JobDetails(job=_job(name), recent_builds=())
+
+
+class TestJobDetailsCache:
+    """Tests for JobDetailsCache."""
+
+    def test_details_are_cached(self) -> None:
+        """Test that a second get is served from the cache."""
+        fetch = _CountingFetch()
+        cache = JobDetailsCache(fetch)
+
+        first = cache.get("api")
+
+        assert cache.get("api") is first
+        assert cache.peek("api") is first
+        assert fetch.calls == ["api"]
+
+    def test_concurrent_gets_share_one_fetch(self) -> None:
+        """Test single-flight fetching for concurrent callers."""
+        fetch = _CountingFetch()
+        fetch.release.clear()
+        cache = JobDetailsCache(fetch)
+        results: list[JobDetails] = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get("api")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        fetch.release.set()
+        for thread in threads:
+            thread.join()
+
+        assert fetch.calls == ["api"]
+        assert len(results) == 8
+        assert all(r is results[0] for r in results)
+
+    def test_expired_details_are_fetched_again(self) -> None:
+        """Test that details past their TTL are refetched."""
+        fetch = _CountingFetch()
+        cache = JobDetailsCache(fetch, ttl=0)
+
+        cache.get("api")
+        cache.get("api")
+
+        assert fetch.calls == ["api", "api"]
+        assert cache.peek("api") is None
+
+    def test_failures_are_not_cached(self) -> None:
+        """Test that a failed fetch is retried on the next get."""
+        calls = []
+
+        def fetch(name: str) -> JobDetails:
+            calls.append(name)
+            if len(calls) == 1:
+                raise JenkinsConnectionError("Connection refused")
+            return JobDetails(job=_job(name), recent_builds=())
+
+        cache = JobDetailsCache(fetch)
+
+        with pytest.raises(JenkinsConnectionError):
+            cache.get("api")
+        assert cache.get("api").job.name == "api"
+
+    def test_base_exception_releases_waiters(self) -> None:
+        """Test that waiters are released when a fetch is interrupted."""
+
+        class Interrupted(BaseException):
+            pass
+
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch(name: str) -> JobDetails:
+            calls.append(name)
+            if len(calls) == 1:
+                started.set()
+                release.wait(5)
+                raise Interrupted
+            return JobDetails(job=_job(name), recent_builds=())
+
+        cache = JobDetailsCache(fetch)
+        errors: list[BaseException] = []
+
+        def get() -> None:
+            try:
+                cache.get("api")
+            except Interrupted as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=get) for _ in range(2)]
+        threads[0].start()
+        assert started.wait(5)
+        threads[1].start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert len(errors) == 2
+        assert cache.get("api").job.name == "api"
+
+    def test_prefetch_warms_cache(self) -> None:
+        """Test that prefetched jobs are served without fetching."""
+        fetch = _CountingFetch()
+        cache = JobDetailsCache(fetch)
+        cache.get("api")
+
+        scheduled = cache.prefetch(["api", "web", "db"])
+        # Joins the in-flight prefetches instead of fetching again
+        cache.get("web")
+        cache.get("db")
+
+        assert scheduled == 2
+        assert sorted(fetch.calls) == ["api", "db", "web"]
+        cache.close()
+
+
+class TestSelectPrefetch:
+    """Tests for picking jobs to prefetch."""
+
+    def test_failing_jobs_come_first(self) -> None:
+        """Test that failing and unstable jobs precede recent changes."""
+        jobs = [
+            _job("green"),
+            _job("broken", JobStatus.FAILURE),
+            _job("flaky", JobStatus.UNSTABLE),
+            _job("changed"),
+        ]
+
+        picked = select_prefetch(jobs, ["changed", "gone", "broken"])
+
+        assert picked == ["broken", "flaky", "changed"]
+
+    def test_limit_is_respected(self) -> None:
+        """Test that no more than the limit is picked."""
+        jobs = [_job(f"job-{i}", JobStatus.FAILURE) for i in range(10)]
+
+        assert len(select_prefetch(jobs, limit=3)) == 3
@@ -0,0 +1,114 @@
+"""Unit tests for grouped job views."""
+
+import pytest
+
+from models.job import JenkinsJob, JobStatus
+from services.jenkins import JenkinsService
+from services.job_groups import ROOT_GROUP, group_jobs, group_key
+from services.job_query import build_job_columns
+
+
+def _job(name: str, status: JobStatus = JobStatus.SUCCESS) -> JenkinsJob:
+    """Build a job with a status."""
+    return JenkinsJob(
+        name=name,
+        url=f"https://jenkins.company.com/job/{name}/",
+        status=status,
+        last_build_number=1,
+        last_build_result=None,
+    )
+
+
+JOBS = [
+    _job("payments/api", JobStatus.FAILURE),
+    _job("web/frontend"),
+    _job("payments/worker"),
+    _job("payments/deploy", JobStatus.BUILDING),
+    _job("standalone-build"),
+    _job("payments/legacy", JobStatus.DISABLED),
+    _job("standalone-test", JobStatus.UNSTABLE),
+]
+
+
+class TestJobGroups:
+    """Tests for grouping jobs and splitting orderings into groups."""
+
+    @pytest.mark.parametrize(
+        ("name", "group_by", "expected"),
+        [
+            ("payments/api", "Folder", "payments"),
+            ("a/b/c", "Folder", "a/b"),
+            ("standalone-build", "Folder", ROOT_GROUP),
+            ("payments/api", "Prefix", "payments"),
+            ("web-frontend_ci", "Prefix", "web"),
+            ("release.nightly", "Prefix", "release"),
+            ("single", "Prefix", "single"),
+        ],
+    )
+    def test_group_key(self, name: str, group_by: str, expected: str) -> None:
+        """Test folder and prefix keys."""
+        assert group_key(name, group_by) == expected
+
+    def test_groups_are_sorted_with_counts(self) -> None:
+        """Test group membership and header counts."""
+        grouping = group_jobs(build_job_columns(JOBS), "Folder")
+
+        assert [g.key for g in grouping.groups] == [ROOT_GROUP, "payments", "web"]
+        payments = grouping.groups[1]
+        assert payments.total == 4
+        assert payments.failure == 1
+        assert payments.building == 1
+        # Building and disabled jobs are not counted, as in the status bar
+        assert payments.success_rate == 50.0
+
+    def test_folder_grouping_of_listed_jobs(self) -> None:
+        """Test that jobs from the Jenkins listing group by their folders."""
+        service = JenkinsService()
+        jobs = [
+            service._parse_job(
+                {"name": leaf, "fullname": f"{folder}/{leaf}", "color": "blue"}
+            )
+            for folder, leaf in [("payments", "api"), ("web", "ui"), ("payments", "x")]
+        ]
+
+        grouping = group_jobs(build_job_columns(jobs), "Folder")
+
+        assert [(g.key, g.total) for g in grouping.groups] == [
+            ("payments", 2),
+            ("web", 1),
+        ]
+
+    def test_prefix_grouping(self) -> None:
+        """Test grouping by name prefix."""
+        grouping = group_jobs(build_job_columns(JOBS), "Prefix")
+
+        assert [(g.key, g.total) for g in grouping.groups] == [
+            ("payments", 4),
+            ("standalone", 2),
+            ("web", 1),
+        ]
+
+    def test_partition_keeps_order_within_groups(self) -> None:
+        """Test that each group lists its jobs in the ordering given."""
+        grouping = group_jobs(build_job_columns(JOBS), "Folder")
+
+        parts = grouping.partition((6, 5, 3, 2, 0, 4))
+
+        assert [(g.key, indices) for g, indices in parts] == [
+            (ROOT_GROUP, (6, 4)),
+            ("payments", (5, 3, 2, 0)),
+        ]
+
+    def test_partition_is_cached_per_ordering(self) -> None:
+        """Test that the same ordering object is split once."""
+        grouping = group_jobs(build_job_columns(JOBS), "Folder")
+        order = tuple(range(len(JOBS)))
+
+        assert grouping.partition(order) is grouping.partition(order)
+
+    def test_empty_job_list(self) -> None:
+        """Test grouping no jobs."""
+        grouping = group_jobs(build_job_columns([]), "Prefix")
+
+        assert len(grouping) == 0
+        assert grouping.partition(()) == []
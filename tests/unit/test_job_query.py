@@ -0,0 +1,149 @@
+"""Unit tests for the job filter query language."""
+
+import pytest
+
+from models.exceptions import JobQueryError
+from models.job import JenkinsJob, JobStatus
+from services.jenkins import JenkinsService
+from services.job_query import build_job_columns, compile_query, status_query
+
+NOW_MS = 1_700_000_000_000
+HOUR_MS = 3_600_000
+
+
+def _job(
+    name: str,
+    status: JobStatus = JobStatus.SUCCESS,
+    hours_ago: float | None = 1,
+    duration_min: float | None = 5,
+    building: bool = False,
+    number: int | None = 10,
+    result: str | None = "SUCCESS",
+) -> JenkinsJob:
+    """Build a job relative to NOW_MS."""
+    return JenkinsJob(
+        name=name,
+        url=f"https://jenkins.company.com/job/{name}/",
+        status=status,
+        last_build_number=number,
+        last_build_result=result,
+        last_build_duration_ms=None
+        if duration_min is None
+        else int(duration_min * 60_000),
+        is_building=building,
+        last_build_timestamp_ms=None
+        if hours_ago is None
+        else int(NOW_MS - hours_ago * HOUR_MS),
+    )
+
+
+JOBS = [
+    _job("payments/api", JobStatus.FAILURE, hours_ago=3, result="FAILURE"),
+    _job("payments/worker", JobStatus.UNSTABLE, duration_min=15, result="UNSTABLE"),
+    _job("payments/legacy/batch", hours_ago=30, number=500),
+    _job("web/frontend", JobStatus.BUILDING, building=True, result=None),
+    _job("standalone", JobStatus.NOT_BUILT, None, None, number=None, result=None),
+]
+
+
+def _names(query: str) -> list[str]:
+    """Names of JOBS matching a query."""
+    mask = compile_query(query).mask(build_job_columns(JOBS), NOW_MS)
+    return [job.name for job, keep in zip(JOBS, mask, strict=True) if keep]
+
+
+class TestJobQuery:
+    """Tests for parsing and evaluating filter queries."""
+
+    def test_blank_query_matches_all(self) -> None:
+        """Test that an empty query keeps every job."""
+        assert len(_names("   ")) == len(JOBS)
+        assert compile_query("").predicates == ()
+
+    def test_status_alternatives(self) -> None:
+        """Test comma-separated statuses."""
+        assert _names("status:failure,unstable") == [
+            "payments/api",
+            "payments/worker",
+        ]
+
+    def test_folder_glob_includes_subfolders_and_folder_itself(self) -> None:
+        """Test folder globs."""
+        assert _names("folder:payments/*") == [
+            "payments/api",
+            "payments/worker",
+            "payments/legacy/batch",
+        ]
+        assert _names("folder:payments") == ["payments/api", "payments/worker"]
+
+    def test_folder_of_listed_job(self) -> None:
+        """Test that folders come from the full name in the Jenkins listing."""
+        job = JenkinsService()._parse_job(
+            {
+                "name": "api",
+                "fullname": "payments/api",
+                "url": "https://jenkins.company.com/job/payments/job/api/",
+                "color": "blue",
+            }
+        )
+        columns = build_job_columns([job])
+
+        assert list(compile_query("folder:payments/*").mask(columns, NOW_MS)) == [True]
+
+    def test_name_glob(self) -> None:
+        """Test name globs."""
+        assert _names("name:*front*") == ["web/frontend"]
+
+    def test_age_and_duration_comparisons(self) -> None:
+        """Test time comparisons; jobs without builds never match."""
+        assert _names("age>2h") == ["payments/api", "payments/legacy/batch"]
+        assert _names("age<=1d duration>10m") == ["payments/worker"]
+
+    def test_building_and_build_number(self) -> None:
+        """Test boolean and numeric fields."""
+        assert _names("building:true") == ["web/frontend"]
+        assert _names("build>=100") == ["payments/legacy/batch"]
+
+    def test_result_is_case_insensitive(self) -> None:
+        """Test last build result matching."""
+        assert _names("result:failure") == ["payments/api"]
+
+    def test_negation(self) -> None:
+        """Test negated terms."""
+        assert _names("folder:payments/* -status:success") == [
+            "payments/api",
+            "payments/worker",
+        ]
+
+    def test_compiled_queries_are_cached(self) -> None:
+        """Test that equal query strings share one compilation."""
+        assert compile_query("status:failure  age>2h") is compile_query(
+            "status:failure age>2h"
+        )
+
+    def test_time_dependence(self) -> None:
+        """Test that only age terms make a query time dependent."""
+        assert compile_query("age>1h").time_dependent
+        assert not compile_query("status:failure duration>1m").time_dependent
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "failure",
+            "colour:red",
+            "status:broken",
+            "status>failure",
+            "age>soon",
+            "building:maybe",
+            "build>latest",
+        ],
+    )
+    def test_invalid_queries(self, query: str) -> None:
+        """Test that malformed queries raise JobQueryError."""
+        with pytest.raises(JobQueryError):
+            compile_query(query)
+
+    def test_status_query(self) -> None:
+        """Test building a status term from multiselect values."""
+        assert status_query(["failure", "unstable"]) == "status:failure,unstable"
+        assert status_query([]) == ""
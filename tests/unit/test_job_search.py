@@ -0,0 +1,66 @@
+"""Unit tests for the job name search index."""
+
+from services.job_search import JobSearchIndex
+
+NAMES = [
+    "mobile-app-android",
+    "mobile-app-ios",
+    "backend-api",
+    "api-gateway",
+    "rapid-build",
+    "API",
+    "team-a/payment-service",
+    "team-b/payment-worker",
+]
+
+
+def _search(query: str) -> list[str]:
+    """Search NAMES and return the matching names in rank order."""
+    return [NAMES[i] for i in JobSearchIndex(NAMES).search(query)]
+
+
+class TestJobSearchIndex:
+    """Tests for JobSearchIndex."""
+
+    def test_exact_then_prefix_then_token_then_substring(self) -> None:
+        """Test ranking of exact, prefix, token and substring matches."""
+        assert _search("api") == ["API", "api-gateway", "backend-api", "rapid-build"]
+
+    def test_token_prefix(self) -> None:
+        """Test that a token in the middle of a name matches by prefix."""
+        assert _search("andr") == ["mobile-app-android"]
+
+    def test_substring(self) -> None:
+        """Test matching inside a token."""
+        assert _search("ateway") == ["api-gateway"]
+
+    def test_fuzzy_match_for_typos(self) -> None:
+        """Test that a misspelled term still finds the job."""
+        assert _search("andriod") == ["mobile-app-android"]
+
+    def test_every_term_must_match(self) -> None:
+        """Test that multi-word queries intersect."""
+        assert _search("payment worker") == ["team-b/payment-worker"]
+        assert _search("mobile") == ["mobile-app-android", "mobile-app-ios"]
+
+    def test_case_insensitive(self) -> None:
+        """Test that matching ignores case."""
+        assert _search("BACKEND") == ["backend-api"]
+
+    def test_no_match(self) -> None:
+        """Test a query matching nothing."""
+        assert _search("zzzz") == []
+
+    def test_empty_query_returns_all_in_name_order(self) -> None:
+        """Test that a blank query lists every job."""
+        assert _search("  ") == sorted(NAMES, key=str.lower)
+
+    def test_large_result_sets_keep_rank_order(self) -> None:
+        """Test ranking when most jobs match."""
+        names = [f"service-{i}" for i in range(100)] + ["service"]
+        index = JobSearchIndex(names)
+
+        result = index.search("service")
+
+        assert names[result[0]] == "service"
+        assert len(result) == 101
@@ -0,0 +1,229 @@
+"""Unit tests for sorted and filtered job views."""
+
+import threading
+
+import pytest
+
+from models.job import JenkinsJob, JobStatus
+from services.job_query import build_job_columns, compile_query
+from services.job_view import JobViewCache, build_sort_keys, order_jobs
+
+
+def _jobs(count: int) -> list[JenkinsJob]:
+    """Build jobs with alternating statuses."""
+    statuses = [JobStatus.SUCCESS, JobStatus.FAILURE, JobStatus.BUILDING]
+    return [
+        JenkinsJob(
+            name=f"job-{i:03d}",
+            url=f"https://jenkins.company.com/job/job-{i:03d}/",
+            status=statuses[i % len(statuses)],
+            last_build_number=i,
+            last_build_result=None,
+        )
+        for i in range(count)
+    ]
+
+
+class TestJobOrdering:
+    """Tests for sorting and filtering on precomputed keys."""
+
+    def test_order_by_name(self, mock_jobs_list: list[JenkinsJob]) -> None:
+        """Test that name order matches a case-insensitive sort."""
+        order = order_jobs(build_sort_keys(mock_jobs_list), "Name")
+
+        assert [mock_jobs_list[i].name for i in order] == sorted(
+            (j.name for j in mock_jobs_list), key=str.lower
+        )
+
+    def test_order_by_status_puts_failures_first(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that status order starts with failures."""
+        order = order_jobs(build_sort_keys(mock_jobs_list), "Status")
+
+        assert mock_jobs_list[order[0]].status == JobStatus.FAILURE
+
+    def test_order_by_last_build_is_newest_first(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that build order is descending."""
+        order = order_jobs(build_sort_keys(mock_jobs_list), "Last Build")
+        numbers = [mock_jobs_list[i].last_build_number or 0 for i in order]
+
+        assert numbers == sorted(numbers, reverse=True)
+
+    def test_filter_by_status(self, mock_jobs_list: list[JenkinsJob]) -> None:
+        """Test that only jobs with a selected status are kept."""
+        mask = compile_query("status:failure").mask(build_job_columns(mock_jobs_list))
+        order = order_jobs(build_sort_keys(mock_jobs_list), "Name", mask)
+
+        assert order
+        assert all(mock_jobs_list[i].status == JobStatus.FAILURE for i in order)
+
+
+class TestJobViewCache:
+    """Tests for the shared view cache."""
+
+    def test_same_query_is_computed_once(self) -> None:
+        """Test that repeated queries on a snapshot share one ordering."""
+        cache = JobViewCache()
+        jobs = _jobs(30)
+
+        first = cache.order(1, jobs, "Status", ["failure", "building"])
+        second = cache.order(1, jobs, "Status", ["building", "failure"])
+
+        assert first is second
+        assert cache.misses == 1
+        assert cache.hits == 1
+
+    def test_matches_uncached_ordering(self) -> None:
+        """Test that cached orderings equal directly computed ones."""
+        cache = JobViewCache()
+        jobs = _jobs(30)
+
+        for sort_by in ("Name", "Status", "Last Build"):
+            mask = compile_query("status:success").mask(build_job_columns(jobs))
+            expected = order_jobs(build_sort_keys(jobs), sort_by, mask)
+            assert cache.order(1, jobs, sort_by, ["success"]) == expected
+
+    def test_new_version_is_recomputed(self) -> None:
+        """Test that a new snapshot version does not reuse old orderings."""
+        cache = JobViewCache()
+
+        old = cache.order(1, _jobs(10), "Name", ())
+        new = cache.order(2, _jobs(20), "Name", ())
+
+        assert len(old) == 10
+        assert len(new) == 20
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """Test LRU eviction once the cache is full."""
+        cache = JobViewCache(max_entries=2)
+        jobs = _jobs(10)
+
+        cache.order(1, jobs, "Name", ())
+        cache.order(1, jobs, "Status", ())
+        cache.order(1, jobs, "Name", ())  # refresh Name
+        cache.order(1, jobs, "Last Build", ())  # evicts Status
+        cache.order(1, jobs, "Name", ())
+        cache.order(1, jobs, "Status", ())
+
+        assert cache.hits == 2
+        assert cache.misses == 4
+
+    def test_search_composes_with_filter_and_sort(self) -> None:
+        """Test that search results are filtered and sorted like the list."""
+        cache = JobViewCache()
+        jobs = _jobs(30)
+
+        order = cache.order(1, jobs, "Last Build", ["failure"], "job-01")
+
+        assert [jobs[i].name for i in order] == [
+            "job-019",
+            "job-016",
+            "job-013",
+            "job-010",
+        ]
+
+    def test_relevance_keeps_search_order(self) -> None:
+        """Test that Relevance orders by match quality."""
+        cache = JobViewCache()
+        jobs = _jobs(30)
+
+        order = cache.order(1, jobs, "Relevance", (), "job-010")
+
+        assert jobs[order[0]].name == "job-010"
+
+    def test_search_index_is_kept_per_version(self) -> None:
+        """Test that searches on one snapshot reuse its index."""
+        cache = JobViewCache()
+        jobs = _jobs(30)
+
+        cache.order(1, jobs, "Name", (), "job")
+        index = cache._search_indexes[1]
+        cache.order(1, jobs, "Status", (), "job-01")
+
+        assert list(cache._search_indexes) == [1]
+        assert cache._search_indexes[1] is index
+
+    def test_concurrent_misses_build_once(self, monkeypatch) -> None:
+        """Test that sessions missing on the same view share one build."""
+        cache = JobViewCache()
+        jobs = _jobs(30)
+        started = threading.Event()
+        release = threading.Event()
+        builds = []
+
+        def slow_build(built_jobs):
+            builds.append(built_jobs)
+            if built_jobs is jobs:
+                started.set()
+                release.wait(5)
+            return build_sort_keys(built_jobs)
+
+        monkeypatch.setattr("services.job_view.build_sort_keys", slow_build)
+        orders = []
+        threads = [
+            threading.Thread(target=lambda: orders.append(cache.order(1, jobs, "Name")))
+            for _ in range(3)
+        ]
+        threads[0].start()
+        assert started.wait(5)
+        # The build runs outside the lock: other snapshots are still served
+        assert cache.groups(2, _jobs(3), "Prefix").groups
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(orders) == 3
+        assert len(set(orders)) == 1
+        assert len(builds) == 2  # snapshot 1, and snapshot 2 for the grouping
+        assert cache._in_flight == {}
+
+    def test_failed_build_is_not_cached(self, monkeypatch) -> None:
+        """Test that a failed build is raised and retried on the next call."""
+        cache = JobViewCache()
+        jobs = _jobs(5)
+
+        def failing_build(_built_jobs):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr("services.job_view.build_sort_keys", failing_build)
+        with pytest.raises(KeyboardInterrupt):
+            cache.order(1, jobs, "Name")
+        monkeypatch.undo()
+
+        assert cache._in_flight == {}
+        assert len(cache.order(1, jobs, "Name")) == 5
+
+    def test_query_composes_with_status_filter(self) -> None:
+        """Test that the status filter and the query are combined."""
+        cache = JobViewCache()
+        jobs = _jobs(30)
+
+        order = cache.order(1, jobs, "Name", ["failure"], query="build>=25")
+
+        assert [jobs[i].name for i in order] == ["job-025", "job-028"]
+
+    def test_status_filter_is_a_query_term(self) -> None:
+        """Test that the multiselect and a typed status term share results."""
+        cache = JobViewCache()
+        jobs = _jobs(30)
+
+        selected = cache.order(1, jobs, "Name", ["failure", "building"])
+        typed = cache.order(1, jobs, "Name", query="status:building,failure")
+
+        assert selected == typed
+
+    def test_groupings_are_shared_per_snapshot(self) -> None:
+        """Test that a snapshot is grouped once per way of grouping."""
+        cache = JobViewCache()
+        jobs = _jobs(10)
+
+        grouping = cache.groups(1, jobs, "Prefix")
+
+        assert cache.groups(1, jobs, "Prefix") is grouping
+        assert cache.groups(2, jobs, "Prefix") is not grouping
+        assert sum(g.total for g in grouping.groups) == 10
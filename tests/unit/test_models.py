@@ -72,6 +72,87 @@ class TestJenkinsJob:
         assert job.is_building is True
         assert job.last_build_result is None
 
+    def test_jenkins_job_is_compact_and_immutable(self) -> None:
+        """Test that JenkinsJob has no instance dict and cannot be modified."""
+        job = JenkinsJob(
+            name="test-job",
+            url="https://jenkins.example.com/job/test-job/",
+            status=JobStatus.SUCCESS,
+            last_build_number=100,
+            last_build_result="SUCCESS",
+            last_build_timestamp=datetime(2026, 1, 8, 10, 0, 0),
+            last_build_duration_ms=30000,
+            is_building=False,
+        )
+
+        assert not hasattr(job, "__dict__")
+        with pytest.raises(AttributeError):
+            job.name = "other"  # type: ignore[misc]
+
+    def test_jenkins_job_timestamp_from_epoch_ms(self) -> None:
+        """Test creating a JenkinsJob from an epoch milliseconds timestamp."""
+        expected = datetime(2026, 1, 8, 10, 0, 0)
+        job = JenkinsJob(
+            name="test-job",
+            url="https://jenkins.example.com/job/test-job/",
+            status=JobStatus.SUCCESS,
+            last_build_number=100,
+            last_build_result="SUCCESS",
+            last_build_duration_ms=30000,
+            is_building=False,
+            last_build_timestamp_ms=int(expected.timestamp() * 1000),
+        )
+
+        assert job.last_build_timestamp == expected
+
+    def test_jenkins_job_interns_repeated_strings(self) -> None:
+        """Test that equal names from separate snapshots share one object."""
+        jobs = [
+            JenkinsJob(
+                name="".join(["test", "-job"]),
+                url="".join(["https://jenkins.example.com/job/", "test-job/"]),
+                status=JobStatus.SUCCESS,
+                last_build_number=100,
+                last_build_result="".join(["SUCC", "ESS"]),
+                last_build_timestamp=None,
+                last_build_duration_ms=None,
+                is_building=False,
+            )
+            for _ in range(2)
+        ]
+
+        assert jobs[0].name is jobs[1].name
+        assert jobs[0]._url_prefix is jobs[1]._url_prefix
+        assert jobs[0].last_build_result is jobs[1].last_build_result
+
+    def test_jenkins_job_url_shares_folder_prefix(self) -> None:
+        """Test that jobs of a folder store its URL prefix once."""
+        urls = [
+            "https://jenkins.example.com/job/team/job/api/",
+            "https://jenkins.example.com/job/team/job/web/",
+            "https://jenkins.example.com/job/team/job/other-name/",
+            "https://jenkins.example.com/",
+        ]
+        jobs = [
+            JenkinsJob(
+                name=name,
+                url="".join(url),
+                status=JobStatus.SUCCESS,
+                last_build_number=None,
+                last_build_result=None,
+            )
+            for name, url in zip(
+                ["team/api", "team/web", "team/renamed", "root"], urls, strict=True
+            )
+        ]
+
+        assert [job.url for job in jobs] == urls
+        assert jobs[0]._url_prefix is jobs[1]._url_prefix is jobs[2]._url_prefix
+        assert (jobs[0]._url_leaf, jobs[2]._url_leaf) == (None, "other-name/")
+        assert jobs[0] == JenkinsJob.from_fields(
+            "team/api", urls[0], JobStatus.SUCCESS, None, None, None, None, False
+        )
+
 
 class TestJobStatus:
     """Tests for JobStatus enum."""
@@ -0,0 +1,128 @@
+"""Unit tests for the shared snapshot store."""
+
+from unittest.mock import patch
+
+from models.job import JenkinsJob
+from services.snapshot import SnapshotStore, make_snapshot
+
+
+class TestMakeSnapshot:
+    """Tests for make_snapshot function."""
+
+    def test_versions_are_unique(self, mock_jobs_list: list[JenkinsJob]) -> None:
+        """Test that each snapshot gets a new version."""
+        first = make_snapshot(mock_jobs_list)
+        second = make_snapshot(mock_jobs_list)
+
+        assert second.version > first.version
+
+    def test_jobs_are_frozen_into_snapshot(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that the snapshot does not alias the caller's list."""
+        snapshot = make_snapshot(mock_jobs_list)
+        expected = list(mock_jobs_list)
+        mock_jobs_list.clear()
+
+        assert list(snapshot.jobs) == expected
+
+
+class TestSnapshotStore:
+    """Tests for SnapshotStore class."""
+
+    def test_publish_sets_current(self, mock_jobs_list: list[JenkinsJob]) -> None:
+        """Test that publishing makes the snapshot current."""
+        store = SnapshotStore()
+        snapshot = store.publish(mock_jobs_list)
+
+        assert store.current() is snapshot
+        assert store.get(snapshot.version) is snapshot
+
+    def test_sessions_share_one_snapshot(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that all sessions receive the same snapshot object."""
+        store = SnapshotStore()
+        snapshot = store.publish(mock_jobs_list)
+
+        held = [store.acquire(f"session-{i}", snapshot.version) for i in range(5)]
+
+        assert all(h is snapshot for h in held)
+
+    def test_unreferenced_version_is_freed_on_publish(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that an old version nobody holds is dropped."""
+        store = SnapshotStore()
+        old = store.publish(mock_jobs_list)
+        new = store.publish(mock_jobs_list[:-1])
+
+        assert store.live_versions() == [new.version]
+        assert store.get(old.version) is None
+
+    def test_referenced_version_survives_until_released(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that a held version is kept until its last holder moves on."""
+        store = SnapshotStore()
+        old = store.publish(mock_jobs_list)
+        store.acquire("a", old.version)
+        store.acquire("b", old.version)
+        new = store.publish(mock_jobs_list[:-1])
+
+        store.acquire("a", new.version)
+        assert old.version in store.live_versions()
+
+        store.release("b")
+        assert store.live_versions() == [new.version]
+
+    def test_reacquire_same_version_does_not_leak(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that repeated reruns on one version count as one reference."""
+        store = SnapshotStore()
+        old = store.publish(mock_jobs_list)
+        for _ in range(3):
+            store.acquire("a", old.version)
+        store.publish(mock_jobs_list[:-1])
+
+        store.release("a")
+
+        assert old.version not in store.live_versions()
+
+    def test_acquire_freed_version_returns_none(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test acquiring a version that no longer exists."""
+        store = SnapshotStore()
+        old = store.publish(mock_jobs_list)
+        store.publish(mock_jobs_list[:-1])
+
+        assert store.acquire("a", old.version) is None
+
+    def test_unchanged_job_list_keeps_version(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that republishing the same jobs returns the current snapshot."""
+        store = SnapshotStore()
+        assert store.last_poll() is None
+        first = store.publish(mock_jobs_list)
+        first_poll = store.last_poll()
+        second = store.publish(list(mock_jobs_list))
+
+        assert second is first
+        assert store.live_versions() == [first.version]
+        assert first_poll == first.created_at
+        assert store.last_poll() is not None and store.last_poll() >= first_poll
+
+    def test_idle_sessions_are_expired(self, mock_jobs_list: list[JenkinsJob]) -> None:
+        """Test that idle sessions stop pinning old versions."""
+        store = SnapshotStore(idle_timeout=10)
+        with patch("services.snapshot.time.monotonic", return_value=100.0):
+            old = store.publish(mock_jobs_list)
+            store.acquire("a", old.version)
+
+        with patch("services.snapshot.time.monotonic", return_value=200.0):
+            new = store.publish(mock_jobs_list[:-1])
+
+        assert store.live_versions() == [new.version]
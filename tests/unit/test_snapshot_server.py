@@ -0,0 +1,244 @@
+"""Unit tests for the read-only snapshot endpoint."""
+
+import gzip
+import json
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from datetime import datetime
+
+import pytest
+
+from models.job import JenkinsJob
+from services import snapshot_server
+from services.snapshot import JobSnapshot, make_snapshot
+from services.snapshot_server import SnapshotServer, issue_token, verify_token
+
+SECRET = b"test-secret"
+ALLOWED = "tv@company.com"
+
+
+class _Board:
+    """Fake snapshot source and whitelist counting their calls."""
+
+    def __init__(self, snapshot: JobSnapshot | None) -> None:
+        """Initialize with the snapshot to serve."""
+        self.snapshot = snapshot
+        self.polled_at: datetime | None = None
+        self.whitelist_checks = 0
+        self.wallboards = 0
+
+    def is_allowed(self, email: str) -> bool:
+        """Allow only ALLOWED."""
+        self.whitelist_checks += 1
+        return email == ALLOWED
+
+    def wallboard(self, snapshot: JobSnapshot, now_ms: int) -> str:
+        """Render a stand-in wallboard."""
+        self.wallboards += 1
+        return f'<div class="wallboard" data-now="{now_ms}">{len(snapshot.jobs)}</div>'
+
+    def server(self) -> SnapshotServer:
+        """Build a server reading this board."""
+        return SnapshotServer(
+            fetch=lambda: self.snapshot,
+            is_allowed=self.is_allowed,
+            secret=SECRET,
+            render_wallboard=self.wallboard,
+            last_poll=lambda: self.polled_at,
+        )
+
+
+@pytest.fixture
+def board(mock_jobs_list: list[JenkinsJob]) -> _Board:
+    """Board holding a snapshot of the mock jobs."""
+    return _Board(make_snapshot(mock_jobs_list))
+
+
+def _auth(email: str = ALLOWED) -> dict[str, str]:
+    """Headers carrying a token for an email."""
+    return {"Authorization": f"Bearer {issue_token(email, SECRET)}"}
+
+
+class TestTokens:
+    """Tests for endpoint tokens."""
+
+    def test_round_trip(self) -> None:
+        """Test that a token verifies to its email."""
+        assert verify_token(issue_token("TV@company.com", SECRET), SECRET) == ALLOWED
+
+    @pytest.mark.parametrize(
+        "token",
+        ["", "abc", "abc.def", "dHZAY29tcGFueS5jb20.0", "dHZAY29tcGFueS5jb20.é", "é.0"],
+    )
+    def test_invalid_tokens(self, token: str) -> None:
+        """Test that malformed or forged tokens are rejected."""
+        assert verify_token(token, SECRET) is None
+
+    def test_other_secret(self) -> None:
+        """Test that a token signed with another secret is rejected."""
+        assert verify_token(issue_token(ALLOWED, b"other"), SECRET) is None
+
+
+class TestSnapshotServer:
+    """Tests for answering requests."""
+
+    def test_json(self, board: _Board, mock_jobs_list: list[JenkinsJob]) -> None:
+        """Test the JSON job list and statistics."""
+        status, headers, body = board.server().handle("/api/jobs", _auth())
+
+        assert status == 200
+        assert headers["Content-Type"] == "application/json"
+        data = json.loads(body)
+        assert data["version"] == board.snapshot.version
+        assert data["statistics"]["total"] == len(mock_jobs_list)
+        assert [j["name"] for j in data["jobs"]] == [j.name for j in mock_jobs_list]
+
+    def test_wallboard_page(self, board: _Board) -> None:
+        """Test the auto-refreshing HTML page."""
+        server = board.server()
+
+        status, headers, body = server.handle("/wallboard?token=x", _auth())
+        server.handle("/wallboard", _auth())
+
+        assert status == 200
+        assert headers["Content-Type"].startswith("text/html")
+        assert b'http-equiv="refresh"' in body
+        assert b'class="wallboard"' in body
+        assert board.wallboards == 1
+
+    def test_wallboard_follows_polls_and_the_clock(
+        self, board: _Board, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an unchanged snapshot's page still shows time moving on."""
+        now = [1_704_067_200.0]
+        monkeypatch.setattr(snapshot_server.time, "time", lambda: now[0])
+        server = board.server()
+        board.polled_at = datetime(2026, 1, 8, 10, 30, 0)
+
+        _, headers, body = server.handle("/wallboard", _auth())
+        assert b"updated 10:30:00" in body
+        assert f'data-now="{int(now[0] * 1000)}"'.encode() in body
+
+        board.polled_at = datetime(2026, 1, 8, 10, 30, 30)
+        status, _, body = server.handle(
+            "/wallboard", {**_auth(), "If-None-Match": headers["ETag"]}
+        )
+        assert status == 200
+        assert b"updated 10:30:30" in body
+
+        now[0] += 60
+        _, later_headers, body = server.handle("/wallboard", _auth())
+        assert f'data-now="{int(now[0] * 1000)}"'.encode() in body
+        assert later_headers["ETag"] != headers["ETag"]
+        assert board.wallboards == 3
+
+    def test_token_query_parameter(self, board: _Board) -> None:
+        """Test that clients that cannot set headers pass the token in the URL."""
+        token = issue_token(ALLOWED, SECRET)
+
+        status, _, _ = board.server().handle(f"/wallboard?token={token}", {})
+
+        assert status == 200
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({}, 401),
+            ({"Authorization": "Bearer forged.token"}, 401),
+            ({"Authorization": "Bearer forgéd.tökén"}, 401),
+            (_auth("someone@company.com"), 403),
+        ],
+    )
+    def test_unauthorized(
+        self, board: _Board, headers: dict[str, str], expected: int
+    ) -> None:
+        """Test that requests without a whitelisted token are refused."""
+        status, _, body = board.server().handle("/api/jobs", headers)
+
+        assert status == expected
+        assert "error" in json.loads(body)
+
+    def test_whitelist_decisions_are_cached(self, board: _Board) -> None:
+        """Test that polling clients do not check the whitelist every time."""
+        server = board.server()
+        for _ in range(5):
+            server.handle("/api/jobs", _auth())
+
+        assert board.whitelist_checks == 1
+
+    def test_not_modified(
+        self, board: _Board, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test conditional requests against the ETag."""
+        server = board.server()
+        _, headers, _ = server.handle("/api/jobs", _auth())
+
+        status, _, body = server.handle(
+            "/api/jobs", {**_auth(), "If-None-Match": headers["ETag"]}
+        )
+        assert status == 304
+        assert body == b""
+
+        board.snapshot = make_snapshot(mock_jobs_list[:1])
+        status, _, _ = server.handle(
+            "/api/jobs", {**_auth(), "If-None-Match": headers["ETag"]}
+        )
+        assert status == 200
+
+    def test_gzip(self, board: _Board) -> None:
+        """Test compressed responses and their separate ETag."""
+        server = board.server()
+        _, plain_headers, plain = server.handle("/api/jobs", _auth())
+
+        status, headers, body = server.handle(
+            "/api/jobs", {**_auth(), "Accept-Encoding": "gzip, deflate"}
+        )
+
+        assert status == 200
+        assert headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(body) == plain
+        assert headers["ETag"] != plain_headers["ETag"]
+
+    def test_no_snapshot_and_unknown_path(self) -> None:
+        """Test responses before the first poll and for unknown paths."""
+        server = _Board(None).server()
+
+        assert server.handle("/api/jobs", _auth())[0] == 503
+        assert server.handle("/admin", _auth())[0] == 404
+
+
+class TestSnapshotServerHttp:
+    """Tests for serving over HTTP."""
+
+    @pytest.fixture
+    def url(self, board: _Board) -> Iterator[str]:
+        """Base URL of a running server."""
+        server = board.server()
+        host, port = server.serve("127.0.0.1", 0)
+        yield f"http://{host}:{port}"
+        server.close()
+
+    def test_listens_on_loopback_by_default(self, board: _Board) -> None:
+        """Test that the endpoint is not exposed beyond the host unless asked."""
+        server = board.server()
+        try:
+            host, _ = server.serve()
+        finally:
+            server.close()
+
+        assert host == "127.0.0.1"
+
+    def test_get(self, url: str) -> None:
+        """Test a request over a socket."""
+        request = urllib.request.Request(f"{url}/api/jobs", headers=_auth())
+        with urllib.request.urlopen(request, timeout=5) as response:
+            assert response.status == 200
+            assert json.loads(response.read())["jobs"]
+
+    def test_unauthorized(self, url: str) -> None:
+        """Test that errors are sent with their status code."""
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"{url}/api/jobs", timeout=5)
+
+        assert error.value.code == 401
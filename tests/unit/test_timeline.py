@@ -0,0 +1,152 @@
+"""Unit tests for the snapshot timeline."""
+
+import tempfile
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from models.job import JenkinsJob, JobStatus
+from services.timeline import SnapshotTimeline
+
+# 2026-01-08 10:00:00 UTC
+BASE_TS = 1767866400
+
+
+def at(ts: int) -> datetime:
+    """Convert epoch seconds to a local datetime."""
+    return datetime.fromtimestamp(ts)
+
+
+@pytest.fixture
+def timeline() -> Iterator[SnapshotTimeline]:
+    """Create an in-memory timeline with a short keyframe interval."""
+    store = SnapshotTimeline(":memory:", keyframe_interval=3)
+    yield store
+    store.close()
+
+
+def with_status(job: JenkinsJob, status: JobStatus) -> JenkinsJob:
+    """Return a copy of a job with another status."""
+    return JenkinsJob(
+        name=job.name,
+        url=job.url,
+        status=status,
+        last_build_number=job.last_build_number,
+        last_build_result=job.last_build_result,
+        last_build_timestamp=job.last_build_timestamp,
+        last_build_duration_ms=job.last_build_duration_ms,
+        is_building=job.is_building,
+    )
+
+
+class TestSnapshotTimeline:
+    """Tests for SnapshotTimeline class."""
+
+    def test_empty_timeline(self, timeline: SnapshotTimeline) -> None:
+        """Test that an empty timeline has no bounds or snapshots."""
+        assert timeline.bounds() is None
+        assert timeline.snapshot_at(at(BASE_TS)) is None
+
+    def test_reconstructs_each_recorded_state(
+        self, timeline: SnapshotTimeline, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test replaying states across keyframes and deltas."""
+        states = []
+        jobs = list(mock_jobs_list)
+        for i in range(8):
+            jobs[i % 3] = with_status(
+                jobs[i % 3], JobStatus.FAILURE if i % 2 else JobStatus.SUCCESS
+            )
+            states.append(list(jobs))
+            timeline.record(jobs, BASE_TS + i * 30)
+
+        for i, expected in enumerate(states):
+            snapshot = timeline.snapshot_at(at(BASE_TS + i * 30 + 10))
+            assert snapshot is not None
+            assert list(snapshot.jobs) == expected
+
+    def test_removed_jobs_disappear(
+        self, timeline: SnapshotTimeline, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that a job deleted in Jenkins is gone after its delta."""
+        timeline.record(mock_jobs_list, BASE_TS)
+        timeline.record(mock_jobs_list[:2], BASE_TS + 30)
+
+        before = timeline.snapshot_at(at(BASE_TS))
+        after = timeline.snapshot_at(at(BASE_TS + 30))
+
+        assert before is not None and len(before.jobs) == 3
+        assert after is not None and list(after.jobs) == mock_jobs_list[:2]
+
+    def test_unchanged_polls_are_not_stored(
+        self, timeline: SnapshotTimeline, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that identical polls add no frames."""
+        timeline.record(mock_jobs_list, BASE_TS)
+        timeline.record(mock_jobs_list, BASE_TS + 30)
+
+        assert timeline.bounds() == (at(BASE_TS), at(BASE_TS))
+
+    def test_snapshot_reports_frame_time(
+        self, timeline: SnapshotTimeline, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that a reconstruction carries the time of its frame."""
+        timeline.record(mock_jobs_list, BASE_TS)
+
+        snapshot = timeline.snapshot_at(at(BASE_TS + 100))
+
+        assert snapshot is not None
+        assert snapshot.created_at == at(BASE_TS)
+
+    def test_deltas_continue_after_reopen(
+        self, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that a reopened timeline keeps recording deltas."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "timeline.db"
+            store = SnapshotTimeline(path)
+            store.record(mock_jobs_list, BASE_TS)
+            store.close()
+
+            reopened = SnapshotTimeline(path)
+            changed = [with_status(mock_jobs_list[0], JobStatus.FAILURE)]
+            reopened.record(changed + mock_jobs_list[1:], BASE_TS + 30)
+
+            snapshot = reopened.snapshot_at(at(BASE_TS + 30))
+            assert snapshot is not None
+            assert snapshot.jobs[0].status == JobStatus.FAILURE
+            assert list(snapshot.jobs[1:]) == mock_jobs_list[1:]
+            reopened.close()
+
+    def test_same_second_poll_keeps_keyframe(
+        self, timeline: SnapshotTimeline, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that a second poll in a keyframe's second keeps the keyframe."""
+        timeline.record(mock_jobs_list, BASE_TS)
+        failed = [with_status(mock_jobs_list[0], JobStatus.FAILURE)]
+        timeline.record(failed + mock_jobs_list[1:], BASE_TS)
+        timeline.record(mock_jobs_list[1:], BASE_TS + 30)
+
+        at_key = timeline.snapshot_at(at(BASE_TS))
+        later = timeline.snapshot_at(at(BASE_TS + 30))
+
+        assert at_key is not None
+        assert list(at_key.jobs) == failed + mock_jobs_list[1:]
+        assert later is not None and list(later.jobs) == mock_jobs_list[1:]
+
+    def test_same_second_deltas_are_merged(
+        self, timeline: SnapshotTimeline, mock_jobs_list: list[JenkinsJob]
+    ) -> None:
+        """Test that two polls in one second store their combined change."""
+        timeline.record(mock_jobs_list, BASE_TS)
+        first = [with_status(mock_jobs_list[0], JobStatus.FAILURE)]
+        timeline.record(first + mock_jobs_list[1:2], BASE_TS + 30)
+        second = [with_status(mock_jobs_list[1], JobStatus.SUCCESS)]
+        timeline.record(first + second, BASE_TS + 30)
+
+        snapshot = timeline.snapshot_at(at(BASE_TS + 30))
+
+        assert snapshot is not None
+        assert list(snapshot.jobs) == first + second
@@ -0,0 +1,580 @@
+"""Unit tests for the whitelist service."""
+
+import json
+import sqlite3
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from models.whitelist import Whitelist
+from services.whitelist import (
+    SqliteWhitelistService,
+    WhitelistService,
+    create_whitelist_service,
+)
+
+
+def _write(path: Path, *emails: str) -> None:
+    """Write a whitelist file with active users."""
+    path.write_text(
+        json.dumps(
+            {
+                "version": "1.0",
+                "last_updated": "2026-01-08T10:00:00Z",
+                "updated_by": "system",
+                "users": [
+                    {
+                        "email": email,
+                        "name": email.split("@")[0],
+                        "added_at": "2026-01-08T10:00:00Z",
+                        "added_by": "admin@company.com",
+                    }
+                    for email in emails
+                ],
+                "admins": [
+                    {
+                        "email": "admin@company.com",
+                        "name": "Admin",
+                        "added_at": "2026-01-08T10:00:00Z",
+                        "added_by": "system",
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def whitelist_path(tmp_path: Path) -> Path:
+    """Path of a whitelist file holding one user."""
+    path = tmp_path / "allowed_users.json"
+    _write(path, "pm@company.com")
+    return path
+
+
+@pytest.fixture
+def reads(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every parse of a whitelist file."""
+    calls: list[Path] = []
+    original = WhitelistService._read
+
+    def counting_read(self: WhitelistService) -> Whitelist:
+        calls.append(self._path)
+        return original(self)
+
+    monkeypatch.setattr(WhitelistService, "_read", counting_read)
+    return calls
+
+
+class TestWhitelistCache:
+    """Tests for the in-process whitelist cache."""
+
+    def test_checks_are_served_from_cache(
+        self, whitelist_path: Path, reads: list[Path]
+    ) -> None:
+        """Test that repeated checks parse the file once."""
+        service = WhitelistService(whitelist_path, check_interval=0)
+
+        for _ in range(10):
+            assert service.is_user_allowed("PM@company.com")
+            assert service.is_admin("admin@company.com")
+
+        assert len(reads) == 1
+
+    def test_cache_is_shared_between_instances(
+        self, whitelist_path: Path, reads: list[Path]
+    ) -> None:
+        """Test that services on the same file share one parse."""
+        WhitelistService(whitelist_path).list_users()
+        WhitelistService(whitelist_path).list_admins()
+
+        assert len(reads) == 1
+
+    def test_outside_changes_are_picked_up(self, whitelist_path: Path) -> None:
+        """Test that edits to the file invalidate the cache."""
+        service = WhitelistService(whitelist_path, check_interval=0)
+        assert not service.is_user_allowed("new@company.com")
+
+        _write(whitelist_path, "pm@company.com", "new@company.com")
+
+        assert service.is_user_allowed("new@company.com")
+
+    def test_file_is_checked_at_most_once_per_interval(
+        self, whitelist_path: Path
+    ) -> None:
+        """Test that the file is not checked again within the interval."""
+        service = WhitelistService(whitelist_path, check_interval=60)
+        assert not service.is_user_allowed("new@company.com")
+
+        _write(whitelist_path, "pm@company.com", "new@company.com")
+
+        assert not service.is_user_allowed("new@company.com")
+
+    def test_writes_update_cache_immediately(
+        self, whitelist_path: Path, reads: list[Path]
+    ) -> None:
+        """Test that changes made through the service are seen at once."""
+        reader = WhitelistService(whitelist_path, check_interval=60)
+        writer = WhitelistService(whitelist_path, check_interval=60)
+        assert reader.is_user_allowed("pm@company.com")
+
+        assert writer.add_user("new@company.com", "New", "admin@company.com")
+        assert writer.remove_user("pm@company.com", "admin@company.com")
+
+        assert reader.is_user_allowed("new@company.com")
+        assert not reader.is_user_allowed("pm@company.com")
+        assert len(reads) == 1
+
+    def test_failed_update_leaves_cache_intact(
+        self, whitelist_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that readers never see an unsaved change."""
+        service = WhitelistService(whitelist_path, check_interval=60)
+
+        def failing_save(*_args: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(WhitelistService, "_save", failing_save)
+        with pytest.raises(OSError):
+            service.remove_user("pm@company.com", "admin@company.com")
+
+        assert service.is_user_allowed("pm@company.com")
+
+    def test_edit_copies_only_the_changed_entry(self, tmp_path: Path) -> None:
+        """Test that an edit shares unchanged entries with the cached whitelist."""
+        path = tmp_path / "allowed_users.json"
+        _write(path, "pm@company.com", "dev@company.com")
+        service = WhitelistService(path, check_interval=60)
+        before = {u.email: u for u in service.list_users()}
+
+        assert service.remove_user("pm@company.com", "admin@company.com")
+
+        after = {u.email: u for u in service.list_users(include_inactive=True)}
+        assert after["dev@company.com"] is before["dev@company.com"]
+        assert after["pm@company.com"] is not before["pm@company.com"]
+        assert before["pm@company.com"].active
+        assert not after["pm@company.com"].active
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test that a missing file is an empty whitelist until created."""
+        path = tmp_path / "missing.json"
+        service = WhitelistService(path, check_interval=0)
+        assert service.list_users() == []
+
+        assert service.add_user("pm@company.com", "PM", "admin@company.com")
+
+        assert path.exists()
+        assert WhitelistService(path).is_user_allowed("pm@company.com")
+
+
+class TestWhitelistVersion:
+    """Tests for whitelist versions."""
+
+    def test_json_version(self, whitelist_path: Path) -> None:
+        """Test that the version changes on saves and outside edits only."""
+        service = WhitelistService(whitelist_path, check_interval=0)
+        version = service.version()
+
+        assert service.version() == version
+        service.add_user("new@company.com", "New", "admin@company.com")
+        saved = service.version()
+        assert saved != version
+
+        _write(whitelist_path, "pm@company.com", "other@company.com")
+        assert service.version() != saved
+
+    def test_sqlite_version(self, tmp_path: Path) -> None:
+        """Test that the version changes on commits from any connection."""
+        service = SqliteWhitelistService(tmp_path / "allowed_users.db")
+        other = SqliteWhitelistService(tmp_path / "allowed_users.db")
+        try:
+            version = service.version()
+            service.add_user("a@company.com", "A", "admin@company.com")
+            own = service.version()
+            other.add_user("b@company.com", "B", "admin@company.com")
+
+            assert version != own != service.version()
+        finally:
+            other.close()
+            service.close()
+
+
+class TestWhitelistCompaction:
+    """Tests for archiving inactive entries."""
+
+    def _deactivate(self, path: Path, days_ago: int) -> None:
+        """Mark the first user inactive since some days ago."""
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["users"][0]["active"] = False
+        data["users"][0]["deactivated_at"] = (
+            datetime.now() - timedelta(days=days_ago)
+        ).isoformat()
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    def test_compact_moves_old_inactive_entries(self, whitelist_path: Path) -> None:
+        """Test that only entries inactive past the retention are archived."""
+        _write(whitelist_path, "pm@company.com", "dev@company.com")
+        self._deactivate(whitelist_path, days_ago=100)
+        service = WhitelistService(whitelist_path, check_interval=0)
+        archive = whitelist_path.with_name("allowed_users.archive.json")
+
+        assert service.compact(retention_days=90) == 1
+        assert service.compact(retention_days=90) == 0
+
+        emails = [u.email for u in service.list_users(include_inactive=True)]
+        assert emails == ["dev@company.com"]
+        archived = json.loads(archive.read_text(encoding="utf-8"))["users"]
+        assert [u["email"] for u in archived] == ["pm@company.com"]
+
+    def test_recently_deactivated_entries_stay(self, whitelist_path: Path) -> None:
+        """Test that entries inside the retention window are kept."""
+        self._deactivate(whitelist_path, days_ago=10)
+        service = WhitelistService(whitelist_path, check_interval=0)
+
+        assert service.compact(retention_days=90) == 0
+        assert len(service.list_users(include_inactive=True)) == 1
+
+    def test_add_user_restores_archived_entry(self, whitelist_path: Path) -> None:
+        """Test that adding an archived user reactivates and unarchives them."""
+        self._deactivate(whitelist_path, days_ago=100)
+        service = WhitelistService(whitelist_path, check_interval=0)
+        service.compact(retention_days=90)
+
+        assert service.add_user("PM@company.com", "Ignored", "admin@company.com")
+
+        assert service.is_user_allowed("pm@company.com")
+        assert [u.name for u in service.list_users()] == ["pm"]
+        archive = WhitelistService(
+            whitelist_path.with_name("allowed_users.archive.json"), check_interval=0
+        )
+        assert archive.list_users(include_inactive=True) == []
+
+    def test_add_users_reports_archived_as_reactivated(
+        self, whitelist_path: Path
+    ) -> None:
+        """Test that bulk adds also find archived users."""
+        self._deactivate(whitelist_path, days_ago=100)
+        service = WhitelistService(whitelist_path, check_interval=0)
+        service.compact(retention_days=90)
+
+        report = service.add_users(
+            [("pm@company.com", "PM"), ("new@company.com", "New")],
+            "admin@company.com",
+        )
+
+        assert report.reactivated == ["pm@company.com"]
+        assert report.added == ["new@company.com"]
+
+    def test_remove_records_deactivation_time(self, whitelist_path: Path) -> None:
+        """Test that deactivation time survives a save and reload."""
+        service = WhitelistService(whitelist_path, check_interval=0)
+        service.remove_user("pm@company.com", "admin@company.com")
+
+        (user,) = WhitelistService(whitelist_path).list_users(include_inactive=True)
+        assert user.deactivated_at is not None
+
+
+class TestWhitelistGroups:
+    """Tests for directory group rules."""
+
+    def test_json_group_rules(self, whitelist_path: Path) -> None:
+        """Test adding, removing and reloading group rules."""
+        service = WhitelistService(whitelist_path, check_interval=0)
+
+        assert service.add_group(" Engineering ", "admin@company.com")
+        assert not service.add_group("engineering", "admin@company.com")
+        assert WhitelistService(whitelist_path).allowed_groups() == {"engineering"}
+
+        assert service.remove_group("ENGINEERING", "admin@company.com")
+        assert not service.remove_group("engineering", "admin@company.com")
+        assert service.allowed_groups() == frozenset()
+        assert service.add_group("engineering", "admin@company.com")
+        assert [g.name for g in service.list_groups(include_inactive=True)] == [
+            "Engineering"
+        ]
+
+    def test_sqlite_group_rules(
+        self, sqlite_service: SqliteWhitelistService, whitelist_path: Path
+    ) -> None:
+        """Test group rules on SQLite, including the JSON import."""
+        WhitelistService(whitelist_path).add_group("product", "admin@company.com")
+        sqlite_service.import_json(whitelist_path)
+
+        assert sqlite_service.allowed_groups() == {"product"}
+        assert sqlite_service.add_group("Engineering", "admin@company.com")
+        assert not sqlite_service.add_group("engineering", "admin@company.com")
+        assert sqlite_service.remove_group("product", "admin@company.com")
+        assert [g.name for g in sqlite_service.list_groups()] == ["Engineering"]
+
+
+class TestWhitelistLookups:
+    """Tests for email-indexed lookups."""
+
+    def test_lookups_ignore_case(self, whitelist_path: Path) -> None:
+        """Test that emails match case-insensitively."""
+        service = WhitelistService(whitelist_path)
+
+        assert service.is_user_allowed("Pm@Company.COM")
+        assert service.is_admin("ADMIN@company.com")
+        assert not service.add_user("PM@company.com", "PM", "admin@company.com")
+
+    def test_admins_are_allowed(self, whitelist_path: Path) -> None:
+        """Test that admins pass the user check without a user entry."""
+        service = WhitelistService(whitelist_path)
+
+        assert service.is_user_allowed("admin@company.com")
+        assert not service.is_admin("pm@company.com")
+
+    def test_active_duplicate_wins(self, whitelist_path: Path) -> None:
+        """Test that an active entry is found even after an inactive duplicate."""
+        data = json.loads(whitelist_path.read_text(encoding="utf-8"))
+        active = dict(data["users"][0], email="PM@company.com")
+        data["users"] = [dict(data["users"][0], active=False), active]
+        whitelist_path.write_text(json.dumps(data), encoding="utf-8")
+        service = WhitelistService(whitelist_path, check_interval=0)
+
+        assert service.is_user_allowed("pm@company.com")
+        assert service.remove_user("pm@company.com", "admin@company.com")
+        assert not service.is_user_allowed("pm@company.com")
+        assert service.add_user("pm@company.com", "PM", "admin@company.com")
+        assert len(service.list_users(include_inactive=True)) == 2
+
+
+@pytest.fixture
+def sqlite_service(
+    tmp_path: Path, whitelist_path: Path
+) -> Iterator[SqliteWhitelistService]:
+    """SQLite whitelist imported from the one-user whitelist file."""
+    service = SqliteWhitelistService(tmp_path / "allowed_users.db")
+    service.import_json(whitelist_path)
+    yield service
+    service.close()
+
+
+class TestBulkAdd:
+    """Tests for adding many users in one write."""
+
+    def test_report(
+        self, whitelist_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that entries are added, reactivated or skipped and saved once."""
+        service = WhitelistService(whitelist_path, check_interval=0)
+        service.add_user("old@company.com", "Old", "admin@company.com")
+        service.remove_user("old@company.com", "admin@company.com")
+        saves: list[Whitelist] = []
+        original = WhitelistService._save
+
+        def counting_save(self: WhitelistService, whitelist: Whitelist) -> None:
+            saves.append(whitelist)
+            original(self, whitelist)
+
+        monkeypatch.setattr(WhitelistService, "_save", counting_save)
+
+        report = service.add_users(
+            [
+                ("new@company.com", "New"),
+                ("NEW@company.com", "New again"),
+                ("pm@company.com", "PM"),
+                ("old@company.com", "Old"),
+            ],
+            "admin@company.com",
+        )
+
+        assert report.added == ["new@company.com"]
+        assert report.reactivated == ["old@company.com"]
+        assert report.skipped == ["NEW@company.com", "pm@company.com"]
+        assert len(saves) == 1
+        assert WhitelistService(whitelist_path).is_user_allowed("old@company.com")
+
+    def test_remove_users(self, whitelist_path: Path) -> None:
+        """Test that many users are deactivated in one call."""
+        service = WhitelistService(whitelist_path, check_interval=0)
+        service.add_user("new@company.com", "New", "admin@company.com")
+
+        removed = service.remove_users(
+            ["PM@company.com", "new@company.com", "unknown@company.com"],
+            "admin@company.com",
+        )
+
+        assert removed == ["PM@company.com", "new@company.com"]
+        assert service.list_users() == []
+        assert service.remove_users(["pm@company.com"], "admin@company.com") == []
+
+    def test_nothing_to_add(self, whitelist_path: Path) -> None:
+        """Test that an import changing nothing does not rewrite the file."""
+        before = whitelist_path.stat().st_mtime_ns
+        service = WhitelistService(whitelist_path)
+
+        report = service.add_users([("pm@company.com", "PM")], "admin@company.com")
+
+        assert not report.changed
+        assert whitelist_path.stat().st_mtime_ns == before
+
+
+class TestSqliteWhitelistService:
+    """Tests for the SQLite whitelist backend."""
+
+    def test_import_json(self, sqlite_service: SqliteWhitelistService) -> None:
+        """Test that the JSON entries are imported once."""
+        assert [u.email for u in sqlite_service.list_users()] == ["pm@company.com"]
+        assert sqlite_service.is_admin("Admin@Company.com")
+        assert sqlite_service.is_user_allowed("admin@company.com")
+        assert not sqlite_service.is_empty()
+
+    def test_import_keeps_existing_entries(
+        self, sqlite_service: SqliteWhitelistService, whitelist_path: Path
+    ) -> None:
+        """Test that importing again does not duplicate or revive entries."""
+        sqlite_service.remove_user("pm@company.com", "admin@company.com")
+
+        assert sqlite_service.import_json(whitelist_path) == 0
+        assert not sqlite_service.is_user_allowed("pm@company.com")
+        assert len(sqlite_service.list_users(include_inactive=True)) == 1
+
+    def test_add_remove_and_reactivate(
+        self, sqlite_service: SqliteWhitelistService
+    ) -> None:
+        """Test single-row edits and their return values."""
+        assert sqlite_service.add_user("New@company.com", "New", "admin@company.com")
+        assert not sqlite_service.add_user(
+            "new@company.com", "New", "admin@company.com"
+        )
+        assert sqlite_service.is_user_allowed("new@company.com")
+
+        assert sqlite_service.remove_user("NEW@company.com", "admin@company.com")
+        assert not sqlite_service.remove_user("new@company.com", "admin@company.com")
+        assert not sqlite_service.is_user_allowed("new@company.com")
+
+        assert sqlite_service.add_user("new@company.com", "New", "admin@company.com")
+        emails = [u.email for u in sqlite_service.list_users(include_inactive=True)]
+        assert emails == ["pm@company.com", "New@company.com"]
+
+    def test_deactivation_time(self, sqlite_service: SqliteWhitelistService) -> None:
+        """Test that removal records when an entry was deactivated."""
+        assert sqlite_service.remove_user("pm@company.com", "admin@company.com")
+        (user,) = sqlite_service.list_users(include_inactive=True)
+        assert user.deactivated_at is not None
+
+        assert sqlite_service.add_user("pm@company.com", "PM", "admin@company.com")
+        (user,) = sqlite_service.list_users()
+        assert user.deactivated_at is None
+
+    def test_import_keeps_deactivation_time(
+        self, tmp_path: Path, whitelist_path: Path
+    ) -> None:
+        """Test that deactivation times survive a JSON import."""
+        json_service = WhitelistService(whitelist_path, check_interval=0)
+        json_service.remove_user("pm@company.com", "admin@company.com")
+        (expected,) = json_service.list_users(include_inactive=True)
+
+        service = SqliteWhitelistService(tmp_path / "allowed_users.db")
+        try:
+            service.import_json(whitelist_path)
+            (user,) = service.list_users(include_inactive=True)
+        finally:
+            service.close()
+
+        assert user.deactivated_at == expected.deactivated_at
+
+    def test_old_database_gains_deactivation_column(self, tmp_path: Path) -> None:
+        """Test that a database without deactivated_at is migrated on open."""
+        path = tmp_path / "allowed_users.db"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE whitelist (role TEXT NOT NULL, email_key TEXT NOT NULL, "
+            "email TEXT NOT NULL, name TEXT NOT NULL, added_at TEXT NOT NULL, "
+            "added_by TEXT NOT NULL, active INTEGER NOT NULL DEFAULT 1)"
+        )
+        conn.execute(
+            "INSERT INTO whitelist VALUES ('user', 'old@company.com', "
+            "'old@company.com', 'Old', '2026-01-08T10:00:00', 'system', 1)"
+        )
+        conn.commit()
+        conn.close()
+
+        service = SqliteWhitelistService(path)
+        try:
+            assert service.remove_user("old@company.com", "admin@company.com")
+            (user,) = service.list_users(include_inactive=True)
+        finally:
+            service.close()
+
+        assert user.deactivated_at is not None
+
+    def test_add_users(self, sqlite_service: SqliteWhitelistService) -> None:
+        """Test that bulk adds report the same way as the JSON backend."""
+        sqlite_service.add_user("old@company.com", "Old", "admin@company.com")
+        sqlite_service.remove_user("old@company.com", "admin@company.com")
+
+        report = sqlite_service.add_users(
+            [
+                ("new@company.com", "New"),
+                ("new@company.com", "New"),
+                ("PM@company.com", "PM"),
+                ("old@company.com", "Old"),
+            ],
+            "admin@company.com",
+        )
+
+        assert report.added == ["new@company.com"]
+        assert report.reactivated == ["old@company.com"]
+        assert report.skipped == ["new@company.com", "PM@company.com"]
+        assert sqlite_service.is_user_allowed("old@company.com")
+        assert sqlite_service.is_user_allowed("new@company.com")
+
+    def test_remove_users(self, sqlite_service: SqliteWhitelistService) -> None:
+        """Test that bulk removal reports only deactivated users."""
+        removed = sqlite_service.remove_users(
+            ["pm@company.com", "unknown@company.com"], "admin@company.com"
+        )
+
+        assert removed == ["pm@company.com"]
+        assert not sqlite_service.is_user_allowed("pm@company.com")
+
+    def test_concurrent_services_keep_every_edit(
+        self, sqlite_service: SqliteWhitelistService, tmp_path: Path
+    ) -> None:
+        """Test that two connections adding users do not overwrite each other."""
+        other = SqliteWhitelistService(tmp_path / "allowed_users.db")
+        try:
+            assert sqlite_service.add_user("a@company.com", "A", "admin@company.com")
+            assert other.add_user("b@company.com", "B", "admin@company.com")
+
+            for service in (sqlite_service, other):
+                assert service.is_user_allowed("a@company.com")
+                assert service.is_user_allowed("b@company.com")
+        finally:
+            other.close()
+
+
+class TestCreateWhitelistService:
+    """Tests for choosing the whitelist backend."""
+
+    def test_json_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the JSON backend is used when nothing is configured."""
+        monkeypatch.delenv("WHITELIST_BACKEND", raising=False)
+
+        assert isinstance(create_whitelist_service(), WhitelistService)
+
+    def test_sqlite_is_shared(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test that the SQLite backend is opened once per path."""
+        monkeypatch.setenv("WHITELIST_BACKEND", "sqlite")
+        monkeypatch.setenv("WHITELIST_DB_PATH", str(tmp_path / "shared.db"))
+
+        service = create_whitelist_service()
+
+        assert isinstance(service, SqliteWhitelistService)
+        assert create_whitelist_service() is service
+        service.close()
+
+    def test_unknown_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an unknown backend is rejected."""
+        monkeypatch.setenv("WHITELIST_BACKEND", "ldap")
+
+        with pytest.raises(ValueError, match="WHITELIST_BACKEND"):
+            create_whitelist_service()
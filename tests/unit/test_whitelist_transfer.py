@@ -0,0 +1,115 @@
+"""Unit tests for whitelist bulk import and export."""
+
+from datetime import datetime
+
+from models.whitelist import WhitelistEntry
+from services.mock_ldap import MockLDAPService
+from services.whitelist_transfer import (
+    export_csv,
+    export_json,
+    ldap_group_entries,
+    parse_csv,
+    parse_json,
+    parse_upload,
+)
+
+ENTRIES = [
+    WhitelistEntry(
+        email="a@company.com",
+        name="Chen, Alice",
+        added_at=datetime(2026, 1, 8, 10, 0),
+        added_by="admin@company.com",
+    ),
+    WhitelistEntry(
+        email="b@company.com",
+        name="Bob",
+        added_at=datetime(2026, 1, 9, 10, 0),
+        added_by="admin@company.com",
+        active=False,
+    ),
+]
+
+
+class TestParseCsv:
+    """Tests for CSV import parsing."""
+
+    def test_header_in_any_order(self) -> None:
+        """Test that header columns are found by name."""
+        parsed = parse_csv("Name,Email\nAlice,a@company.com\n\nBob,bob\n")
+
+        assert parsed.entries == [("a@company.com", "Alice")]
+        assert parsed.invalid == ["line 4: invalid email 'bob'"]
+
+    def test_without_header(self) -> None:
+        """Test headerless rows and names defaulting to the local part."""
+        parsed = parse_csv("a@company.com,Alice\nb@company.com\n")
+
+        assert parsed.entries == [("a@company.com", "Alice"), ("b@company.com", "b")]
+
+    def test_empty(self) -> None:
+        """Test that empty input has no entries."""
+        assert parse_csv("").entries == []
+
+
+class TestParseJson:
+    """Tests for JSON import parsing."""
+
+    def test_list_and_whitelist_document(self) -> None:
+        """Test both accepted layouts."""
+        text = '[{"email": "a@company.com", "name": "Alice"}, 3]'
+
+        parsed = parse_json(text)
+
+        assert parsed.entries == [("a@company.com", "Alice")]
+        assert parsed.invalid == ["entry 2: expected an object"]
+        assert parse_json('{"users": [{"email": "a@company.com"}]}').entries == [
+            ("a@company.com", "a")
+        ]
+
+    def test_invalid_json(self) -> None:
+        """Test that unparseable JSON is reported, not raised."""
+        parsed = parse_json("{")
+
+        assert parsed.entries == []
+        assert parsed.invalid[0].startswith("invalid JSON")
+
+    def test_upload_by_extension(self) -> None:
+        """Test that uploads are parsed by their file extension."""
+        assert parse_upload("users.JSON", b'[{"email": "a@company.com"}]').entries
+        assert parse_upload("users.csv", b"\xef\xbb\xbfemail\na@company.com").entries
+
+
+class TestExport:
+    """Tests for export."""
+
+    def test_csv_round_trip(self) -> None:
+        """Test that exported CSV imports back with quoting intact."""
+        text = export_csv(ENTRIES)
+
+        assert len(text.splitlines()) == 3
+        assert text.startswith("email,name,added_at,added_by,active\n")
+        assert parse_csv(text).entries == [
+            ("a@company.com", "Chen, Alice"),
+            ("b@company.com", "Bob"),
+        ]
+
+    def test_json_round_trip(self) -> None:
+        """Test that exported JSON is valid and imports back."""
+        text = export_json(ENTRIES)
+
+        assert parse_json(text).entries == [
+            ("a@company.com", "Chen, Alice"),
+            ("b@company.com", "Bob"),
+        ]
+        assert export_json([]) == "[]\n"
+
+
+class TestLdapGroupEntries:
+    """Tests for importing directory groups."""
+
+    def test_group_members(self) -> None:
+        """Test that group members become entries with display names."""
+        parsed = ldap_group_entries(MockLDAPService(), "Engineering")
+
+        assert ("alice@company.com", "Alice Chen") in parsed.entries
+        assert all(email != "bob@company.com" for email, _ in parsed.entries)
@@ -0,0 +1,70 @@
+"""Unit tests for searchable whitelist user views."""
+
+from datetime import datetime
+
+from models.whitelist import WhitelistEntry
+from services.whitelist_view import RELEVANCE, WhitelistUserView, WhitelistViewCache
+
+
+def _entry(email: str, name: str, day: int) -> WhitelistEntry:
+    """Build an active user added on a day of January 2026."""
+    return WhitelistEntry(
+        email=email,
+        name=name,
+        added_at=datetime(2026, 1, day),
+        added_by="admin@company.com",
+    )
+
+
+ENTRIES = [
+    _entry("carol@company.com", "Carol Lin", 3),
+    _entry("alice@company.com", "Alice Chen", 1),
+    _entry("bob@company.com", "Bob Wang", 2),
+    _entry("dave@company.com", "Dave Chen", 2),
+]
+
+
+class TestWhitelistUserView:
+    """Tests for WhitelistUserView."""
+
+    def test_sort_options(self) -> None:
+        """Test sorting by date, email and name."""
+        view = WhitelistUserView(ENTRIES)
+
+        assert view.order(sort_by="Newest") == (0, 2, 3, 1)
+        assert view.order(sort_by="Oldest") == (1, 2, 3, 0)
+        assert view.order(sort_by="Email") == (1, 2, 0, 3)
+        assert view.order(sort_by="Name") == (1, 2, 0, 3)
+
+    def test_search_email_and_name(self) -> None:
+        """Test that searches match either field and can be sorted."""
+        view = WhitelistUserView(ENTRIES)
+
+        assert set(view.order("chen")) == {1, 3}
+        assert view.order("chen", "Newest") == (3, 1)
+        assert view.order("BOB@", RELEVANCE) == (2,)
+
+    def test_orders_are_cached(self) -> None:
+        """Test that a repeated query returns the same ordering object."""
+        view = WhitelistUserView(ENTRIES)
+
+        assert view.order(" Chen ", "Email") is view.order("chen", "Email")
+
+
+class TestWhitelistViewCache:
+    """Tests for WhitelistViewCache."""
+
+    def test_built_once_per_version(self) -> None:
+        """Test that a version's user list is loaded once."""
+        cache = WhitelistViewCache()
+        loads = []
+
+        def load() -> list[WhitelistEntry]:
+            loads.append(1)
+            return ENTRIES
+
+        first = cache.get(1, load)
+
+        assert cache.get(1, load) is first
+        assert cache.get(2, load) is not first
+        assert len(loads) == 2